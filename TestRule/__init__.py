@@ -4,6 +4,7 @@ from cdisc_rules_engine.services.cache.in_memory_cache_service import (
     InMemoryCacheService,
 )
 from cdisc_rules_engine.services.cdisc_library_service import CDISCLibraryService
+from cdisc_rules_engine.models.validation_error_batch import ValidationErrorBatch
 from cdisc_rules_engine.services.cache.cache_populator_service import CachePopulator
 import json
 import os
@@ -83,7 +84,7 @@ def main(req: func.HttpRequest, context: func.Context) -> func.HttpResponse:
             datasets, define_xml, cache, standard, standard_version, codelists
         )
         result = tester.validate(rule)
-        result_json = json.dumps(result)
+        result_json = json.dumps(result, default=ValidationErrorBatch.serialize)
         return func.HttpResponse(result_json)
     except Exception as e:
         return handle_exception(e)
@@ -21,8 +21,17 @@ class ConfigService(ConfigInterface):
                 "CACHE_TYPE",
                 "REDIS_HOST_NAME",
                 "REDIS_ACCESS_KEY",
+                "REDIS_PORT",
+                "REDIS_SSL",
+                "REDIS_TASK_QUEUE",
+                "REDIS_RESULT_TIMEOUT",
+                "REDIS_CLAIM_TIMEOUT",
                 "CDISC_LIBRARY_API_KEY",
                 "DATA_SERVICE_TYPE",
+                "L1_CACHE_MAX_SIZE",
+                "PREFETCH_MEMORY_BUDGET",
+                "EVALUATION_CHUNK_SIZE",
+                "DATASET_JSON_VALIDATION",
             ]
 
         return cls._instance
@@ -1 +1,76 @@
+from typing import Set
+
 ALL_KEYWORD: str = "ALL"
+
+# Number of records of the parts of large datasets
+# record level rules are evaluated against.
+DEFAULT_EVALUATION_CHUNK_SIZE: int = 1_000_000
+
+# Operators that write into the target column of the evaluated dataset
+# instead of only adding new columns to it.
+TARGET_OVERWRITING_OPERATORS: Set[str] = {
+    "matches_regex",
+    "not_matches_regex",
+    "prefix_matches_regex",
+    "not_prefix_matches_regex",
+    "suffix_matches_regex",
+    "not_suffix_matches_regex",
+}
+
+# Rule type of rules checking the records of a dataset.
+RECORD_DATA_RULE_TYPE: str = "Record Data"
+
+# Check operators whose result for a record depends on other records.
+DATASET_CONTEXT_OPERATORS: Set[str] = {
+    "empty_within_except_last_row",
+    "non_empty_within_except_last_row",
+    "is_unique_set",
+    "is_not_unique_set",
+    "is_unique_relationship",
+    "is_not_unique_relationship",
+    "is_ordered_set",
+    "is_not_ordered_set",
+    "is_valid_reference",
+    "is_not_valid_reference",
+    "is_valid_relationship",
+    "is_not_valid_relationship",
+    "has_next_corresponding_record",
+    "does_not_have_next_corresponding_record",
+    "present_on_multiple_rows_within",
+    "not_present_on_multiple_rows_within",
+    "has_different_values",
+    "has_same_values",
+    "is_ordered_by",
+    "is_not_ordered_by",
+    "value_has_multiple_references",
+    "value_does_not_have_multiple_references",
+    "target_is_sorted_by",
+    "target_is_not_sorted_by",
+    "contains_all",
+    "not_contains_all",
+}
+
+# Check operators whose result for a record depends on other records
+# when the comparator is a column instead of literal values.
+COLUMN_COMPARATOR_CONTEXT_OPERATORS: Set[str] = {
+    "is_contained_by",
+    "is_not_contained_by",
+    "is_contained_by_case_insensitive",
+    "is_not_contained_by_case_insensitive",
+}
+
+# Operations whose result doesn't depend on the records of the dataset.
+RECORD_INDEPENDENT_OPERATIONS: Set[str] = {
+    "domain_is_custom",
+    "domain_label",
+    "expected_variables",
+    "get_codelist_attributes",
+    "get_column_order_from_dataset",
+    "get_column_order_from_library",
+    "get_model_column_order",
+    "permissible_variables",
+    "required_variables",
+    "variable_exists",
+    "variable_library_metadata",
+    "variable_names",
+}
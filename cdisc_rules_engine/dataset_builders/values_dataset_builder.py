@@ -15,7 +15,7 @@ class ValuesDatasetBuilder(BaseDatasetBuilder):
         """
         data_contents_df: pd.DataFrame = self.data_service.get_dataset(
             dataset_name=self.dataset_path
-        )
+        ).copy(deep=False)
         self.add_row_number(data_contents_df)
         values_df: pd.DataFrame = pd.melt(
             data_contents_df,
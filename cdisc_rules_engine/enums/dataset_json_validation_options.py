@@ -0,0 +1,7 @@
+from .base_enum import BaseEnum
+
+
+class DatasetJSONValidationOptions(BaseEnum):
+    FULL = "full"
+    SAMPLE = "sample"
+    NONE = "none"
@@ -10,3 +10,5 @@ class DefaultFilePaths(BaseEnum):
     VARIABLE_METADATA_CACHE_FILE = "variables_metadata.pkl"
     VARIABLE_CODELIST_CACHE_FILE = "variable_codelist_maps.pkl"
     CODELIST_TERM_MAP_CACHE_FILE = "codelist_term_maps.pkl"
+    LIBRARY_METADATA_STORE_FILE = "library_metadata.db"
+    RULE_TIMINGS_FILE = "rule_timings.json"
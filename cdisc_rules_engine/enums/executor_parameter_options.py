@@ -0,0 +1,6 @@
+from .base_enum import BaseEnum
+
+
+class ExecutorParameterOptions(BaseEnum):
+    LOCAL = "local"
+    REDIS = "redis"
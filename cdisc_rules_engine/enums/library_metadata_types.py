@@ -0,0 +1,11 @@
+from .base_enum import BaseEnum
+
+
+class LibraryMetadataTypes(BaseEnum):
+    RULES = "rules"
+    RULE_PLANS = "rule_plans"
+    STANDARDS = "standards"
+    MODELS = "models"
+    VARIABLE_CODELIST_MAPS = "variable_codelist_maps"
+    VARIABLES_METADATA = "variables_metadata"
+    CT_PACKAGES = "ct_packages"
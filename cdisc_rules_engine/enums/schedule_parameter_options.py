@@ -0,0 +1,6 @@
+from .base_enum import BaseEnum
+
+
+class ScheduleParameterOptions(BaseEnum):
+    RULE = "rule"
+    DATASET = "dataset"
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, List
+
+
+class TaskExecutorInterface(ABC):
+    """
+    Runs validation tasks in worker processes.
+    """
+
+    # True when workers may run on other nodes,
+    # so they can't use objects living in the coordinator process
+    is_distributed: bool = False
+
+    @classmethod
+    @abstractmethod
+    def get_instance(cls, **kwargs) -> "TaskExecutorInterface":
+        pass
+
+    @abstractmethod
+    def imap_unordered(
+        self,
+        worker: Callable[[Any], Any],
+        tasks: List[Any],
+        initializer: Callable,
+        initargs: tuple,
+    ) -> Iterator[Any]:
+        """
+        Runs the worker on each task and yields the results
+        in the order the tasks finish. Tasks are handed out
+        one at a time in the given order.
+        Every worker process calls initializer(*initargs)
+        before running its first task.
+        """
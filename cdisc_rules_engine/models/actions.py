@@ -1,12 +1,15 @@
-from typing import List, Optional, Set, Hashable
+from typing import List, Optional, Set, Hashable, Union
 
+import numpy as np
 import pandas as pd
 from business_rules.actions import BaseActions, rule_action
 from business_rules.fields import FIELD_TEXT
 
+from cdisc_rules_engine.enums.execution_status import ExecutionStatus
 from cdisc_rules_engine.enums.sensitivity import Sensitivity
 from cdisc_rules_engine.exceptions.custom_exceptions import InvalidOutputVariables
 from cdisc_rules_engine.models.dataset_variable import DatasetVariable
+from cdisc_rules_engine.models.validation_error_batch import ValidationErrorBatch
 from cdisc_rules_engine.models.validation_error_container import (
     ValidationErrorContainer,
 )
@@ -54,7 +57,8 @@ class COREActions(BaseActions):
         error_object = self.generate_targeted_error_object(
             target_names, rows_with_error, message
         )
-        self.output_container.append(error_object.to_representation())
+        representation: dict = error_object.to_representation(lazy_errors=True)
+        self.output_container.append(representation)
 
     @rule_action(params={"message": FIELD_TEXT})
     def generate_single_error(self, message):
@@ -102,6 +106,7 @@ class COREActions(BaseActions):
             raise InvalidOutputVariables(
                 f"Output variables: {list(targets)} not found in dataset"
             )
+        missing_vars = {target: "Not in dataset" for target in targets_not_in_dataset}
         if self.rule.get("sensitivity") == Sensitivity.DATASET.value:
             # Only generate one error for rules with dataset sensitivity
             errors_list = [
@@ -109,13 +114,22 @@ class COREActions(BaseActions):
                     value=dict(errors_df.iloc[0].to_dict()),
                 )
             ]
-        else:
+        elif not data.index.is_unique:
             # Rule is treated as record level
             errors_series: pd.Series = errors_df.apply(
                 lambda df_row: self._create_error_object(df_row, data), axis=1
             )
             errors_list: List[ValidationErrorEntity] = errors_series.tolist()
-        missing_vars = {target: "Not in dataset" for target in targets_not_in_dataset}
+        else:
+            # Rule is treated as record level,
+            # the error of each record is created when the errors are read
+            return ValidationErrorContainer(
+                domain=self.domain,
+                targets=sorted(targets),
+                errors=self._create_error_batch(errors_df, data, missing_vars),
+                message=message.replace("--", self.domain),
+                status=ExecutionStatus.SUCCESS.value,
+            )
         if missing_vars:
             for error in errors_list:
                 error.value = {**error.value, **missing_vars}
@@ -128,6 +142,54 @@ class COREActions(BaseActions):
             }
         )
 
+    def _create_error_batch(
+        self, errors_df: pd.DataFrame, data: pd.DataFrame, missing_vars: dict
+    ) -> ValidationErrorBatch:
+        """
+        Creates the errors of the records column-wise.
+        The record numbers, USUBJID and SEQ values are read
+        the same way as by _create_error_object.
+        """
+        index: pd.Index = errors_df.index
+        if index.dtype.kind in "iu":
+            rows: np.ndarray = index.to_numpy(dtype=np.int64) + 1
+        else:
+            rows: np.ndarray = np.array([int(name) + 1 for name in index])
+        usubjid: Optional[pd.Series] = data.get("USUBJID")
+        return ValidationErrorBatch(
+            values=errors_df,
+            rows=rows,
+            usubjids=usubjid.to_numpy(dtype=object)
+            if isinstance(usubjid, pd.Series)
+            else None,
+            sequences=self._get_sequences(data.get(f"{self.domain}SEQ")),
+            missing_values=missing_vars,
+        )
+
+    @staticmethod
+    def _get_sequences(
+        sequence: Optional[Union[pd.Series, pd.DataFrame]]
+    ) -> Optional[np.ndarray]:
+        """
+        Returns the SEQ value of each record, None for missing values.
+        """
+        if not isinstance(sequence, pd.Series):
+            return None
+        values: np.ndarray = sequence.to_numpy()
+        if values.dtype.kind in "iu":
+            return values.astype(object)
+        missing: np.ndarray = pd.isnull(values)
+        if values.dtype.kind == "f" and np.all(np.abs(values[~missing]) < 2**63):
+            sequences: np.ndarray = np.full(len(values), None, dtype=object)
+            sequences[~missing] = values[~missing].astype(np.int64).astype(object)
+            return sequences
+        sequences: np.ndarray = np.full(len(values), None, dtype=object)
+        sequences[:] = [
+            int(value) if not pd.isnull(value) and not value == "" else None
+            for value in values
+        ]
+        return sequences
+
     def _create_error_object(
         self, df_row: pd.Series, data: pd.DataFrame
     ) -> ValidationErrorEntity:
@@ -0,0 +1,205 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+from business_rules.fields import FIELD_DATAFRAME
+from business_rules.operators import DataframeType, type_operator
+from business_rules.utils import get_date_component, is_complete_date, is_valid_date
+
+# Distinct patterns and date strings kept by the caches of the operators.
+_CACHE_SIZE: int = 2**16
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _compile_regex(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_date_string(component: Optional[str], date_string: str) -> Any:
+    return get_date_component(component, date_string)
+
+
+def _get_date_component(component: Optional[str], value: Any) -> Any:
+    # dateutil takes the parts missing from incomplete dates from the current
+    # date, so only complete dates are parsed the same way on every day
+    if isinstance(value, str) and is_complete_date(value):
+        return _parse_date_string(component, value)
+    return get_date_component(component, value)
+
+
+def _compare_dates(
+    component: Optional[str], target: Any, comparator: Any, operator: Callable
+) -> bool:
+    """
+    Same as business_rules.utils.compare_dates,
+    but parses each date string once.
+    """
+    if not target or not comparator:
+        return False
+    return operator(
+        _get_date_component(component, target),
+        _get_date_component(component, comparator),
+    )
+
+
+def _map_distinct_strings(
+    values: pd.Series, function: Callable[[Any], bool]
+) -> Optional[np.ndarray]:
+    """
+    Applies the function once to each distinct value of a column
+    holding strings and missing values, and spreads the results
+    over the records. The function is applied to each missing value.
+    Returns None for columns holding other values,
+    they are checked by business_rules.
+    """
+    if values.empty or not (
+        values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype)
+    ):
+        return None
+    codes, distinct_values = pd.factorize(values)
+    distinct_values = np.asarray(distinct_values, dtype=object)
+    if not len(distinct_values) or not all(
+        isinstance(value, str) for value in distinct_values
+    ):
+        return None
+    results: np.ndarray = np.array(
+        [bool(function(value)) for value in distinct_values], dtype=bool
+    )[codes]
+    missing: np.ndarray = codes == -1
+    if missing.any():
+        results[missing] = [
+            bool(function(value)) for value in values.to_numpy(dtype=object)[missing]
+        ]
+    return results
+
+
+class DatasetOperators(DataframeType):
+    """
+    Operators of the dataset variable.
+
+    Overrides the business_rules operators that check each record
+    with a Python function: the regex operators and the date operators
+    check each distinct string of the column once, compiled patterns
+    and parsed complete dates are cached between rules.
+    The results are the same as the results of business_rules,
+    columns holding values other than strings are checked by business_rules.
+    """
+
+    def _regex_results(
+        self, other_value: dict, match: Callable[[re.Pattern, str], Any], matches: bool
+    ) -> Optional[pd.Series]:
+        target: str = self.replace_prefix(other_value.get("target"))
+        values: pd.Series = self.value[target]
+        regex: re.Pattern = _compile_regex(other_value.get("comparator"))
+        # business_rules converts numbers of the column to strings first,
+        # a column of strings is left as it is
+        results: Optional[np.ndarray] = _map_distinct_strings(
+            values,
+            lambda value: isinstance(value, str)
+            and (match(regex, value) is not None) is matches,
+        )
+        return None if results is None else pd.Series(results)
+
+    @type_operator(FIELD_DATAFRAME)
+    def matches_regex(self, other_value):
+        results = self._regex_results(other_value, re.Pattern.match, True)
+        if results is None:
+            return super().matches_regex(other_value)
+        return results
+
+    @type_operator(FIELD_DATAFRAME)
+    def not_matches_regex(self, other_value):
+        results = self._regex_results(other_value, re.Pattern.match, False)
+        if results is None:
+            return super().not_matches_regex(other_value)
+        return results
+
+    @type_operator(FIELD_DATAFRAME)
+    def prefix_matches_regex(self, other_value):
+        prefix = other_value.get("prefix")
+        results = self._regex_results(
+            other_value, lambda regex, value: regex.search(value[:prefix]), True
+        )
+        if results is None:
+            return super().prefix_matches_regex(other_value)
+        return results
+
+    @type_operator(FIELD_DATAFRAME)
+    def not_prefix_matches_regex(self, other_value):
+        prefix = other_value.get("prefix")
+        results = self._regex_results(
+            other_value, lambda regex, value: regex.search(value[:prefix]), False
+        )
+        if results is None:
+            return super().not_prefix_matches_regex(other_value)
+        return results
+
+    @type_operator(FIELD_DATAFRAME)
+    def suffix_matches_regex(self, other_value):
+        suffix = other_value.get("suffix")
+        results = self._regex_results(
+            other_value, lambda regex, value: regex.search(value[-suffix:]), True
+        )
+        if results is None:
+            return super().suffix_matches_regex(other_value)
+        return results
+
+    @type_operator(FIELD_DATAFRAME)
+    def not_suffix_matches_regex(self, other_value):
+        suffix = other_value.get("suffix")
+        results = self._regex_results(
+            other_value, lambda regex, value: regex.search(value[-suffix:]), False
+        )
+        if results is None:
+            return super().not_suffix_matches_regex(other_value)
+        return results
+
+    @type_operator(FIELD_DATAFRAME)
+    def invalid_date(self, other_value):
+        target: str = self.replace_prefix(other_value.get("target"))
+        results: Optional[np.ndarray] = _map_distinct_strings(
+            self.value[target], lambda value: not is_valid_date(value)
+        )
+        if results is None:
+            return super().invalid_date(other_value)
+        return pd.Series(results)
+
+    @type_operator(FIELD_DATAFRAME)
+    def is_complete_date(self, other_value):
+        target: str = self.replace_prefix(other_value.get("target"))
+        results: Optional[np.ndarray] = _map_distinct_strings(
+            self.value[target], is_complete_date
+        )
+        if results is None:
+            return super().is_complete_date(other_value)
+        return pd.Series(results)
+
+    def date_comparison(self, other_value, operator):
+        target: str = self.replace_prefix(other_value.get("target"))
+        comparator = self.replace_prefix(other_value.get("comparator"))
+        value_is_literal: bool = other_value.get("value_is_literal", False)
+        comparison_data = self.get_comparator_data(comparator, value_is_literal)
+        component: Optional[str] = other_value.get("date_component")
+        target_values: np.ndarray = self.value[target].to_numpy(dtype=object)
+        if isinstance(comparison_data, pd.Series):
+            comparison_values = comparison_data.to_numpy(dtype=object)
+        elif comparison_data is None or isinstance(comparison_data, str):
+            comparison_values = [comparison_data] * len(target_values)
+        else:
+            comparison_values = None
+        if not len(target_values) or comparison_values is None:
+            return super().date_comparison(other_value, operator)
+        return pd.Series(
+            [
+                bool(
+                    _compare_dates(component, target_value, comparison_value, operator)
+                )
+                for target_value, comparison_value in zip(
+                    target_values, comparison_values
+                )
+            ],
+            dtype=bool,
+        )
@@ -6,3 +6,4 @@ class DatasetTypes(BaseEnum):
     METADATA = "metadata"
     RAW_METADATA = "raw_metadata"
     VARIABLES_METADATA = "variables_metadata"
+    CONTENTS_METADATA = "contents_metadata"
@@ -1,6 +1,8 @@
-from business_rules.variables import BaseVariables, dataframe_rule_variable
+from business_rules.variables import BaseVariables, rule_variable
 from pandas import DataFrame
 
+from cdisc_rules_engine.models.dataset_operators import DatasetOperators
+
 
 class DatasetVariable(BaseVariables):
     """
@@ -8,6 +10,8 @@ class DatasetVariable(BaseVariables):
     holds a pandas DataFrame as a dataset.
     The engine uses operators like equal_to, matches_regex etc.
     to validate the dataset columns.
+    The operators are business_rules dataframe operators,
+    some of them are overridden by DatasetOperators.
     """
 
     def __init__(self, dataset: DataFrame, **params):
@@ -15,6 +19,6 @@ class DatasetVariable(BaseVariables):
         self.params = params
 
     # common variables
-    @dataframe_rule_variable(label="GET DATASET")
+    @rule_variable(DatasetOperators, label="GET DATASET")
     def get_dataset(self) -> dict:
         return {"value": self.dataset, **self.params}
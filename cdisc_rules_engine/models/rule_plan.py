@@ -0,0 +1,98 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from cdisc_rules_engine.exceptions.custom_exceptions import RuleFormatError
+from cdisc_rules_engine.interfaces import ConditionInterface
+from cdisc_rules_engine.models.rule_conditions import ConditionCompositeFactory
+
+
+class RulePlan:
+    """
+    A rule prepared for validation.
+
+    The rule conditions are parsed into the condition tree once,
+    when the plan is built, and the parts of the rule used to select
+    and dispatch it are extracted:
+        * variables referenced by the conditions;
+        * operations;
+        * included and excluded domains and classes;
+        * dataset builder type.
+    Plans are pickled to the library metadata store by update-cache.
+    """
+
+    # increase when the pickled plans become incompatible
+    FORMAT_VERSION: int = 1
+
+    def __init__(self, rule: dict):
+        self.core_id: str = rule.get("core_id")
+        self.rule: dict = rule
+        try:
+            self.rule = {
+                **rule,
+                "conditions": compile_conditions(rule["conditions"]),
+            }
+        except (KeyError, RuleFormatError):
+            # invalid rules are reported when they are validated
+            pass
+        self.referenced_variables: FrozenSet[str] = frozenset(
+            self._extract_referenced_variables(self.rule.get("conditions"))
+        )
+        self.operations: List[dict] = rule.get("operations") or []
+        domains: dict = rule.get("domains") or {}
+        self.included_domains: FrozenSet[str] = frozenset(domains.get("Include", []))
+        self.excluded_domains: FrozenSet[str] = frozenset(domains.get("Exclude", []))
+        classes: dict = rule.get("classes") or {}
+        self.included_classes: FrozenSet[str] = frozenset(classes.get("Include", []))
+        self.excluded_classes: FrozenSet[str] = frozenset(classes.get("Exclude", []))
+        self.dataset_builder_type: Optional[str] = rule.get("rule_type")
+
+    @staticmethod
+    def _extract_referenced_variables(conditions) -> List[str]:
+        if not isinstance(conditions, ConditionInterface):
+            return []
+        variables: List[str] = []
+        for condition in conditions.values():
+            for key in ("target", "comparator"):
+                value = condition["value"].get(key)
+                if value and isinstance(value, str):
+                    variables.append(value)
+        return variables
+
+
+def compile_conditions(conditions) -> ConditionInterface:
+    """
+    Parses rule conditions into the condition tree,
+    already parsed conditions are returned as is.
+    """
+    if isinstance(conditions, ConditionInterface):
+        return conditions
+    return ConditionCompositeFactory.get_condition_composite(conditions)
+
+
+def build_rule_plan_index(rules: Dict[str, dict]) -> Dict[str, Dict[str, RulePlan]]:
+    """
+    Groups the cached rules by standard and version.
+    Returns a map of the rules cache key of a standard version
+    to the plans of its rules by core id, in the order of the cached rules.
+    """
+    index: Dict[str, Dict[str, RulePlan]] = {}
+    for key, rule in rules.items():
+        core_id: str = rule.get("core_id")
+        if not core_id or not key.endswith(f"/{core_id}"):
+            continue
+        standard_key: str = key[: -len(core_id)]
+        plans: Dict[str, RulePlan] = index.setdefault(standard_key, {})
+        if core_id not in plans:
+            plans[core_id] = RulePlan(rule)
+    return index
+
+
+def select_rule_plans(
+    plans: Dict[str, RulePlan], core_ids: Optional[Iterable[str]] = None
+) -> List[Optional[RulePlan]]:
+    """
+    Returns the plans of the given rules,
+    or all plans if no rules are given.
+    """
+    if not core_ids:
+        return list(plans.values())
+    return [plans.get(core_id) for core_id in core_ids]
@@ -1,5 +1,12 @@
 from collections import namedtuple
 
+from cdisc_rules_engine.enums.executor_parameter_options import (
+    ExecutorParameterOptions,
+)
+from cdisc_rules_engine.enums.schedule_parameter_options import (
+    ScheduleParameterOptions,
+)
+
 Validation_args = namedtuple(
     "Validation_args",
     [
@@ -20,5 +27,15 @@ Validation_args = namedtuple(
         "rules",
         "progress",
         "define_xml_path",
+        "schedule",
+        "dataset_cache_path",
+        "result_store_path",
+        "executor",
+    ],
+    defaults=[
+        ScheduleParameterOptions.RULE.value,
+        None,
+        None,
+        ExecutorParameterOptions.LOCAL.value,
     ],
 )
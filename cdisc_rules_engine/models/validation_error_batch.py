@@ -0,0 +1,125 @@
+from collections.abc import Sequence
+from copy import copy
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_extension_array_dtype
+from pandas.core.dtypes.cast import maybe_box_native
+
+from .validation_error_entity import ValidationErrorEntity
+
+
+class _ErrorColumns(NamedTuple):
+    values: pd.DataFrame
+    rows: np.ndarray
+    usubjids: Optional[np.ndarray]
+    sequences: Optional[np.ndarray]
+    missing_values: dict
+
+
+class ValidationErrorBatch(Sequence):
+    """
+    Errors of a rule for records of a dataset, kept as columns:
+    the record numbers, the USUBJID and SEQ values of the records
+    and a frame of the values of the reported variables.
+
+    The ValidationErrorEntity of a record is created when the batch is read.
+    The representations of the batch return the representation
+    of the entities instead, so the engine results hold the errors
+    as columns until a report reads them.
+    """
+
+    def __init__(
+        self,
+        values: pd.DataFrame,
+        rows: np.ndarray,
+        usubjids: Optional[np.ndarray] = None,
+        sequences: Optional[np.ndarray] = None,
+        missing_values: Optional[dict] = None,
+    ):
+        self._parts: List[_ErrorColumns] = [
+            _ErrorColumns(values, rows, usubjids, sequences, missing_values or {})
+        ]
+        self._represented: bool = False
+
+    def __len__(self) -> int:
+        return sum(len(part.rows) for part in self._parts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        for part in self._parts:
+            if 0 <= index < len(part.rows):
+                values = next(self._get_values(part.values.iloc[index : index + 1]))
+                return self._create_error(part, index, values)
+            index -= len(part.rows)
+        raise IndexError("Validation error index out of range")
+
+    def __iter__(self) -> Iterator:
+        for part in self._parts:
+            for index, values in enumerate(self._get_values(part.values)):
+                yield self._create_error(part, index, values)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, tuple, ValidationErrorBatch)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def representations(self) -> "ValidationErrorBatch":
+        """
+        Returns a batch of the same errors,
+        which returns the representations of the errors when read.
+        """
+        batch: ValidationErrorBatch = copy(self)
+        batch._parts = list(self._parts)
+        batch._represented = True
+        return batch
+
+    def shift_rows(self, start: int):
+        """
+        Adds the given number to the record numbers of the errors.
+        """
+        self._parts = [part._replace(rows=part.rows + start) for part in self._parts]
+
+    def extend(self, other: "ValidationErrorBatch"):
+        self._parts.extend(other._parts)
+
+    @staticmethod
+    def serialize(value: Any) -> list:
+        """
+        Converts error batches to lists, used as the default function of json.
+        """
+        if isinstance(value, ValidationErrorBatch):
+            return list(value)
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+
+    def _create_error(self, part: _ErrorColumns, index: int, values: dict):
+        error = ValidationErrorEntity(
+            value={**values, **part.missing_values},
+            row=int(part.rows[index]),
+            usubjid=None if part.usubjids is None else str(part.usubjids[index]),
+            sequence=None if part.sequences is None else part.sequences[index],
+        )
+        return error.to_representation() if self._represented else error
+
+    @staticmethod
+    def _get_values(values: pd.DataFrame) -> Iterator[dict]:
+        """
+        Returns the values of each record as a dict,
+        converted the same way as by DataFrame.apply on the rows.
+        """
+        if is_extension_array_dtype(values.iloc[0].dtype):
+            for index in range(len(values)):
+                yield dict(values.iloc[index].to_dict())
+            return
+        columns: list = values.columns.tolist()
+        for record in values.to_numpy():
+            yield dict(zip(columns, map(maybe_box_native, record)))
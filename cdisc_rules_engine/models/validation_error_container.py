@@ -5,6 +5,7 @@ from cdisc_rules_engine.utilities.utils import get_execution_status
 
 from .base_validation_entity import BaseValidationEntity
 from .failed_validation_entity import FailedValidationEntity
+from .validation_error_batch import ValidationErrorBatch
 from .validation_error_entity import ValidationErrorEntity
 
 
@@ -12,19 +13,29 @@ class ValidationErrorContainer(BaseValidationEntity):
     def __init__(self, **params):
         self.domain: str = params.get("domain")
         self.targets: List[str] = params.get("targets", [])
-        self.errors: List[
-            Union[ValidationErrorEntity, FailedValidationEntity]
+        self.errors: Union[
+            List[Union[ValidationErrorEntity, FailedValidationEntity]],
+            ValidationErrorBatch,
         ] = params.get("errors", [])
         self.message: str = params.get("message")
         self.status: ExecutionStatus = params.get("status") or get_execution_status(
             self.errors
         )
 
-    def to_representation(self) -> dict:
+    def to_representation(self, lazy_errors: bool = False) -> dict:
+        """
+        Returns the container as dict. With lazy_errors, errors kept
+        in a ValidationErrorBatch are represented by the batch
+        and converted to dicts when they are read.
+        """
+        if lazy_errors and isinstance(self.errors, ValidationErrorBatch):
+            errors = self.errors.representations()
+        else:
+            errors = [error.to_representation() for error in self.errors]
         return {
             "executionStatus": self.status,
             "domain": self.domain,
             "variables": sorted(self.targets),
             "message": self.message,
-            "errors": [error.to_representation() for error in self.errors],
+            "errors": errors,
         }
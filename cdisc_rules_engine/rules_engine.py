@@ -1,11 +1,14 @@
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import List, Union
+from functools import partial
+from typing import Iterator, List, Optional, Union
 
 import pandas as pd
 from business_rules import export_rule_data
-from business_rules.engine import run
+from business_rules.engine import do_actions, run
 import os
 from cdisc_rules_engine.config import config as default_config
+from cdisc_rules_engine.constants.rule_constants import DEFAULT_EVALUATION_CHUNK_SIZE
 from cdisc_rules_engine.dummy_models.dummy_dataset import DummyDataset
 from cdisc_rules_engine.enums.execution_status import ExecutionStatus
 from cdisc_rules_engine.enums.rule_types import RuleTypes
@@ -24,6 +27,7 @@ from cdisc_rules_engine.interfaces import (
 from cdisc_rules_engine.models.actions import COREActions
 from cdisc_rules_engine.models.dataset_variable import DatasetVariable
 from cdisc_rules_engine.models.failed_validation_entity import FailedValidationEntity
+from cdisc_rules_engine.models.validation_error_batch import ValidationErrorBatch
 from cdisc_rules_engine.models.validation_error_container import (
     ValidationErrorContainer,
 )
@@ -33,6 +37,12 @@ from cdisc_rules_engine.services.data_services import DataServiceFactory
 from cdisc_rules_engine.services.define_xml.define_xml_reader_factory import (
     DefineXMLReaderFactory,
 )
+from cdisc_rules_engine.utilities.condition_compiler import (
+    ConditionCompiler,
+    ConditionPlan,
+    PredicateCache,
+    evaluate_condition_plan,
+)
 from cdisc_rules_engine.utilities.data_processor import DataProcessor
 from cdisc_rules_engine.utilities.dataset_preprocessor import DatasetPreprocessor
 from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
@@ -75,6 +85,8 @@ class RulesEngine:
         self.whodrug_path: str = kwargs.get("whodrug_path")
         self.define_xml_path: str = kwargs.get("define_xml_path")
         self.validate_xml: bool = kwargs.get("validate_xml")
+        # masks of conditions shared by the rules of a batch
+        self.predicate_cache: Optional[PredicateCache] = None
 
     def get_schema(self):
         return export_rule_data(DatasetVariable, COREActions)
@@ -121,15 +133,30 @@ class RulesEngine:
             f"dataset_path={dataset_path}. datasets={datasets}."
         )
         output = {}
-        for rule in rules:
-            result = self.validate_single_rule(
-                rule, dataset_path, datasets, dataset_domain
-            )
-            # result may be None if a rule is not suitable for validation
-            if result is not None:
-                output[rule.get("core_id")] = result
+        with self.shared_predicates():
+            for rule in rules:
+                result = self.validate_single_rule(
+                    rule, dataset_path, datasets, dataset_domain
+                )
+                # result may be None if a rule is not suitable for validation
+                if result is not None:
+                    output[rule.get("core_id")] = result
         return output
 
+    @contextmanager
+    def shared_predicates(self) -> Iterator[PredicateCache]:
+        """
+        Rules validated in the block share the masks of their compiled
+        conditions, so a condition repeated in many rules on the same
+        dataset, like empty checks of the same variable,
+        is evaluated once.
+        """
+        self.predicate_cache = PredicateCache()
+        try:
+            yield self.predicate_cache
+        finally:
+            self.predicate_cache = None
+
     def validate_single_rule(
         self,
         rule: dict,
@@ -169,11 +196,7 @@ class RulesEngine:
                     ]
             else:
                 logger.info(f"Skipped domain {dataset_domain}.")
-                error_obj: ValidationErrorContainer = ValidationErrorContainer(
-                    status=ExecutionStatus.SKIPPED.value
-                )
-                error_obj.domain = dataset_domain
-                return [error_obj.to_representation()]
+                return self.get_skipped_result(dataset_domain)
         except Exception as e:
             logger.trace(e, __name__)
             logger.error(
@@ -187,6 +210,18 @@ class RulesEngine:
             # this wrapping into a list is necessary to keep return type consistent
             return [error_obj.to_representation()]
 
+    @staticmethod
+    def get_skipped_result(dataset_domain: str) -> List[dict]:
+        """
+        Returns the result of a rule that is not suitable
+        for validation of the domain.
+        """
+        error_obj: ValidationErrorContainer = ValidationErrorContainer(
+            status=ExecutionStatus.SKIPPED.value
+        )
+        error_obj.domain = dataset_domain
+        return [error_obj.to_representation()]
+
     def get_dataset_builder(
         self, rule: dict, dataset_path: str, datasets: List[dict], domain: str
     ):
@@ -308,8 +343,57 @@ class RulesEngine:
             rule["conditions"], dataset.columns.to_list()
         )
         rule_copy["conditions"].set_conditions(updated_conditions)
-        # Adding copy for now to avoid updating cached dataset
-        dataset = deepcopy(dataset)
+        evaluate_rule = partial(
+            self.evaluate_rule,
+            rule,
+            rule_copy,
+            dataset_path=dataset_path,
+            datasets=datasets,
+            domain=domain,
+            value_level_metadata=value_level_metadata,
+            variable_codelist_map=variable_codelist_map,
+            codelist_term_maps=codelist_term_maps,
+            ct_packages=ct_packages,
+        )
+        chunk_size: int = self.get_evaluation_chunk_size(rule_copy, dataset, domain)
+        if not chunk_size:
+            return evaluate_rule(dataset)
+        # Derived columns, copies and results of each part of the dataset
+        # are released before the next part is evaluated.
+        logger.info(
+            f"Validating {rule.get('core_id')} against {len(dataset)} records "
+            f"of {domain} in parts of {chunk_size} records"
+        )
+        results = []
+        for start in range(0, len(dataset), chunk_size):
+            chunk: pd.DataFrame = dataset.iloc[start : start + chunk_size]
+            self.add_chunk_results(
+                results, evaluate_rule(chunk.reset_index(drop=True)), start
+            )
+        return results
+
+    def evaluate_rule(
+        self,
+        rule: dict,
+        rule_copy: dict,
+        dataset: pd.DataFrame,
+        dataset_path: str,
+        datasets: List[dict],
+        domain: str,
+        value_level_metadata: List[dict],
+        variable_codelist_map: dict,
+        codelist_term_maps: list,
+        ct_packages: list,
+    ) -> List[str]:
+        """
+        Runs the rule, with its conditions duplicated for all targets,
+        against the dataset.
+        """
+        # The cached dataset is shared read-only. Preprocessing, operations
+        # and actions only add columns, so they work on a shallow copy
+        # which holds the derived columns without copying the cached ones.
+        source_dataset: pd.DataFrame = dataset
+        dataset = dataset.copy(deep=False)
         # preprocess dataset
         dataset_preprocessor = DatasetPreprocessor(
             dataset, domain, dataset_path, self.data_service, self.cache
@@ -327,6 +411,9 @@ class RulesEngine:
             whodrug_path=self.whodrug_path,
             ct_packages=ct_packages,
         )
+        if self.rule_processor.rule_overwrites_dataset_columns(rule_copy):
+            # the operators write into existing columns, copy them first
+            dataset = dataset.copy()
         relationship_data = {}
         if domain is not None and self.rule_processor.is_relationship_dataset(domain):
             relationship_data = self.data_processor.preprocess_relationship_dataset(
@@ -341,19 +428,99 @@ class RulesEngine:
             codelist_term_maps=codelist_term_maps,
         )
         results = []
-        run(
-            serialize_rule(rule_copy),  # engine expects a JSON serialized dict
-            defined_variables=dataset_variable,
-            defined_actions=COREActions(
-                results,
-                variable=dataset_variable,
-                domain=domain,
-                rule=rule,
-                value_level_metadata=value_level_metadata,
-            ),
+        core_actions = COREActions(
+            results,
+            variable=dataset_variable,
+            domain=domain,
+            rule=rule,
+            value_level_metadata=value_level_metadata,
         )
+        # the compiler reads the conditions without copying them,
+        # conditions duplicated for all variables are evaluated together
+        condition_plan: Optional[ConditionPlan] = ConditionCompiler(
+            dataset_variable.params["column_prefix_map"]
+        ).compile(rule_copy["conditions"].to_dict())
+        rule_results: Optional[pd.Series] = None
+        if condition_plan:
+            rule_results = evaluate_condition_plan(
+                condition_plan,
+                dataset,
+                self.predicate_cache.get_condition_masks(source_dataset)
+                if self.predicate_cache
+                else None,
+            )
+        if rule_results is None:
+            # conditions with operators the compiler doesn't support
+            run(
+                serialize_rule(rule_copy),  # engine expects a JSON serialized dict
+                defined_variables=dataset_variable,
+                defined_actions=core_actions,
+            )
+        elif rule_results.any():
+            do_actions(rule_copy["actions"], core_actions, results=rule_results)
         return results
 
+    def get_evaluation_chunk_size(
+        self, rule: dict, dataset: pd.DataFrame, domain: str
+    ) -> int:
+        """
+        Returns the number of records of the parts of the dataset
+        the rule is evaluated against, or 0 if the rule is evaluated
+        against the whole dataset. Rules checking each record
+        on their own are evaluated in parts when the dataset has
+        more records than EVALUATION_CHUNK_SIZE.
+        """
+        chunk_size = int(
+            self.config.getValue("EVALUATION_CHUNK_SIZE")
+            or DEFAULT_EVALUATION_CHUNK_SIZE
+        )
+        index: pd.Index = dataset.index
+        # row numbers of errors are positions in the dataset
+        has_default_index: bool = isinstance(index, pd.RangeIndex) and (
+            index.start == 0 and index.step == 1
+        )
+        if (
+            0 < chunk_size < len(dataset)
+            and has_default_index
+            and self.rule_processor.can_validate_in_chunks(rule, domain)
+        ):
+            return chunk_size
+        return 0
+
+    @staticmethod
+    def add_chunk_results(results: List[dict], chunk_results: List[dict], start: int):
+        """
+        Adds the errors found in the part of the dataset
+        starting at the given record to the results of the previous parts.
+        """
+        for chunk_result in chunk_results:
+            if isinstance(chunk_result["errors"], ValidationErrorBatch):
+                chunk_result["errors"].shift_rows(start)
+            else:
+                for error in chunk_result["errors"]:
+                    if "row" in error:
+                        error["row"] += start
+            result: dict = next(
+                (
+                    result
+                    for result in results
+                    if result["message"] == chunk_result["message"]
+                    and result["variables"] == chunk_result["variables"]
+                ),
+                None,
+            )
+            if result is None:
+                results.append(chunk_result)
+                continue
+            if isinstance(result["errors"], ValidationErrorBatch) and isinstance(
+                chunk_result["errors"], ValidationErrorBatch
+            ):
+                result["errors"].extend(chunk_result["errors"])
+            else:
+                result["errors"] = [*result["errors"], *chunk_result["errors"]]
+            if chunk_result["executionStatus"] != ExecutionStatus.SUCCESS.value:
+                result["executionStatus"] = chunk_result["executionStatus"]
+
     def get_define_xml_metadata_for_domain(
         self, dataset_path: str, domain_name: str
     ) -> dict:
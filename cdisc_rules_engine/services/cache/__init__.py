@@ -1,9 +1,17 @@
 from .cache_service_factory import CacheServiceFactory
+from .dataset_file_cache import DatasetFileCache
 from .in_memory_cache_service import InMemoryCacheService
+from .library_metadata_store import LibraryMetadataStore
 from .redis_cache_service import RedisCacheService
+from .tiered_cache_service import TieredCacheService
+from .validation_result_store import ValidationResultStore
 
 __all__ = [
     "CacheServiceFactory",
+    "DatasetFileCache",
     "InMemoryCacheService",
+    "LibraryMetadataStore",
     "RedisCacheService",
+    "TieredCacheService",
+    "ValidationResultStore",
 ]
@@ -8,9 +8,14 @@ from cdisc_library_client.custom_exceptions import (
 )
 
 from cdisc_rules_engine.enums.library_endpoints import LibraryEndpoints
+from cdisc_rules_engine.enums.library_metadata_types import LibraryMetadataTypes
 from cdisc_rules_engine.interfaces import (
     CacheServiceInterface,
 )
+from cdisc_rules_engine.models.rule_plan import RulePlan, build_rule_plan_index
+from cdisc_rules_engine.services.cache.library_metadata_store import (
+    LibraryMetadataStore,
+)
 from cdisc_rules_engine.services.cdisc_library_service import CDISCLibraryService
 from cdisc_rules_engine.utilities.utils import (
     get_library_variables_metadata_cache_key,
@@ -174,6 +179,44 @@ class CachePopulator:
         with open(file_path, "wb") as f:
             pickle.dump(variables_metadata, f)
 
+    def save_library_metadata_store_locally(
+        self, file_path: str, source_files: Iterable[str] = ()
+    ):
+        """
+        Store all cached metadata and the rule plans
+        of each standard version in the indexed
+        library_metadata.db in cache path directory,
+        with the fingerprints of the cache files holding the same metadata
+        """
+        rules: dict = self.cache.filter_cache("rules")
+        LibraryMetadataStore.write(
+            file_path,
+            {
+                LibraryMetadataTypes.RULES.value: rules,
+                LibraryMetadataTypes.RULE_PLANS.value: {
+                    standard_key: {
+                        "format_version": RulePlan.FORMAT_VERSION,
+                        "plans": plans,
+                    }
+                    for standard_key, plans in build_rule_plan_index(rules).items()
+                },
+                LibraryMetadataTypes.CT_PACKAGES.value: self.cache.get_by_regex(
+                    "*ct-*"
+                ),
+                LibraryMetadataTypes.VARIABLE_CODELIST_MAPS.value: (
+                    self.cache.get_by_regex("*-codelists*")
+                ),
+                LibraryMetadataTypes.STANDARDS.value: self.cache.filter_cache(
+                    "standards"
+                ),
+                LibraryMetadataTypes.MODELS.value: self.cache.filter_cache("models"),
+                LibraryMetadataTypes.VARIABLES_METADATA.value: self.cache.filter_cache(
+                    "library_variables_metadata"
+                ),
+            },
+            source_files,
+        )
+
     async def _get_rules_from_cdisc_library(self) -> List[List[dict]]:
         """
         Requests rules from CDISC Library.
@@ -0,0 +1,112 @@
+import glob
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+import pandas as pd
+
+from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.utilities.utils import get_dataset_fingerprint
+from version import __version__
+
+try:
+    import pyarrow
+    from pyarrow import feather
+except ImportError:  # pragma: no cover
+    pyarrow = None
+    feather = None
+
+FEATHER_EXTENSION: str = ".feather"
+PICKLE_EXTENSION: str = ".pkl"
+
+
+class DatasetFileCache:
+    """
+    Persistent on-disk cache of dataset contents.
+
+    The first read of a dataset stores the parsed DataFrame in cache_path,
+    later reads load it back instead of parsing the source file again.
+    Files are stored in the uncompressed Feather format, so they can be
+    memory-mapped. If pyarrow is not installed or a dataset cannot be
+    converted to Arrow, the DataFrame is pickled instead.
+
+    Cache files are keyed by the dataset path, its fingerprint
+    (file size and modification time) and the engine version,
+    so a rewritten dataset or an upgraded reader parses the file again.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        os.makedirs(self.cache_path, exist_ok=True)
+
+    def get(self, dataset_path: str) -> Optional[pd.DataFrame]:
+        cache_file_path: Optional[str] = self._get_cache_file_path(dataset_path)
+        if cache_file_path is None:
+            return None
+        if feather and os.path.isfile(cache_file_path + FEATHER_EXTENSION):
+            logger.info(f"Reading {dataset_path} from the dataset cache.")
+            return feather.read_table(
+                cache_file_path + FEATHER_EXTENSION, memory_map=True
+            ).to_pandas()
+        if os.path.isfile(cache_file_path + PICKLE_EXTENSION):
+            logger.info(f"Reading {dataset_path} from the dataset cache.")
+            return pd.read_pickle(cache_file_path + PICKLE_EXTENSION)
+        return None
+
+    def add(self, dataset_path: str, dataset: pd.DataFrame):
+        cache_file_path: Optional[str] = self._get_cache_file_path(dataset_path)
+        if cache_file_path is None:
+            return
+        self._remove_stale_files(dataset_path, cache_file_path)
+        # write to a temporary file first, other processes
+        # may be reading the same dataset at the same time
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_path)
+        os.close(fd)
+        try:
+            extension: str = self._write(dataset, temp_path)
+            os.replace(temp_path, cache_file_path + extension)
+        except OSError as e:
+            logger.warning(f"Could not write {dataset_path} to the dataset cache: {e}")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _write(self, dataset: pd.DataFrame, file_path: str) -> str:
+        if feather:
+            try:
+                feather.write_feather(dataset, file_path, compression="uncompressed")
+                return FEATHER_EXTENSION
+            except (pyarrow.ArrowException, ValueError, TypeError):
+                # mixed type columns cannot be converted to Arrow
+                pass
+        dataset.to_pickle(file_path)
+        return PICKLE_EXTENSION
+
+    def _get_path_key(self, dataset_path: str) -> str:
+        return hashlib.sha1(os.path.abspath(dataset_path).encode()).hexdigest()
+
+    def _get_cache_file_path(self, dataset_path: str) -> Optional[str]:
+        fingerprint = get_dataset_fingerprint(dataset_path)
+        if fingerprint is None:
+            return None
+        size, modification_time = fingerprint
+        return os.path.join(
+            self.cache_path,
+            f"{self._get_path_key(dataset_path)}_{__version__}"
+            f"_{size}_{modification_time}",
+        )
+
+    def _remove_stale_files(self, dataset_path: str, cache_file_path: str):
+        """
+        Removes files cached for previous versions of the dataset.
+        """
+        for file_path in glob.glob(
+            os.path.join(self.cache_path, f"{self._get_path_key(dataset_path)}_*")
+        ):
+            if os.path.splitext(file_path)[0] == cache_file_path:
+                continue
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
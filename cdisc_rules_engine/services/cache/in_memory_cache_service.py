@@ -1,12 +1,13 @@
 import re
-from typing import List
-from pympler import asizeof
+from typing import Any, Callable, List
 from cdisc_rules_engine.interfaces import (
     CacheServiceInterface,
 )
 from cachetools import LRUCache
 import psutil
 
+from .size_estimators import SizeEstimator
+
 
 class InMemoryCacheService(CacheServiceInterface):
     _instance = None
@@ -17,14 +18,22 @@ class InMemoryCacheService(CacheServiceInterface):
             cls._instance = cls(**kwargs)
         return cls._instance
 
-    def __init__(self, max_size=None, **kwargs):
+    def __init__(
+        self,
+        max_size=None,
+        size_estimator: Callable[[Any], int] = None,
+        **kwargs,
+    ):
         self.max_size = max_size or psutil.virtual_memory().available * 0.75
-        self.cache = LRUCache(maxsize=self.max_size, getsizeof=asizeof.asizeof)
+        self.size_estimator = size_estimator or SizeEstimator()
+        self.cache = LRUCache(maxsize=self.max_size, getsizeof=self.size_estimator)
 
     def add(self, cache_key, data):
-        if asizeof.asizeof(data) > self.max_size:
-            return
-        self.cache[cache_key] = data
+        try:
+            self.cache[cache_key] = data
+        except ValueError:
+            # the value is larger than the whole cache
+            pass
 
     def add_batch(
         self,
@@ -73,8 +82,15 @@ class InMemoryCacheService(CacheServiceInterface):
             for key in keys_to_remove:
                 self.clear(key)
         else:
-            self.cache = LRUCache(maxsize=self.max_size, getsizeof=asizeof.asizeof)
+            self.cache = LRUCache(maxsize=self.max_size, getsizeof=self.size_estimator)
 
     def add_all(self, data: dict):
         for key, val in data.items():
             self.add(key, val)
+
+    def get_sizing_stats(self) -> dict:
+        """
+        Returns the number of sized entries and the time spent sizing them.
+        """
+        get_stats = getattr(self.size_estimator, "get_stats", None)
+        return get_stats() if get_stats else {}
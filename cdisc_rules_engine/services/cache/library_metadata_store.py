@@ -0,0 +1,149 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from cdisc_rules_engine.utilities.utils import get_dataset_fingerprint
+
+# The largest code point, keys starting with a prefix
+# sort between the prefix and the prefix followed by it.
+_MAX_CHARACTER: str = "\U0010ffff"
+# Older SQLite versions limit the number of query parameters to 999.
+_MAX_KEYS_PER_QUERY: int = 500
+
+
+class LibraryMetadataStore:
+    """
+    Keyed on-disk store of CDISC Library metadata.
+
+    Metadata is kept in a single SQLite file as pickled values
+    indexed by (metadata type, cache key), so a single standard,
+    model or CT package can be loaded without unpickling
+    the metadata of all the others.
+    The store is written by the update-cache command, with the size
+    and modification time of the cache files it was built from,
+    so a store older than the cache files is not used.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    @staticmethod
+    def write(
+        file_path: str,
+        metadata: Dict[str, Dict[str, Any]],
+        source_files: Iterable[str] = (),
+    ):
+        """
+        Creates the store from a mapping of metadata type
+        to a mapping of cache key to value and records the fingerprints
+        of the files the metadata was read from.
+        The file is replaced atomically.
+        """
+        directory: str = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory)
+        os.close(fd)
+        try:
+            with closing(sqlite3.connect(temp_path)) as connection:
+                connection.execute(
+                    "CREATE TABLE metadata (type TEXT NOT NULL, key TEXT NOT NULL, "
+                    "value BLOB NOT NULL, PRIMARY KEY (type, key))"
+                )
+                connection.execute(
+                    "CREATE TABLE sources (file_name TEXT NOT NULL PRIMARY KEY, "
+                    "size INTEGER, modified INTEGER)"
+                )
+                connection.executemany(
+                    "INSERT INTO sources VALUES (?, ?, ?)",
+                    (
+                        (os.path.basename(source_file), *fingerprint)
+                        for source_file, fingerprint in _get_fingerprints(
+                            source_files
+                        ).items()
+                    ),
+                )
+                for metadata_type, items in metadata.items():
+                    connection.executemany(
+                        "INSERT INTO metadata VALUES (?, ?, ?)",
+                        (
+                            (metadata_type, key, pickle.dumps(value))
+                            for key, value in items.items()
+                        ),
+                    )
+                connection.commit()
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def is_up_to_date(self, source_files: Iterable[str]) -> bool:
+        """
+        Checks that the store was built from exactly the given files
+        and that none of them has changed since.
+        Stores written without the fingerprints are never up to date.
+        """
+        try:
+            rows = self._fetch("SELECT file_name, size, modified FROM sources", ())
+        except sqlite3.OperationalError:
+            return False
+        recorded: Dict[str, tuple] = {
+            file_name: (size, modified) for file_name, size, modified in rows
+        }
+        current: Dict[str, tuple] = {
+            os.path.basename(source_file): fingerprint
+            for source_file, fingerprint in _get_fingerprints(source_files).items()
+        }
+        return recorded == current
+
+    def get(self, metadata_type: str, key: str) -> Optional[Any]:
+        return self.get_many(metadata_type, [key]).get(key)
+
+    def get_many(self, metadata_type: str, keys: Iterable[str]) -> Dict[str, Any]:
+        keys: List[str] = list(keys)
+        values: Dict[str, Any] = {}
+        for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+            batch: List[str] = keys[start : start + _MAX_KEYS_PER_QUERY]
+            rows = self._fetch(
+                "SELECT key, value FROM metadata WHERE type = ? "
+                f"AND key IN ({', '.join('?' * len(batch))})",
+                (metadata_type, *batch),
+            )
+            values.update((key, pickle.loads(value)) for key, value in rows)
+        return values
+
+    def get_by_prefix(self, metadata_type: str, prefix: str) -> Dict[str, Any]:
+        """
+        Returns the values whose keys start with the prefix
+        in the order they were written.
+        """
+        rows = self._fetch(
+            "SELECT key, value FROM metadata WHERE type = ? "
+            "AND key >= ? AND key < ? ORDER BY rowid",
+            (metadata_type, prefix, prefix + _MAX_CHARACTER),
+        )
+        return {key: pickle.loads(value) for key, value in rows}
+
+    def keys(self, metadata_type: str) -> List[str]:
+        rows = self._fetch(
+            "SELECT key FROM metadata WHERE type = ? ORDER BY rowid",
+            (metadata_type,),
+        )
+        return [key for (key,) in rows]
+
+    def _fetch(self, query: str, parameters: Tuple) -> List[tuple]:
+        # read only, the store is never modified in place
+        uri: str = f"{Path(self.file_path).resolve().as_uri()}?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as connection:
+            return connection.execute(query, parameters).fetchall()
+
+
+def _get_fingerprints(source_files: Iterable[str]) -> Dict[str, tuple]:
+    fingerprints: Dict[str, tuple] = {}
+    for source_file in source_files:
+        fingerprint: Optional[Tuple[int, int]] = get_dataset_fingerprint(source_file)
+        if fingerprint is not None:
+            fingerprints[source_file] = fingerprint
+    return fingerprints
@@ -19,7 +19,7 @@ class RedisCacheService(CacheServiceInterface):
             instance = cls(
                 host_name=config.getValue("REDIS_HOST_NAME"),
                 access_key=config.getValue("REDIS_ACCESS_KEY"),
-                port=config.getValue("REDIS_PORT", 6380),
+                port=config.getValue("REDIS_PORT") or 6380,
                 ssl=kwargs.get("ssl", True),
             )
             cls._instance = instance
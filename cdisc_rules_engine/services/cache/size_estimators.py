@@ -0,0 +1,98 @@
+"""
+This module contains estimators of the memory
+taken by the objects stored in the in-memory caches.
+"""
+import sys
+import time
+from itertools import islice
+from typing import Any, Callable, Dict, Type
+
+import numpy as np
+import pandas as pd
+from pympler import asizeof
+
+DEFAULT_SAMPLE_SIZE: int = 32
+
+
+def estimate_dataframe_size(data: pd.DataFrame, deep: bool = True) -> int:
+    """
+    Uses pandas bookkeeping instead of walking the objects.
+    With deep=True object columns are measured in C,
+    with deep=False only the column buffers are counted.
+    """
+    return int(data.memory_usage(index=True, deep=deep).sum())
+
+
+def estimate_series_size(data: pd.Series, deep: bool = True) -> int:
+    return int(data.memory_usage(index=True, deep=deep))
+
+
+def estimate_array_size(data: np.ndarray) -> int:
+    return sys.getsizeof(data) + (data.nbytes if data.base is not None else 0)
+
+
+class SizeEstimator:
+    """
+    Callable that estimates the size of a cache entry in bytes.
+    Estimators are picked by the type of the entry, other objects
+    are measured with pympler.asizeof. Containers larger than sample_size
+    are measured by extrapolating the size of their first items.
+    Time spent sizing entries is accumulated in total_time.
+    """
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE, deep: bool = True):
+        self.sample_size = sample_size
+        self.deep = deep
+        self.calls: int = 0
+        self.total_time: float = 0.0
+        self._estimators: Dict[Type, Callable[[Any], int]] = {
+            pd.DataFrame: lambda data: estimate_dataframe_size(data, self.deep),
+            pd.Series: lambda data: estimate_series_size(data, self.deep),
+            np.ndarray: estimate_array_size,
+            dict: self.estimate_dict_size,
+            list: self.estimate_collection_size,
+            tuple: self.estimate_collection_size,
+            set: self.estimate_collection_size,
+            str: sys.getsizeof,
+            bytes: sys.getsizeof,
+        }
+
+    def register(self, data_type: Type, estimator: Callable[[Any], int]):
+        self._estimators[data_type] = estimator
+
+    def __call__(self, data) -> int:
+        start = time.perf_counter()
+        try:
+            return self.estimate(data)
+        finally:
+            self.calls += 1
+            self.total_time += time.perf_counter() - start
+
+    def estimate(self, data) -> int:
+        for data_type in type(data).__mro__:
+            estimator = self._estimators.get(data_type)
+            if estimator:
+                return estimator(data)
+        return asizeof.asizeof(data)
+
+    def estimate_dict_size(self, data: dict) -> int:
+        sample_size: int = sum(
+            self.estimate(key) + self.estimate(value)
+            for key, value in islice(data.items(), self.sample_size)
+        )
+        return sys.getsizeof(data) + self._extrapolate(sample_size, len(data))
+
+    def estimate_collection_size(self, data) -> int:
+        sample_size: int = sum(
+            self.estimate(item) for item in islice(data, self.sample_size)
+        )
+        return sys.getsizeof(data) + self._extrapolate(sample_size, len(data))
+
+    def _extrapolate(self, sample_size: int, length: int) -> int:
+        sampled_items: int = min(length, self.sample_size)
+        if not sampled_items:
+            return 0
+        return sample_size * length // sampled_items
+
+    def get_stats(self) -> dict:
+        return {"calls": self.calls, "total_time": self.total_time}
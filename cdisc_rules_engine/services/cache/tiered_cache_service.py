@@ -0,0 +1,182 @@
+import pickle
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
+
+from cdisc_rules_engine.interfaces import CacheServiceInterface
+from cdisc_rules_engine.utilities.utils import (
+    get_dataset_fingerprint,
+    get_dataset_path_from_cache_key,
+)
+
+from .size_estimators import SizeEstimator
+
+DEFAULT_L1_CACHE_MAX_SIZE: int = 512 * 1024 * 1024
+
+
+def _freeze_dataframe(data: pd.DataFrame):
+    """
+    Makes the column buffers of the frame read-only,
+    so writing into them raises instead of changing the cached data.
+    """
+    for block in data._mgr.blocks:
+        values = block.values
+        for array in (
+            values,
+            getattr(values, "_ndarray", None),
+            getattr(values, "_codes", None),
+            getattr(values, "_data", None),
+            getattr(values, "_mask", None),
+        ):
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+
+
+class TieredCacheService(CacheServiceInterface):
+    """
+    Two-tier cache. A bounded LRU local to the process (L1)
+    sits in front of a shared cache (L2), usually a proxy to
+    the cache held by the SyncManager process.
+
+    An L1 hit is a dictionary lookup and does not pickle the data
+    across the manager pipe. Entries whose key refers to a dataset
+    file are stored with the file fingerprint and dropped from L1
+    when the file changes. Fingerprints are read once per file
+    until refresh_fingerprints is called, at the start of each task.
+
+    Callers get their own copy of the data, as they did from the manager:
+    DataFrames are returned as shallow copies of a frame with read-only
+    column buffers, other values are kept pickled and unpickled on read.
+    A DataFrame passed to add is copied into L1 and stays writable.
+    """
+
+    @classmethod
+    def get_instance(cls, **kwargs):
+        return cls(**kwargs)
+
+    def __init__(
+        self,
+        shared_cache: CacheServiceInterface,
+        max_size: int = DEFAULT_L1_CACHE_MAX_SIZE,
+        size_estimator: Callable[[Any], int] = None,
+        **kwargs,
+    ):
+        self.shared_cache = shared_cache
+        self.max_size = max_size
+        self.size_estimator = size_estimator or SizeEstimator()
+        # entries are (fingerprint, data) pairs
+        self.local_cache = LRUCache(
+            maxsize=self.max_size, getsizeof=lambda entry: self.size_estimator(entry[1])
+        )
+        self._fingerprints: Dict[str, Any] = {}
+
+    def refresh_fingerprints(self):
+        """
+        Forgets the fingerprints read so far, so the next read of each
+        dataset entry checks the file again.
+        """
+        self._fingerprints.clear()
+
+    def _get_fingerprint(self, cache_key: str):
+        dataset_path = get_dataset_path_from_cache_key(cache_key)
+        if not dataset_path:
+            return None
+        if dataset_path not in self._fingerprints:
+            self._fingerprints[dataset_path] = get_dataset_fingerprint(dataset_path)
+        return self._fingerprints[dataset_path]
+
+    def _add_local(self, cache_key, data):
+        if self.max_size <= 0 or data is None:
+            return
+        if isinstance(data, pd.DataFrame):
+            _freeze_dataframe(data)
+        else:
+            try:
+                data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                # kept in the shared cache only
+                return
+        try:
+            self.local_cache[cache_key] = (self._get_fingerprint(cache_key), data)
+        except ValueError:
+            # the value is larger than the whole L1 cache
+            pass
+
+    def _get_local_entry(self, cache_key):
+        entry = self.local_cache.get(cache_key)
+        if entry is None:
+            return None
+        fingerprint, data = entry
+        if fingerprint != self._get_fingerprint(cache_key):
+            self.local_cache.pop(cache_key, None)
+            return None
+        return data
+
+    def _get_local(self, cache_key):
+        data = self._get_local_entry(cache_key)
+        if data is None:
+            return None
+        if isinstance(data, pd.DataFrame):
+            return data.copy(deep=False)
+        return pickle.loads(data)
+
+    def add(self, cache_key, data):
+        # the caller keeps a writable frame, L1 freezes its own buffers
+        local_data = data.copy() if isinstance(data, pd.DataFrame) else data
+        self._add_local(cache_key, local_data)
+        self.shared_cache.add(cache_key, data)
+
+    def add_batch(
+        self,
+        items: List[dict],
+        cache_key_name: str,
+        pop_cache_key: bool = False,
+        prefix: str = "",
+    ):
+        self.shared_cache.add_batch(items, cache_key_name, pop_cache_key, prefix)
+
+    def get(self, cache_key):
+        data = self._get_local(cache_key)
+        if data is not None:
+            return data
+        data = self.shared_cache.get(cache_key)
+        self._add_local(cache_key, data)
+        return data.copy(deep=False) if isinstance(data, pd.DataFrame) else data
+
+    def get_all(self, cache_keys: List[str]):
+        return [self.get(key) for key in cache_keys]
+
+    def get_all_by_prefix(self, prefix):
+        return self.shared_cache.get_all_by_prefix(prefix)
+
+    def filter_cache(self, prefix: str) -> dict:
+        return self.shared_cache.filter_cache(prefix)
+
+    def get_by_regex(self, regex: str) -> dict:
+        return self.shared_cache.get_by_regex(regex)
+
+    def exists(self, cache_key):
+        return self._get_local_entry(cache_key) is not None or self.shared_cache.exists(
+            cache_key
+        )
+
+    def clear(self, cache_key):
+        self.local_cache.pop(cache_key, None)
+        self.shared_cache.clear(cache_key)
+
+    def clear_all(self, prefix: str = None):
+        if prefix:
+            keys_to_remove = [
+                key for key in self.local_cache.keys() if key.startswith(prefix)
+            ]
+            for key in keys_to_remove:
+                self.local_cache.pop(key, None)
+        else:
+            self.local_cache.clear()
+        self.shared_cache.clear_all(prefix)
+
+    def add_all(self, data: dict):
+        for key, val in data.items():
+            self.add(key, val)
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional
+
+from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.utilities.utils import get_dataset_fingerprint
+
+# Older SQLite versions limit the number of query parameters to 999.
+_MAX_KEYS_PER_QUERY: int = 500
+_READ_BLOCK_SIZE: int = 1024 * 1024
+
+
+class ValidationResultStore:
+    """
+    Persistent store of the results of earlier validations.
+
+    Results are kept in a SQLite file as pickled values keyed by
+    a digest of everything the result depends on, so a result
+    can be reused when none of its inputs has changed.
+    The store also keeps the content digests of the files it has seen,
+    keyed by file path, size and modification time,
+    so unchanged files are not read again to compute their digest.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        directory: str = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+        with closing(sqlite3.connect(self.file_path)) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_digests (path TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, modification_time INTEGER NOT NULL, "
+                "digest TEXT NOT NULL)"
+            )
+            connection.commit()
+
+    @staticmethod
+    def get_key(*parts: Any) -> str:
+        """
+        Returns a digest of the given parts,
+        which have to be serializable with repr.
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def get_file_digest(self, file_path: str) -> Optional[str]:
+        """
+        Returns a digest of the file contents,
+        or None if the file does not exist.
+        """
+        fingerprint = get_dataset_fingerprint(file_path)
+        if fingerprint is None:
+            return None
+        size, modification_time = fingerprint
+        path: str = os.path.abspath(file_path)
+        with closing(sqlite3.connect(self.file_path)) as connection:
+            row = connection.execute(
+                "SELECT digest FROM file_digests WHERE path = ? "
+                "AND size = ? AND modification_time = ?",
+                (path, size, modification_time),
+            ).fetchone()
+            if row:
+                return row[0]
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(_READ_BLOCK_SIZE), b""):
+                    digest.update(block)
+            connection.execute(
+                "INSERT OR REPLACE INTO file_digests VALUES (?, ?, ?, ?)",
+                (path, size, modification_time, digest.hexdigest()),
+            )
+            connection.commit()
+        return digest.hexdigest()
+
+    def get_path_digest(self, path: Optional[str]) -> Any:
+        """
+        Returns a digest of a file or of all files in a directory.
+        """
+        if not path or not os.path.isdir(path):
+            return self.get_file_digest(path) if path else None
+        return tuple(
+            (
+                os.path.relpath(os.path.join(directory, file_name), path),
+                self.get_file_digest(os.path.join(directory, file_name)),
+            )
+            for directory, _, file_names in sorted(os.walk(path))
+            for file_name in sorted(file_names)
+        )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys: List[str] = list(keys)
+        values: Dict[str, Any] = {}
+        with closing(sqlite3.connect(self.file_path)) as connection:
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                batch: List[str] = keys[start : start + _MAX_KEYS_PER_QUERY]
+                rows = connection.execute(
+                    "SELECT key, value FROM results "
+                    f"WHERE key IN ({', '.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for key, value in rows:
+                    try:
+                        values[key] = pickle.loads(value)
+                    except Exception as e:
+                        # the result is computed again
+                        logger.warning(f"Could not load a stored result: {e}")
+        return values
+
+    def add_many(self, items: Dict[str, Any]):
+        with closing(sqlite3.connect(self.file_path)) as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?)",
+                ((key, pickle.dumps(value)) for key, value in items.items()),
+            )
+            connection.commit()
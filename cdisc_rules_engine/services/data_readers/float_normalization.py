@@ -0,0 +1,65 @@
+"""
+This module contains the numeric normalization applied
+to the datasets by all data readers.
+"""
+import numpy as np
+import pandas as pd
+
+FLOAT_DECIMALS: int = 15
+_SCALE: float = 10.0**FLOAT_DECIMALS
+# Doubles with the absolute value of at least 8 are not changed by round(x, 15):
+# their spacing is larger than 10 ** -15, so the nearest double
+# to x rounded to 15 decimals is x itself.
+_UNCHANGED_LIMIT: float = 8.0
+# Dekker's splitter for the double precision.
+_SPLITTER: float = 2.0**27 + 1
+
+
+def _split(values: np.ndarray):
+    scaled = values * _SPLITTER
+    high = scaled - (scaled - values)
+    return high, values - high
+
+
+_SCALE_HIGH, _SCALE_LOW = _split(np.float64(_SCALE))
+
+
+def round_floats(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of applying round(x, 15) to every value.
+
+    numpy.round scales the values by 10 ** 15 in floating point,
+    which is off by one ulp for some values. Here the scaled value
+    is computed exactly as a sum of two doubles, so the results match
+    the correctly rounded Python round for every value.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = values.copy()
+    mask = np.abs(values) < _UNCHANGED_LIMIT
+    small = values[mask]
+    # exact product small * 10 ** 15 == product + error
+    product = small * _SCALE
+    high, low = _split(small)
+    error = (
+        (high * _SCALE_HIGH - product) + high * _SCALE_LOW + low * _SCALE_HIGH
+    ) + low * _SCALE_LOW
+    rounded = np.rint(product)
+    # np.rint rounds half to even, the error only matters for exact halves
+    remainder = product - rounded
+    away_from_even = (np.abs(remainder) == 0.5) & (np.sign(error) == np.sign(remainder))
+    rounded[away_from_even] += np.sign(remainder[away_from_even])
+    result[mask] = rounded / _SCALE
+    return result
+
+
+def normalize_floats(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rounds float columns of the dataframe to 15 decimals in place.
+    Object columns are skipped.
+    """
+    for position, dtype in enumerate(dataframe.dtypes):
+        if dtype.kind == "f":
+            dataframe.iloc[:, position] = round_floats(
+                dataframe.iloc[:, position].to_numpy()
+            )
+    return dataframe
@@ -1,50 +1,40 @@
+from typing import Tuple
+
 import pandas as pd
-import os
-import json
 import jsonschema
 
 from cdisc_rules_engine.interfaces import (
     DataReaderInterface,
 )
+from cdisc_rules_engine.services.data_readers.float_normalization import (
+    normalize_floats,
+)
+from cdisc_rules_engine.services.datasetjson_metadata_reader import (
+    DatasetJSONMetadataReader,
+)
+from cdisc_rules_engine.services.datasetjson_parser import DatasetJSONParser
 
 
 class DatasetJSONReader(DataReaderInterface):
     def from_file(self, file_path):
-        # Load Dataset-JSON Schema
-        with open(
-            os.path.join("resources", "schema", "dataset.schema.json")
-        ) as schemajson:
-            schema = schemajson.read()
-        schema = json.loads(schema)
-
-        with open(file_path, "r") as file:
-            datasetjson = json.load(file)
-
         try:
-            jsonschema.validate(datasetjson, schema)
-            if "clinicalData" in datasetjson:
-                data_key = "clinicalData"
-            elif "referenceData" in datasetjson:
-                data_key = "referenceData"
-
-            items_data = next(
-                (
-                    d
-                    for d in datasetjson[data_key]["itemGroupData"].values()
-                    if "items" in d
-                ),
-                {},
-            )
-            df = pd.DataFrame(
-                [item[1:] for item in items_data.get("itemData", [])],
-                columns=[item["name"] for item in items_data.get("items", [])[1:]],
-            )
-
-            df = df.applymap(lambda x: round(x, 15) if isinstance(x, float) else x)
-
-            return df
+            _, _, df = DatasetJSONParser(file_path).read()
         except jsonschema.exceptions.ValidationError:
             return pd.DataFrame()
+        return normalize_floats(df)
+
+    def from_file_with_metadata(
+        self, file_path: str, file_name: str
+    ) -> Tuple[pd.DataFrame, dict]:
+        """
+        Parses the file once and returns the dataset
+        together with its contents metadata.
+        """
+        metadata, df = DatasetJSONMetadataReader(
+            file_path, file_name
+        ).read_with_dataset()
+        df = normalize_floats(df)
+        return df, metadata
 
     def read(self, data):
         pass
@@ -1,22 +1,39 @@
 from io import BytesIO
+from typing import Tuple
 
 import pandas as pd
 
 from cdisc_rules_engine.interfaces import (
     DataReaderInterface,
 )
+from cdisc_rules_engine.services.data_readers.float_normalization import (
+    normalize_floats,
+)
+from cdisc_rules_engine.services.datasetxpt_metadata_reader import (
+    DatasetXPTMetadataReader,
+)
 
 
 class XPTReader(DataReaderInterface):
     def read(self, data):
         df = pd.read_sas(BytesIO(data), format="xport", encoding="utf-8")
-        df = self._format_floats(df)
+        df = normalize_floats(df)
         return df
 
     def from_file(self, file_path):
         df = pd.read_sas(file_path, format="xport", encoding="utf-8")
-        df = self._format_floats(df)
+        df = normalize_floats(df)
         return df
 
-    def _format_floats(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        return dataframe.applymap(lambda x: round(x, 15) if isinstance(x, float) else x)
+    def from_file_with_metadata(
+        self, file_path: str, file_name: str
+    ) -> Tuple[pd.DataFrame, dict]:
+        """
+        Decodes the file once and returns the dataset
+        together with its contents metadata.
+        """
+        metadata, df = DatasetXPTMetadataReader(
+            file_path, file_name
+        ).read_with_dataset()
+        df = normalize_floats(df)
+        return df, metadata
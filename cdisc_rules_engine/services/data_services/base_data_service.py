@@ -143,6 +143,47 @@ class BaseDataService(DataServiceInterface, ABC):
 
     def get_dataset_class(
         self, dataset: pd.DataFrame, file_path: str, datasets: List[dict], domain: str
+    ) -> Optional[str]:
+        return self._get_dataset_class(
+            dataset, file_path, datasets, domain, self.get_dataset
+        )
+
+    def get_dataset_class_from_metadata(
+        self, file_path: str, datasets: List[dict], domain: str
+    ) -> Optional[str]:
+        """
+        Same as get_dataset_class, but classes that are not in the library
+        are detected from dataset previews, without reading the datasets.
+        """
+        return self._get_dataset_class(
+            self.get_dataset_preview(dataset_name=file_path),
+            file_path,
+            datasets,
+            domain,
+            self.get_dataset_preview,
+        )
+
+    def prefetch_datasets(self, dataset_paths: Iterable[str]):
+        """
+        Starts reading the datasets in the background, in the given order,
+        so later get_dataset calls don't wait for them.
+        Replaces the datasets passed to an earlier call.
+        Data services that don't prefetch ignore the call.
+        """
+
+    def get_dataset_preview(self, dataset_name: str) -> pd.DataFrame:
+        """
+        Returns the columns of a dataset with its first record.
+        """
+        return self.get_dataset(dataset_name=dataset_name).head(1)
+
+    def _get_dataset_class(
+        self,
+        dataset: pd.DataFrame,
+        file_path: str,
+        datasets: List[dict],
+        domain: str,
+        read_dataset: Callable,
     ) -> Optional[str]:
         if self.standard is None or self.version is None:
             raise Exception("Missing standard and version data")
@@ -154,7 +195,9 @@ class BaseDataService(DataServiceInterface, ABC):
         if name:
             return convert_library_class_name_to_ct_class(name)
 
-        return self._handle_special_cases(dataset, domain, file_path, datasets)
+        return self._handle_special_cases(
+            dataset, domain, file_path, datasets, read_dataset
+        )
 
     def _get_standard_data(self):
         return (
@@ -164,7 +207,9 @@ class BaseDataService(DataServiceInterface, ABC):
             )
         )
 
-    def _handle_special_cases(self, dataset, domain, file_path, datasets):
+    def _handle_special_cases(
+        self, dataset, domain, file_path, datasets, read_dataset: Callable
+    ):
         if self._contains_topic_variable(dataset, "TERM"):
             return EVENTS
         if self._contains_topic_variable(dataset, "TRT"):
@@ -177,7 +222,7 @@ class BaseDataService(DataServiceInterface, ABC):
             return FINDINGS
         if self._is_associated_persons(dataset):
             return self._get_associated_persons_inherit_class(
-                dataset, file_path, datasets
+                dataset, file_path, datasets, read_dataset
             )
         return None
 
@@ -192,7 +237,7 @@ class BaseDataService(DataServiceInterface, ABC):
         )
 
     def _get_associated_persons_inherit_class(
-        self, dataset, file_path, datasets: List[dict]
+        self, dataset, file_path, datasets: List[dict], read_dataset: Callable
     ):
         """
         Check with inherit class AP-- belongs to.
@@ -207,13 +252,17 @@ class BaseDataService(DataServiceInterface, ABC):
             if domain_details:
                 file_name = domain_details["filename"]
                 new_file_path = os.path.join(directory_path, file_name)
-                new_domain_dataset = self.get_dataset(dataset_name=new_file_path)
+                new_domain_dataset = read_dataset(dataset_name=new_file_path)
             else:
                 raise ValueError("Filename for domain doesn't exist")
             if self._is_associated_persons(new_domain_dataset):
                 raise ValueError("Nested Associated Persons domain reference")
-            return self.get_dataset_class(
-                new_domain_dataset, new_file_path, datasets, domain_details["domain"]
+            return self._get_dataset_class(
+                new_domain_dataset,
+                new_file_path,
+                datasets,
+                domain_details["domain"],
+                read_dataset,
             )
         else:
             return None
@@ -1,4 +1,4 @@
-from typing import Iterable, List, Type
+from typing import Iterable, List, Tuple, Type
 
 from cdisc_rules_engine.dummy_models.dummy_dataset import DummyDataset
 from cdisc_rules_engine.interfaces import (
@@ -8,6 +8,10 @@ from cdisc_rules_engine.interfaces import (
     FactoryInterface,
 )
 
+from cdisc_rules_engine.services.data_readers.data_reader_factory import (
+    DataReaderFactory,
+)
+
 from . import DummyDataService, LocalDataService, USDMDataService
 from cdisc_rules_engine.models.library_metadata_container import (
     LibraryMetadataContainer,
@@ -42,26 +46,41 @@ class DataServiceFactory(FactoryInterface):
         self.library_metadata = library_metadata
 
     def get_data_service(
-        self, dataset_paths: Iterable[str] = []
+        self, dataset_paths: Iterable[str] = [], **kwargs
+    ) -> DataServiceInterface:
+        name, service_kwargs = self._get_data_service_args(dataset_paths, **kwargs)
+        return self.get_service(name, **service_kwargs)
+
+    def create_data_service(
+        self, dataset_paths: Iterable[str] = [], **kwargs
     ) -> DataServiceInterface:
+        """
+        Creates a new data service for the datasets.
+        Unlike get_data_service, the shared instance
+        of the data service class is neither returned nor replaced.
+        """
+        name, service_kwargs = self._get_data_service_args(dataset_paths, **kwargs)
+        return self._registered_services_map[name](
+            cache_service=self.cache_service,
+            reader_factory=DataReaderFactory(),
+            config=self.config,
+            **service_kwargs,
+        )
+
+    def _get_data_service_args(
+        self, dataset_paths: Iterable[str], **kwargs
+    ) -> Tuple[str, dict]:
+        service_kwargs: dict = {
+            "standard": self.standard,
+            "standard_version": self.standard_version,
+            "library_metadata": self.library_metadata,
+            **kwargs,
+        }
         if USDMDataService.is_USDM_data(dataset_paths):
             """Get json file tree to dataset data service"""
-            return self.get_service(
-                "usdm",
-                standard=self.standard,
-                standard_version=self.standard_version,
-                library_metadata=self.library_metadata,
-                dataset_path=dataset_paths[0],
-            )
-        else:
-            """Get local Directory data service"""
-            return self.get_service(
-                "local",
-                standard=self.standard,
-                standard_version=self.standard_version,
-                library_metadata=self.library_metadata,
-                dataset_paths=dataset_paths,
-            )
+            return "usdm", {**service_kwargs, "dataset_path": dataset_paths[0]}
+        """Get local Directory data service"""
+        return "local", {**service_kwargs, "dataset_paths": dataset_paths}
 
     def get_dummy_data_service(self, data: List[DummyDataset]) -> DataServiceInterface:
         return self.get_service(
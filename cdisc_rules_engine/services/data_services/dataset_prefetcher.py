@@ -0,0 +1,110 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+from cdisc_rules_engine.services import logger
+
+DEFAULT_PREFETCH_MEMORY_BUDGET: int = 256 * 1024 * 1024
+DEFAULT_PREFETCH_THREADS: int = 2
+
+
+class DatasetPrefetcher:
+    """
+    Reads the datasets a validation is going to use on background threads,
+    so reading the next dataset overlaps with validating the current one.
+
+    The caller schedules the dataset paths in the order it will read them
+    and takes each dataset with pop. Prefetched datasets that were
+    not taken yet are bounded by a memory budget, estimated from
+    the sizes of their files. The prefetcher is not thread-safe,
+    only its loads run on the background threads.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[str], Any],
+        memory_budget: int = DEFAULT_PREFETCH_MEMORY_BUDGET,
+        max_workers: int = DEFAULT_PREFETCH_THREADS,
+    ):
+        self.load = load
+        self.memory_budget = memory_budget
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._upcoming: Deque[str] = deque()
+        self._futures: Dict[str, Future] = {}
+        self._sizes: Dict[str, int] = {}
+
+    @property
+    def prefetched_size(self) -> int:
+        return sum(self._sizes.values())
+
+    def schedule(self, dataset_paths: Iterable[str]):
+        """
+        Replaces the datasets to prefetch. Datasets prefetched
+        for an earlier schedule and not in this one are dropped.
+        """
+        dataset_paths = list(dict.fromkeys(dataset_paths))
+        for dataset_path in set(self._futures) - set(dataset_paths):
+            self._drop(dataset_path)
+        self._upcoming = deque(
+            dataset_path
+            for dataset_path in dataset_paths
+            if dataset_path not in self._futures
+        )
+        self._submit()
+
+    def pop(self, dataset_path: str) -> Optional[Any]:
+        """
+        Returns the loaded dataset, waiting for its load to finish,
+        or None if the dataset is not prefetched or could not be loaded.
+        """
+        if dataset_path in self._upcoming:
+            self._upcoming.remove(dataset_path)
+        future: Optional[Future] = self._futures.get(dataset_path)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            # the caller loads it again and gets the error
+            logger.info(f"Could not prefetch dataset {dataset_path}: {e}")
+            return None
+        finally:
+            self._drop(dataset_path)
+            self._submit()
+
+    def close(self):
+        self.schedule([])
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _drop(self, dataset_path: str):
+        self._futures.pop(dataset_path).cancel()
+        self._sizes.pop(dataset_path)
+
+    def _submit(self):
+        while self._upcoming:
+            dataset_path: str = self._upcoming[0]
+            size: int = self._get_file_size(dataset_path)
+            if size > self.memory_budget:
+                # read by the caller when it needs it
+                self._upcoming.popleft()
+                continue
+            if self.prefetched_size + size > self.memory_budget:
+                return
+            self._upcoming.popleft()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="dataset-prefetch"
+                )
+            self._futures[dataset_path] = self._executor.submit(self.load, dataset_path)
+            self._sizes[dataset_path] = size
+
+    @staticmethod
+    def _get_file_size(dataset_path: str) -> int:
+        try:
+            return os.path.getsize(dataset_path)
+        except OSError:
+            return 0
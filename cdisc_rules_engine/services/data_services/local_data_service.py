@@ -1,6 +1,6 @@
 import os
 from io import IOBase
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
 import pandas
 
@@ -13,17 +13,22 @@ from cdisc_rules_engine.models.variable_metadata_container import (
 from cdisc_rules_engine.services.data_readers.data_reader_factory import (
     DataReaderFactory,
 )
+from cdisc_rules_engine.services.data_readers.json_reader import DatasetJSONReader
+from cdisc_rules_engine.services.data_readers.xpt_reader import XPTReader
 from cdisc_rules_engine.services.datasetxpt_metadata_reader import (
     DatasetXPTMetadataReader,
 )
 from cdisc_rules_engine.services.datasetjson_metadata_reader import (
     DatasetJSONMetadataReader,
 )
+from cdisc_rules_engine.services.cache.dataset_file_cache import DatasetFileCache
 from cdisc_rules_engine.utilities.utils import (
     convert_file_size,
     extract_file_name_from_path_string,
+    get_dataset_cache_key_from_path,
 )
 from .base_data_service import BaseDataService, cached_dataset
+from .dataset_prefetcher import DEFAULT_PREFETCH_MEMORY_BUDGET, DatasetPrefetcher
 from cdisc_rules_engine.enums.dataformat_types import DataFormatTypes
 
 
@@ -41,6 +46,12 @@ class LocalDataService(BaseDataService):
             cache_service, reader_factory, config, **kwargs
         )
         self.dataset_paths: Iterable[str] = kwargs.get("dataset_paths", [])
+        dataset_cache_path: Optional[str] = kwargs.get("dataset_cache_path")
+        self.dataset_file_cache: Optional[DatasetFileCache] = (
+            DatasetFileCache(dataset_cache_path) if dataset_cache_path else None
+        )
+        # created when datasets are first prefetched
+        self.prefetcher: Optional[DatasetPrefetcher] = None
 
     @classmethod
     def get_instance(
@@ -69,12 +80,64 @@ class LocalDataService(BaseDataService):
 
     @cached_dataset(DatasetTypes.CONTENTS.value)
     def get_dataset(self, dataset_name: str, **params) -> pandas.DataFrame:
+        loaded = self.prefetcher.pop(dataset_name) if self.prefetcher else None
+        df, contents_metadata = loaded or self._load_dataset(dataset_name)
+        if contents_metadata is not None:
+            # the file is decoded once, keep the metadata for later requests
+            self.cache_service.add(
+                get_dataset_cache_key_from_path(
+                    dataset_name, DatasetTypes.CONTENTS_METADATA.value
+                ),
+                contents_metadata,
+            )
+        return df
+
+    def prefetch_datasets(self, dataset_paths: Iterable[str]):
+        if self.prefetcher is None:
+            memory_budget = int(
+                self._config.getValue("PREFETCH_MEMORY_BUDGET")
+                or DEFAULT_PREFETCH_MEMORY_BUDGET
+            )
+            if memory_budget <= 0:
+                return
+            self.prefetcher = DatasetPrefetcher(self._load_dataset, memory_budget)
+        # cached datasets are not read again
+        self.prefetcher.schedule(
+            dataset_path
+            for dataset_path in dataset_paths
+            if not self.cache_service.exists(
+                get_dataset_cache_key_from_path(
+                    dataset_path, DatasetTypes.CONTENTS.value
+                )
+            )
+        )
+
+    def _load_dataset(
+        self, dataset_name: str
+    ) -> Tuple[pandas.DataFrame, Optional[dict]]:
+        """
+        Reads the dataset and, for .xpt and Dataset-JSON files,
+        its contents metadata. Doesn't use the cache service,
+        so it can run on the threads of the prefetcher.
+        """
+        df = (
+            self.dataset_file_cache.get(dataset_name)
+            if self.dataset_file_cache
+            else None
+        )
+        if df is not None:
+            self._replace_nans_in_numeric_cols_with_none(df)
+            return df, None
         reader = self._reader_factory.get_service(
             extract_file_name_from_path_string(dataset_name).split(".")[1].upper()
         )
+        if isinstance(reader, (XPTReader, DatasetJSONReader)):
+            return self._read_file_with_metadata(reader, dataset_name)
         df = reader.from_file(dataset_name)
+        if self.dataset_file_cache:
+            self.dataset_file_cache.add(dataset_name, df)
         self._replace_nans_in_numeric_cols_with_none(df)
-        return df
+        return df, None
 
     @cached_dataset(DatasetTypes.METADATA.value)
     def get_dataset_metadata(
@@ -126,6 +189,20 @@ class LocalDataService(BaseDataService):
         )
         return pandas.DataFrame.from_dict(metadata_to_return.to_representation())
 
+    def get_dataset_preview(self, dataset_name: str) -> pandas.DataFrame:
+        """
+        Returns the columns of a dataset with the DOMAIN value
+        of its first record, built from the contents metadata.
+        """
+        contents_metadata: dict = self._get_contents_metadata(dataset_name=dataset_name)
+        records: int = 1 if contents_metadata["dataset_length"] else 0
+        preview = pandas.DataFrame(
+            {name: [None] * records for name in contents_metadata["variable_names"]}
+        )
+        if records and "DOMAIN" in preview:
+            preview["DOMAIN"] = [contents_metadata["domain_name"]]
+        return preview
+
     @cached_dataset(DatasetTypes.CONTENTS.value)
     def get_define_xml_contents(self, dataset_name: str) -> bytes:
         """
@@ -158,17 +235,37 @@ class LocalDataService(BaseDataService):
             "name": file_name,
             "size": file_size,
         }
+        contents_metadata: dict = self._get_contents_metadata(dataset_name=file_path)
+        return {
+            "file_metadata": file_metadata,
+            "contents_metadata": contents_metadata,
+        }
+
+    @cached_dataset(DatasetTypes.CONTENTS_METADATA.value)
+    def _get_contents_metadata(self, dataset_name: str) -> dict:
+        file_name: str = extract_file_name_from_path_string(dataset_name)
         _metadata_reader_map = {
             DataFormatTypes.XPT.value: DatasetXPTMetadataReader,
             DataFormatTypes.JSON.value: DatasetJSONMetadataReader,
         }
-        contents_metadata = _metadata_reader_map[file_name.split(".")[1].upper()](
-            file_path, file_name
+        return _metadata_reader_map[file_name.split(".")[1].upper()](
+            dataset_name, file_name
         ).read()
-        return {
-            "file_metadata": file_metadata,
-            "contents_metadata": contents_metadata,
-        }
+
+    def _read_file_with_metadata(
+        self, reader: Union[XPTReader, DatasetJSONReader], dataset_name: str
+    ) -> Tuple[pandas.DataFrame, dict]:
+        """
+        Reads the contents and the contents metadata
+        of .xpt or Dataset-JSON file in a single pass.
+        """
+        df, contents_metadata = reader.from_file_with_metadata(
+            dataset_name, extract_file_name_from_path_string(dataset_name)
+        )
+        if self.dataset_file_cache:
+            self.dataset_file_cache.add(dataset_name, df)
+        self._replace_nans_in_numeric_cols_with_none(df)
+        return df, contents_metadata
 
     def read_data(self, file_path: str) -> IOBase:
         return open(file_path, "rb")
@@ -1,9 +1,12 @@
-import os
-import json
-import jsonschema
+from typing import Tuple
 
+import jsonschema
+import pandas as pd
 
 from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.services.datasetjson_parser import (
+    DatasetJSONParser,
+)
 from cdisc_rules_engine.services.adam_variable_reader import AdamVariableReader
 
 
@@ -21,95 +24,83 @@ class DatasetJSONMetadataReader:
     def read(self) -> dict:
         """
         Extracts metadata from .json file.
+        The rows are decoded but not collected.
         """
-        # Load Dataset-JSON Schema
-        with open(
-            os.path.join("resources", "schema", "dataset.schema.json")
-        ) as schemajson:
-            schema = schemajson.read()
-        schema = json.loads(schema)
-
-        with open(self._file_path, "r") as file:
-            datasetjson = json.load(file)
-
         try:
-            jsonschema.validate(datasetjson, schema)
-
-            if "clinicalData" in datasetjson:
-                data_key = "clinicalData"
-            elif "referenceData" in datasetjson:
-                data_key = "referenceData"
-
-            items_data = next(
-                (
-                    d
-                    for d in datasetjson[data_key]["itemGroupData"].values()
-                    if "items" in d
-                ),
-                {},
-            )
-
-            self._domain_name = self._extract_domain_name(items_data)
-
-            self._metadata_container = {
-                "variable_labels": [
-                    item["label"] for item in items_data.get("items", [])[1:]
-                ],
-                "variable_names": [
-                    item["name"] for item in items_data.get("items", [])[1:]
-                ],
-                "variable_formats": [
-                    item.get("displayFormat", "")
-                    for item in items_data.get("items", [])[1:]
-                ],
-                "variable_name_to_label_map": {
-                    item["name"]: item["label"]
-                    for item in items_data.get("items", [])[1:]
-                },
-                "variable_name_to_data_type_map": {
-                    item["name"]: item["type"]
-                    for item in items_data.get("items", [])[1:]
-                },
-                "variable_name_to_size_map": {
-                    item["name"]: item.get("length", None)
-                    for item in items_data.get("items", [])[1:]
-                },
-                "number_of_variables": len(items_data.get("items", [])[1:]),
-                "dataset_label": items_data.get("label"),
-                "dataset_length": items_data.get("records"),
-                "domain_name": self._domain_name,
-                "dataset_name": items_data.get("name"),
-                "dataset_modification_date": datasetjson["creationDateTime"],
-            }
-            self._convert_variable_types()
-
-            self._metadata_container["adam_info"] = self._extract_adam_info(
-                self._metadata_container["variable_names"]
-            )
-            logger.info(
-                f"Extracted dataset metadata. metadata={self._metadata_container}"
-            )
-
-            return self._metadata_container
+            document, items_data = DatasetJSONParser(self._file_path).read_header()
+        except jsonschema.exceptions.ValidationError:
+            return self._get_empty_metadata()
+        return self._build_metadata(document, items_data)
 
+    def read_with_dataset(self) -> Tuple[dict, pd.DataFrame]:
+        """
+        Parses .json file once and returns both
+        the metadata and the dataset contents.
+        """
+        try:
+            document, items_data, dataset = DatasetJSONParser(self._file_path).read()
         except jsonschema.exceptions.ValidationError:
-            logger.warning(
-                f"{str(self._file_path)} is not compliant with Dataset-JSON schema"
-            )
-            return {
-                "variable_labels": [],
-                "variable_names": [],
-                "variable_formats": [],
-                "variable_name_to_label_map": {},
-                "variable_name_to_data_type_map": {},
-                "variable_name_to_size_map": {},
-                "number_of_variables": 0,
-                "dataset_label": "",
-                "dataset_length": 0,
-                "domain_name": "",
-                "dataset_name": "",
-                "dataset_modification_date": "",
-            }
+            return self._get_empty_metadata(), pd.DataFrame()
+        return self._build_metadata(document, items_data), dataset
+
+    def _build_metadata(self, document: dict, items_data: dict) -> dict:
+        self._domain_name = self._extract_domain_name(items_data)
+
+        self._metadata_container = {
+            "variable_labels": [
+                item["label"] for item in items_data.get("items", [])[1:]
+            ],
+            "variable_names": [
+                item["name"] for item in items_data.get("items", [])[1:]
+            ],
+            "variable_formats": [
+                item.get("displayFormat", "")
+                for item in items_data.get("items", [])[1:]
+            ],
+            "variable_name_to_label_map": {
+                item["name"]: item["label"] for item in items_data.get("items", [])[1:]
+            },
+            "variable_name_to_data_type_map": {
+                item["name"]: item["type"] for item in items_data.get("items", [])[1:]
+            },
+            "variable_name_to_size_map": {
+                item["name"]: item.get("length", None)
+                for item in items_data.get("items", [])[1:]
+            },
+            "number_of_variables": len(items_data.get("items", [])[1:]),
+            "dataset_label": items_data.get("label"),
+            "dataset_length": items_data.get("records"),
+            "domain_name": self._domain_name,
+            "dataset_name": items_data.get("name"),
+            "dataset_modification_date": document["creationDateTime"],
+        }
+        self._convert_variable_types()
+
+        self._metadata_container["adam_info"] = self._extract_adam_info(
+            self._metadata_container["variable_names"]
+        )
+        logger.info(f"Extracted dataset metadata. metadata={self._metadata_container}")
+
+        return self._metadata_container
+
+    def _get_empty_metadata(self) -> dict:
+        logger.warning(
+            f"{str(self._file_path)} is not compliant with Dataset-JSON schema"
+        )
+        return {
+            "variable_labels": [],
+            "variable_names": [],
+            "variable_formats": [],
+            "variable_name_to_label_map": {},
+            "variable_name_to_data_type_map": {},
+            "variable_name_to_size_map": {},
+            "number_of_variables": 0,
+            "dataset_label": "",
+            "dataset_length": 0,
+            "domain_name": "",
+            "dataset_name": "",
+            "dataset_modification_date": "",
+        }
 
     def _extract_domain_name(self, data):
         index_domain = next(
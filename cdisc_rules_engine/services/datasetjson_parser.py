@@ -0,0 +1,332 @@
+import json
+import os
+import re
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, Iterator, List, Optional, Tuple
+
+import jsonschema
+import pandas as pd
+
+from cdisc_rules_engine.config import config
+from cdisc_rules_engine.enums.dataset_json_validation_options import (
+    DatasetJSONValidationOptions,
+)
+
+DATASET_JSON_SCHEMA_PATH: str = os.path.join(
+    "resources", "schema", "dataset.schema.json"
+)
+DATA_KEYS: Tuple[str, ...] = ("clinicalData", "referenceData")
+DEFAULT_VALIDATION_SAMPLE_SIZE: int = 100
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+ROW_BATCH_SIZE: int = 10000
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@lru_cache(maxsize=None)
+def get_dataset_json_validators(
+    schema_path: str = DATASET_JSON_SCHEMA_PATH,
+) -> Tuple[jsonschema.Validator, jsonschema.Validator]:
+    """
+    Compiles the Dataset-JSON schema once per process.
+    Returns validators of the whole document and of a single itemData row.
+    """
+    with open(schema_path) as schema_file:
+        schema: dict = json.load(schema_file)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    row_schema: dict = {
+        **schema["definitions"]["ItemDataArray"],
+        "definitions": schema["definitions"],
+    }
+    return validator_class(schema), validator_class(row_schema)
+
+
+class _JSONStream:
+    """
+    Reads JSON text from a file in chunks.
+    Values are decoded one by one with json.JSONDecoder.raw_decode,
+    the containers on the way to them can be iterated instead.
+    """
+
+    def __init__(self, file, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer: str = ""
+        self._position: int = 0
+        self._eof: bool = False
+        self._decoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character,
+        empty string at the end of the file.
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or not self._read_chunk():
+                return self._buffer[self._position : self._position + 1]
+
+    def expect(self, character: str):
+        if self.peek() != character:
+            raise json.JSONDecodeError(
+                f"Expecting '{character}'", self._buffer, self._position
+            )
+        self._position += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # a number at the end of the buffer can continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read_chunk()
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yields keys of an object, the caller must consume each value.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.peek() != ",":
+                self.expect("}")
+                return
+            self._position += 1
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Yields once per element of an array, the caller must consume the element.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield
+            if self.peek() != ",":
+                self.expect("]")
+                return
+            self._position += 1
+
+    def _read_chunk(self) -> bool:
+        if self._eof:
+            return False
+        chunk: str = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+
+class _ItemData:
+    """
+    Collects itemData rows into column buffers.
+    """
+
+    def __init__(self, read_rows: bool, sample_size: int, row_validator=None):
+        self.read_rows = read_rows
+        self.sample_size = sample_size
+        self.row_validator = row_validator
+        self.sample: List[list] = []
+        self.columns: List[list] = []
+        self.length: int = 0
+        self._batch: List[list] = []
+
+    def append(self, row: Any):
+        if len(self.sample) < self.sample_size:
+            self.sample.append(row)
+        elif self.row_validator:
+            self.row_validator.validate(row)
+        if not isinstance(row, list):
+            raise jsonschema.exceptions.ValidationError(
+                f"{row!r} is not of type 'array'"
+            )
+        self.length += 1
+        if self.read_rows:
+            self._batch.append(row)
+            if len(self._batch) >= ROW_BATCH_SIZE:
+                self.flush()
+
+    def flush(self):
+        """
+        Moves the batch of rows to the column buffers.
+        The first value of a row is the record identifier and is dropped.
+        """
+        if not self._batch:
+            return
+        previous_length: int = self.length - len(self._batch)
+        batch_columns = list(zip_longest(*self._batch))[1:]
+        for index, values in enumerate(batch_columns):
+            if index == len(self.columns):
+                self.columns.append([None] * previous_length)
+            self.columns[index].extend(values)
+        for column in self.columns[len(batch_columns) :]:
+            column.extend([None] * len(self._batch))
+        self._batch = []
+
+
+class DatasetJSONParser:
+    """
+    Incremental parser of Dataset-JSON files.
+
+    The file is read in chunks and itemData rows are decoded one by one
+    into column buffers, the whole document is never built as Python objects.
+
+    Structural validation is controlled by the validation option:
+        full - the header and every row are validated;
+        sample - the header and the first sample_size rows are validated;
+        none - the file is not validated.
+    The option defaults to the DATASET_JSON_VALIDATION environment variable
+    or to sample. jsonschema.exceptions.ValidationError is raised
+    for invalid files.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        validation: Optional[str] = None,
+        sample_size: int = DEFAULT_VALIDATION_SAMPLE_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self._file_path = file_path
+        self._validation: str = (
+            validation
+            or config.getValue("DATASET_JSON_VALIDATION")
+            or DatasetJSONValidationOptions.SAMPLE.value
+        )
+        if self._validation not in DatasetJSONValidationOptions.values():
+            raise ValueError(
+                f"Dataset-JSON validation must be one of "
+                f"{DatasetJSONValidationOptions.values()}, "
+                f"given validation is {self._validation}"
+            )
+        self._sample_size = sample_size
+        self._chunk_size = chunk_size
+        self._read_rows: bool = True
+        self._item_data: List[_ItemData] = []
+
+    def read(self) -> Tuple[dict, dict, pd.DataFrame]:
+        """
+        Parses the file and returns the document header, the item group
+        with variable descriptions and the dataset.
+        itemData of the returned header contains only the validated sample of rows.
+        """
+        self._read_rows = True
+        document, item_group, item_data = self._parse()
+        names: List[str] = [item["name"] for item in item_group.get("items", [])[1:]]
+        if item_data is None or not item_data.length:
+            return document, item_group, pd.DataFrame(columns=names)
+        item_data.flush()
+        dataset = pd.DataFrame(dict(enumerate(item_data.columns)))
+        dataset.columns = names
+        return document, item_group, dataset
+
+    def read_header(self) -> Tuple[dict, dict]:
+        """
+        Parses the file without collecting the rows.
+        itemData of the returned header contains only the sample of rows.
+        """
+        self._read_rows = False
+        document, item_group, _ = self._parse()
+        return document, item_group
+
+    def _parse(self) -> Tuple[dict, dict, Optional[_ItemData]]:
+        self._item_data = []
+        with open(self._file_path, "r") as file:
+            stream = _JSONStream(file, self._chunk_size)
+            document: dict = self._read_document(stream)
+            if stream.peek():
+                raise json.JSONDecodeError("Extra data", stream.peek(), 0)
+        if self._validation != DatasetJSONValidationOptions.NONE.value:
+            get_dataset_json_validators()[0].validate(document)
+        data_key: Optional[str] = next(
+            (
+                key
+                for key in DATA_KEYS
+                if isinstance(document, dict) and key in document
+            ),
+            None,
+        )
+        if data_key is None:
+            raise jsonschema.exceptions.ValidationError(
+                f"None of {DATA_KEYS} is present in the document"
+            )
+        item_group: dict = next(
+            (
+                group
+                for group in document[data_key]["itemGroupData"].values()
+                if "items" in group
+            ),
+            {},
+        )
+        item_data = next(
+            (
+                data
+                for data in self._item_data
+                if item_group.get("itemData") is data.sample
+            ),
+            None,
+        )
+        return document, item_group, item_data
+
+    def _read_document(self, stream: _JSONStream) -> dict:
+        if stream.peek() != "{":
+            return stream.decode()
+        document: dict = {}
+        for key in stream.iter_object():
+            if key in DATA_KEYS and stream.peek() == "{":
+                document[key] = self._read_data(stream)
+            else:
+                document[key] = stream.decode()
+        return document
+
+    def _read_data(self, stream: _JSONStream) -> dict:
+        data: dict = {}
+        for key in stream.iter_object():
+            if key == "itemGroupData" and stream.peek() == "{":
+                data[key] = {
+                    group_key: self._read_item_group(stream)
+                    if stream.peek() == "{"
+                    else stream.decode()
+                    for group_key in stream.iter_object()
+                }
+            else:
+                data[key] = stream.decode()
+        return data
+
+    def _read_item_group(self, stream: _JSONStream) -> dict:
+        item_group: dict = {}
+        for key in stream.iter_object():
+            if key == "itemData" and stream.peek() == "[":
+                item_group[key] = self._read_item_data(stream).sample
+            else:
+                item_group[key] = stream.decode()
+        return item_group
+
+    def _read_item_data(self, stream: _JSONStream) -> _ItemData:
+        item_data = _ItemData(
+            self._read_rows,
+            self._sample_size,
+            get_dataset_json_validators()[1]
+            if self._validation == DatasetJSONValidationOptions.FULL.value
+            else None,
+        )
+        for _ in stream.iter_array():
+            item_data.append(stream.decode())
+        self._item_data.append(item_data)
+        return item_data
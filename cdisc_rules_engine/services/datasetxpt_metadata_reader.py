@@ -1,12 +1,11 @@
+from typing import List, Tuple
+
 import pandas as pd
-import xport.v56
-from xport import LOG as XPORT_LOG
 
 from cdisc_rules_engine.services import logger
 from cdisc_rules_engine.services.adam_variable_reader import AdamVariableReader
 
-xport.v56.LOG.disabled = True
-XPORT_LOG.disabled = True
+XPT_ENCODING: str = "utf-8"
 
 
 class DatasetXPTMetadataReader:
@@ -18,8 +17,7 @@ class DatasetXPTMetadataReader:
     # TODO. Maybe in future it is worth having multiple constructors
     #  like from_bytes, from_file etc. But now there is no immediate need for that.
     def __init__(self, file_path: str, file_name: str):
-        with open(file_path, "rb") as f:
-            self._file_contents = f.read()
+        self._file_path = file_path
         self._metadata_container = None
         self._domain_name = None
         self._dataset_name = file_name.split(".")[0].upper()
@@ -27,32 +25,32 @@ class DatasetXPTMetadataReader:
     def read(self) -> dict:
         """
         Extracts metadata from binary contents of .xpt file.
+        Only the file headers and the first record are read,
+        the record count is derived from the file size.
         """
-        dataset_container = xport.v56.loads(self._file_contents)
-        dataset_id = next(iter(dataset_container))
-        dataset = dataset_container.get(dataset_id)
-        self._domain_name = self._extract_domain_name(dataset)
-        self._metadata_container = {
-            "variable_labels": list(dataset.contents.Label.values),
-            "variable_names": list(dataset.contents.Variable.values),
-            "variable_formats": list(dataset.contents.Format.values),
-            "variable_name_to_label_map": pd.Series(
-                dataset.contents.Label.values, index=dataset.contents.Variable
-            ).to_dict(),
-            "variable_name_to_data_type_map": pd.Series(
-                dataset.contents.Type.values, index=dataset.contents.Variable
-            ).to_dict(),
-            "variable_name_to_size_map": pd.Series(
-                dataset.contents.Length.values, index=dataset.contents.Variable
-            ).to_dict(),
-            "number_of_variables": len(dataset.columns),
-            "dataset_label": dataset.dataset_label,
-            "dataset_length": dataset.shape[0],
-            "domain_name": self._domain_name,
-            "dataset_name": self._dataset_name,
-            "dataset_modification_date": dataset.modified.isoformat(),
-        }
-        self._domain_name = self._extract_domain_name(dataset)
+        with pd.read_sas(
+            self._file_path, format="xport", encoding=XPT_ENCODING, iterator=True
+        ) as reader:
+            if reader.nobs:
+                self._domain_name = self._extract_domain_name(reader.read(1))
+            self._read_header(reader, reader.nobs)
+        return self._complete_metadata()
+
+    def read_with_dataset(self) -> Tuple[dict, pd.DataFrame]:
+        """
+        Decodes the .xpt file once and returns both
+        the metadata and the dataset contents.
+        The contents are returned as read by pandas.read_sas.
+        """
+        with pd.read_sas(
+            self._file_path, format="xport", encoding=XPT_ENCODING, iterator=True
+        ) as reader:
+            dataset: pd.DataFrame = reader.read()
+            self._domain_name = self._extract_domain_name(dataset)
+            self._read_header(reader, len(dataset))
+        return self._complete_metadata(), dataset
+
+    def _complete_metadata(self) -> dict:
         self._convert_variable_types()
         self._metadata_container["adam_info"] = self._extract_adam_info(
             self._metadata_container["variable_names"]
@@ -60,6 +58,33 @@ class DatasetXPTMetadataReader:
         logger.info(f"Extracted dataset metadata. metadata={self._metadata_container}")
         return self._metadata_container
 
+    def _read_header(self, reader, dataset_length: int):
+        """
+        Builds metadata from the member and variable headers of the file.
+        """
+        names: List[str] = [self._decode(field["name"]) for field in reader.fields]
+        labels: List[str] = [self._decode(field["label"]) for field in reader.fields]
+        self._metadata_container = {
+            "variable_labels": labels,
+            "variable_names": names,
+            "variable_formats": [
+                self._get_variable_format(field) for field in reader.fields
+            ],
+            "variable_name_to_label_map": dict(zip(names, labels)),
+            "variable_name_to_data_type_map": {
+                name: field["ntype"] for name, field in zip(names, reader.fields)
+            },
+            "variable_name_to_size_map": {
+                name: field["field_length"] for name, field in zip(names, reader.fields)
+            },
+            "number_of_variables": len(names),
+            "dataset_label": reader.member_info["label"],
+            "dataset_length": dataset_length,
+            "domain_name": self._domain_name,
+            "dataset_name": self._dataset_name,
+            "dataset_modification_date": reader.member_info["modified"].isoformat(),
+        }
+
     def _extract_domain_name(self, df):
         try:
             first_row = df.iloc[0]
@@ -73,6 +98,20 @@ class DatasetXPTMetadataReader:
             pass
         return None
 
+    @staticmethod
+    def _decode(value: bytes) -> str:
+        return value.decode(XPT_ENCODING).strip() if isinstance(value, bytes) else value
+
+    @classmethod
+    def _get_variable_format(cls, field: dict) -> str:
+        """
+        Returns SAS variable format in the FORMATw.d notation.
+        """
+        name: str = cls._decode(field["nform"])
+        if not (name or field["nfl"] or field["num_decimals"]):
+            return ""
+        return f"{name}{field['nfl']}.{field['num_decimals'] or ''}"
+
     def _convert_variable_types(self):
         """
         Converts variable types to the format that
@@ -81,6 +120,8 @@ class DatasetXPTMetadataReader:
         rule_author_type_map: dict = {
             "string": "Char",
             "double": "Num",
+            "char": "Char",
+            "numeric": "Num",
             "Character": "Char",
             "Numeric": "Num",
         }
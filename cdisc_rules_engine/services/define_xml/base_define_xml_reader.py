@@ -50,6 +50,7 @@ class BaseDefineXMLReader(ABC):
         cache_service_obj=None,
         study_id=None,
         data_bundle_id=None,
+        cache_key_prefix=None,
     ):
         self._odm_loader = ODMLoader(
             XMLDefineLoader(
@@ -60,6 +61,8 @@ class BaseDefineXMLReader(ABC):
         self.cache_service = cache_service_obj
         self.study_id = study_id
         self.data_bundle_id = data_bundle_id
+        # scopes the cached metadata to the Define-XML file it was read from
+        self.cache_key_prefix = cache_key_prefix
 
     @cache
     def get_item_def_map(self) -> dict:
@@ -17,7 +17,10 @@ from cdisc_rules_engine.services.define_xml.define_xml_reader_2_1 import (
 from cdisc_rules_engine.services.define_xml.base_define_xml_reader import (
     BaseDefineXMLReader,
 )
-from cdisc_rules_engine.utilities.utils import get_directory_path
+from cdisc_rules_engine.utilities.utils import (
+    get_define_xml_cache_key_prefix,
+    get_directory_path,
+)
 
 
 class DefineXMLReaderFactory:
@@ -60,6 +63,7 @@ class DefineXMLReaderFactory:
         cache_service_obj=None,
         study_id=None,
         data_bundle_id=None,
+        cache_key_prefix=None,
     ):
         """
         Inits a DefineXMLReader object from file contents.
@@ -69,7 +73,7 @@ class DefineXMLReaderFactory:
             ElementTree.fromstring(file_contents)
         )
         reader: BaseDefineXMLReader = define_xml_reader_class(
-            cache_service_obj, study_id, data_bundle_id
+            cache_service_obj, study_id, data_bundle_id, cache_key_prefix
         )
         reader._odm_loader.load_odm_string(file_contents)
         return reader
@@ -116,8 +120,11 @@ class DefineXMLReaderFactory:
         define_xml_contents: bytes = data_service.get_define_xml_contents(
             dataset_name=define_xml_path
         )
+        # studies validated together may have different Define-XML files
         define_xml_reader = DefineXMLReaderFactory.from_file_contents(
-            define_xml_contents, cache_service_obj=cache
+            define_xml_contents,
+            cache_service_obj=cache,
+            cache_key_prefix=get_define_xml_cache_key_prefix(define_xml_path),
         )
 
         return define_xml_reader
@@ -0,0 +1,15 @@
+from .local_process_executor import LocalProcessExecutor
+from .redis_queue_executor import (
+    RedisQueueExecutor,
+    RedisQueueWorker,
+    run_queue_workers,
+)
+from .task_executor_factory import TaskExecutorFactory
+
+__all__ = [
+    "LocalProcessExecutor",
+    "RedisQueueExecutor",
+    "RedisQueueWorker",
+    "TaskExecutorFactory",
+    "run_queue_workers",
+]
@@ -0,0 +1,27 @@
+from multiprocessing import Pool
+from typing import Any, Callable, Iterator, List
+
+from cdisc_rules_engine.interfaces import TaskExecutorInterface
+
+
+class LocalProcessExecutor(TaskExecutorInterface):
+    """
+    Runs tasks in a pool of processes on this machine.
+    """
+
+    def __init__(self, pool_size: int):
+        self.pool_size = pool_size
+
+    @classmethod
+    def get_instance(cls, pool_size: int = None, **kwargs) -> "LocalProcessExecutor":
+        return cls(pool_size)
+
+    def imap_unordered(
+        self,
+        worker: Callable[[Any], Any],
+        tasks: List[Any],
+        initializer: Callable,
+        initargs: tuple,
+    ) -> Iterator[Any]:
+        with Pool(self.pool_size, initializer=initializer, initargs=initargs) as pool:
+            yield from pool.imap_unordered(worker, tasks, chunksize=1)
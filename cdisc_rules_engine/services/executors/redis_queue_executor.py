@@ -0,0 +1,335 @@
+import math
+import pickle
+import threading
+import time
+import traceback
+import uuid
+from multiprocessing import Process
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import redis
+
+from cdisc_rules_engine.interfaces import ConfigInterface, TaskExecutorInterface
+from cdisc_rules_engine.services import logger
+from version import __version__
+
+DEFAULT_TASK_QUEUE: str = "core:tasks"
+# seconds without any task result after which a validation fails
+DEFAULT_RESULT_TIMEOUT: int = 3600
+# seconds a claimed task is kept by a worker that stopped renewing its claim
+DEFAULT_CLAIM_TIMEOUT: int = 60
+
+
+def get_redis_client(config: ConfigInterface) -> redis.Redis:
+    return redis.Redis(
+        host=config.getValue("REDIS_HOST_NAME"),
+        port=config.getValue("REDIS_PORT") or 6380,
+        db=0,
+        password=config.getValue("REDIS_ACCESS_KEY"),
+        ssl=(config.getValue("REDIS_SSL") or "true").lower() != "false",
+    )
+
+
+def get_claim_timeout(config: ConfigInterface) -> float:
+    return float(config.getValue("REDIS_CLAIM_TIMEOUT") or DEFAULT_CLAIM_TIMEOUT)
+
+
+def get_versioned_queue(queue: str) -> str:
+    """
+    Returns the name of the task list of this engine version,
+    so workers only run tasks of coordinators running the same engine.
+    """
+    return f"{queue}:{__version__}"
+
+
+def _get_job_key(queue: str, job_id: str) -> str:
+    return f"{queue}:jobs:{job_id}"
+
+
+def _get_results_key(queue: str, job_id: str) -> str:
+    return f"{queue}:results:{job_id}"
+
+
+def _get_processing_key(queue: str) -> str:
+    return f"{queue}:processing"
+
+
+def _get_claim_key(queue: str, job_id: str, task_index: int) -> str:
+    return f"{queue}:claims:{job_id}:{task_index}"
+
+
+class RedisQueueExecutor(TaskExecutorInterface):
+    """
+    Runs tasks in worker processes on any node connected to the same Redis.
+
+    The coordinator stores the worker function and the initializer
+    of a job under a job key and pushes the tasks to a Redis list
+    named after the queue and the engine version.
+    Workers started with RedisQueueWorker move the tasks one at a time
+    to a list of tasks in progress, claim them for claim_timeout seconds
+    while they run, and push their results to a list of the job,
+    which the coordinator reads as they arrive.
+    Tasks whose claim has expired, because the worker stopped,
+    are pushed to the queue again by the coordinator.
+    The job key and the results expire unless the coordinator
+    renews them, so the keys of a stopped coordinator are removed.
+    Tasks and results are pickled, so workers must be able to import
+    the code of the coordinator and read the files the tasks refer to,
+    e.g. from a shared filesystem.
+    """
+
+    is_distributed = True
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        queue: str = DEFAULT_TASK_QUEUE,
+        result_timeout: float = DEFAULT_RESULT_TIMEOUT,
+        claim_timeout: float = DEFAULT_CLAIM_TIMEOUT,
+    ):
+        self.client = client
+        self.queue = get_versioned_queue(queue)
+        # seconds to wait for the next result before raising TimeoutError
+        self.result_timeout = result_timeout
+        self.claim_timeout = claim_timeout
+
+    @classmethod
+    def get_instance(
+        cls, config: ConfigInterface = None, **kwargs
+    ) -> "RedisQueueExecutor":
+        return cls(
+            get_redis_client(config),
+            config.getValue("REDIS_TASK_QUEUE") or DEFAULT_TASK_QUEUE,
+            float(config.getValue("REDIS_RESULT_TIMEOUT") or DEFAULT_RESULT_TIMEOUT),
+            get_claim_timeout(config),
+        )
+
+    def _get_key_timeout(self) -> int:
+        """
+        Seconds the keys of a job are kept after the coordinator
+        last renewed them. The coordinator renews them at least
+        every two claim timeouts while it waits for results.
+        """
+        return math.ceil(self.result_timeout + 2 * self.claim_timeout)
+
+    def imap_unordered(
+        self,
+        worker: Callable[[Any], Any],
+        tasks: List[Any],
+        initializer: Callable,
+        initargs: tuple,
+    ) -> Iterator[Any]:
+        job_id: str = uuid.uuid4().hex
+        job_key: str = _get_job_key(self.queue, job_id)
+        results_key: str = _get_results_key(self.queue, job_id)
+        payloads: Dict[bytes, int] = {
+            pickle.dumps((job_id, index, task)): index
+            for index, task in enumerate(tasks)
+        }
+        key_timeout: int = self._get_key_timeout()
+        self.client.set(
+            job_key, pickle.dumps((worker, initializer, initargs)), ex=key_timeout
+        )
+        try:
+            if payloads:
+                # workers take the tasks from the tail of the list
+                self.client.lpush(self.queue, *payloads)
+            # whole seconds, as older Redis versions require
+            poll_timeout: int = max(
+                1, math.ceil(min(self.claim_timeout, self.result_timeout))
+            )
+            received: Set[int] = set()
+            unclaimed_since: Dict[bytes, float] = {}
+            last_result = last_check = time.monotonic()
+            while len(received) < len(tasks):
+                if time.monotonic() - last_check >= self.claim_timeout:
+                    self.client.expire(job_key, key_timeout)
+                    self.client.expire(results_key, key_timeout)
+                    self._requeue_unclaimed_tasks(job_id, payloads, unclaimed_since)
+                    last_check = time.monotonic()
+                item = self.client.blpop(results_key, timeout=poll_timeout)
+                if item is None:
+                    if time.monotonic() - last_result >= self.result_timeout:
+                        raise TimeoutError(
+                            f"No task result received in {self.result_timeout} seconds"
+                        )
+                    continue
+                last_result = time.monotonic()
+                task_index, error, result = pickle.loads(item[1])
+                if task_index in received:
+                    # a requeued task that was also finished by its first worker
+                    continue
+                received.add(task_index)
+                if error:
+                    raise RuntimeError(f"Task {task_index} failed on a worker: {error}")
+                yield result
+        finally:
+            # workers skip the tasks of a job whose key is gone
+            self.client.delete(job_key, results_key)
+            for payload in payloads:
+                self.client.lrem(_get_processing_key(self.queue), 0, payload)
+
+    def _requeue_unclaimed_tasks(
+        self,
+        job_id: str,
+        payloads: Dict[bytes, int],
+        unclaimed_since: Dict[bytes, float],
+    ):
+        """
+        Pushes the tasks of the job that are in progress without a claim
+        for longer than claim_timeout to the queue again.
+        A task is briefly unclaimed between being moved to the list
+        of tasks in progress and being claimed by its worker.
+        """
+        now: float = time.monotonic()
+        in_progress = set(self.client.lrange(_get_processing_key(self.queue), 0, -1))
+        for payload in list(unclaimed_since):
+            if payload not in in_progress:
+                del unclaimed_since[payload]
+        for payload in in_progress:
+            task_index: Optional[int] = payloads.get(payload)
+            if task_index is None or self.client.exists(
+                _get_claim_key(self.queue, job_id, task_index)
+            ):
+                unclaimed_since.pop(payload, None)
+                continue
+            since: float = unclaimed_since.setdefault(payload, now)
+            if now - since < self.claim_timeout:
+                continue
+            del unclaimed_since[payload]
+            # only one coordinator or worker removes the task from the list
+            if self.client.lrem(_get_processing_key(self.queue), 1, payload):
+                logger.warning(
+                    f"Task {task_index} of job {job_id} was not finished "
+                    "by its worker, queueing it again"
+                )
+                self.client.rpush(self.queue, payload)
+
+
+class RedisQueueWorker:
+    """
+    Pulls tasks of RedisQueueExecutor jobs from the queue and runs them.
+    The initializer of a job runs before the first task of the job
+    the worker pulls. The claim of the running task is renewed
+    in a background thread until the task is finished.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        queue: str = DEFAULT_TASK_QUEUE,
+        poll_timeout: int = 5,
+        claim_timeout: float = DEFAULT_CLAIM_TIMEOUT,
+    ):
+        self.client = client
+        self.queue = get_versioned_queue(queue)
+        self.poll_timeout = poll_timeout
+        self.claim_timeout = claim_timeout
+        self.job_id: Optional[str] = None
+        self.worker: Optional[Callable[[Any], Any]] = None
+
+    def run(self, max_tasks: int = None):
+        """
+        Runs tasks until max_tasks tasks have been pulled,
+        or forever if max_tasks is None.
+        """
+        pulled: int = 0
+        while max_tasks is None or pulled < max_tasks:
+            payload = self.client.brpoplpush(
+                self.queue, _get_processing_key(self.queue), timeout=self.poll_timeout
+            )
+            if payload is None:
+                continue
+            pulled += 1
+            try:
+                self.run_task(payload)
+            finally:
+                self.client.lrem(_get_processing_key(self.queue), 1, payload)
+
+    def run_task(self, payload: bytes):
+        job_id, task_index, task = pickle.loads(payload)
+        claim_key: str = _get_claim_key(self.queue, job_id, task_index)
+        stop_claiming = threading.Event()
+        self._claim(claim_key)
+        claim_thread = threading.Thread(
+            target=self._renew_claim, args=(claim_key, stop_claiming), daemon=True
+        )
+        claim_thread.start()
+        try:
+            result = self._run_task(job_id, task_index, task)
+            if result is not None:
+                self._push_result(job_id, task_index, result)
+        finally:
+            stop_claiming.set()
+            claim_thread.join()
+            self.client.delete(claim_key)
+
+    def _run_task(self, job_id: str, task_index: int, task: Any) -> Optional[tuple]:
+        if job_id != self.job_id:
+            job = self.client.get(_get_job_key(self.queue, job_id))
+            if job is None:
+                logger.info(f"Skipping task {task_index} of finished job {job_id}")
+                return None
+            self.job_id = None
+            self.worker, initializer, initargs = pickle.loads(job)
+        try:
+            if self.job_id != job_id:
+                initializer(*initargs)
+                self.job_id = job_id
+            return task_index, None, self.worker(task)
+        except Exception as e:
+            logger.error(f"Task {task_index} of job {job_id} failed: {e}")
+            return task_index, traceback.format_exc(), None
+
+    def _push_result(self, job_id: str, task_index: int, result: tuple):
+        """
+        Pushes the result of the task to the results of the job.
+        Results of a job whose key is gone are dropped, the results
+        expire with the job key if the coordinator stops reading them.
+        """
+        job_timeout: int = self.client.ttl(_get_job_key(self.queue, job_id))
+        if job_timeout == -2:
+            logger.info(
+                f"Dropping result of task {task_index} of finished job {job_id}"
+            )
+            return
+        results_key: str = _get_results_key(self.queue, job_id)
+        self.client.rpush(results_key, pickle.dumps(result))
+        if job_timeout > 0:
+            self.client.expire(results_key, job_timeout)
+
+    def _claim(self, claim_key: str):
+        self.client.set(claim_key, 1, ex=max(1, int(self.claim_timeout)))
+
+    def _renew_claim(self, claim_key: str, stop: threading.Event):
+        while not stop.wait(self.claim_timeout / 3):
+            self._claim(claim_key)
+
+
+def _run_worker(config: ConfigInterface):
+    # each process opens its own connection
+    client: redis.Redis = get_redis_client(config)
+    RedisQueueWorker(
+        client,
+        config.getValue("REDIS_TASK_QUEUE") or DEFAULT_TASK_QUEUE,
+        claim_timeout=get_claim_timeout(config),
+    ).run()
+
+
+def run_queue_workers(config: ConfigInterface, pool_size: int):
+    """
+    Runs pool_size worker processes pulling tasks from the Redis task queue
+    until interrupted.
+    """
+    processes: List[Process] = [
+        Process(target=_run_worker, args=(config,)) for _ in range(pool_size)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+            process.join()
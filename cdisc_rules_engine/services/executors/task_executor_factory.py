@@ -0,0 +1,37 @@
+from typing import Type
+
+from cdisc_rules_engine.enums.executor_parameter_options import (
+    ExecutorParameterOptions,
+)
+from cdisc_rules_engine.interfaces import FactoryInterface, TaskExecutorInterface
+
+from .local_process_executor import LocalProcessExecutor
+from .redis_queue_executor import RedisQueueExecutor
+
+
+class TaskExecutorFactory(FactoryInterface):
+    _registered_services_map = {
+        ExecutorParameterOptions.LOCAL.value: LocalProcessExecutor,
+        ExecutorParameterOptions.REDIS.value: RedisQueueExecutor,
+    }
+
+    def __init__(self, config):
+        self.config = config
+
+    @classmethod
+    def register_service(cls, name: str, service: Type[TaskExecutorInterface]):
+        if not name:
+            raise ValueError("Service name must not be empty!")
+        if not issubclass(service, TaskExecutorInterface):
+            raise TypeError("Implementation of TaskExecutorInterface required!")
+        cls._registered_services_map[name] = service
+
+    def get_service(self, name: str = None, **kwargs) -> TaskExecutorInterface:
+        service_name = name or ExecutorParameterOptions.LOCAL.value
+        if service_name in self._registered_services_map:
+            return self._registered_services_map.get(service_name).get_instance(
+                config=self.config, **kwargs
+            )
+        raise ValueError(
+            f"Service name must be in  {list(self._registered_services_map.keys())}"
+        )
@@ -4,6 +4,7 @@ from typing import BinaryIO, List, Optional, Iterable
 
 from cdisc_rules_engine.enums.report_types import ReportTypes
 from cdisc_rules_engine.models.rule_validation_result import RuleValidationResult
+from cdisc_rules_engine.models.validation_error_batch import ValidationErrorBatch
 from cdisc_rules_engine.models.validation_args import Validation_args
 from cdisc_rules_engine.utilities.reporting_utilities import (
     get_define_version,
@@ -74,4 +75,4 @@ class JsonReport(BaseReport):
             raw_report=self._args.raw_report,
         )
         with open(self._output_name, "w") as f:
-            json.dump(report_data, f)
+            json.dump(report_data, f, default=ValidationErrorBatch.serialize)
@@ -0,0 +1,668 @@
+from abc import ABC, abstractmethod
+from itertools import groupby
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from cdisc_rules_engine.models.rule_conditions import AllowedConditionsKeys
+
+# Literal comparators the compiled operators compare each value to.
+_SCALAR_TYPES: tuple = (str, int, float, bool, type(None))
+
+DEFAULT_MAX_KEPT_ARRAYS: int = 256
+
+
+class ConditionNotCompiledError(Exception):
+    """
+    Raised when a compiled plan can't evaluate the conditions
+    the way business_rules does, so the rule is run by business_rules.
+    """
+
+
+class MissingColumnsError(Exception):
+    """
+    Raised by conditions over several columns of an "any" composite
+    when some of the columns are missing. Holds the missing columns
+    and the mask of the columns that exist.
+    """
+
+    def __init__(self, columns: List[str], mask: Optional[np.ndarray]):
+        super().__init__(columns)
+        self.columns = columns
+        self.mask = mask
+
+
+class ConditionPlan(ABC):
+    """
+    Node of a compiled condition tree.
+    Nodes evaluate to a boolean numpy array with an item for each record.
+    Equal nodes have equal keys and are evaluated once for a dataset.
+    """
+
+    key: tuple
+    # columns the conditions read
+    columns: frozenset
+    # number of conditions the node stands for in its composite
+    size: int = 1
+
+    def evaluate(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        """
+        Returns the mask of records the conditions are true for.
+        Masks of equal nodes evaluated before are taken from masks.
+        """
+        return masks.get_mask(self, dataset)
+
+    @abstractmethod
+    def compute(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        """
+        Evaluates the conditions, nested nodes are evaluated through masks.
+        """
+
+    @abstractmethod
+    def check_columns(self, dataset: pd.DataFrame):
+        """
+        Raises the KeyError the evaluation of the conditions
+        raises when the dataset is missing one of their columns.
+        Used for conditions a short-circuited composite doesn't evaluate,
+        so the rule reports the same missing columns as business_rules.
+        """
+
+
+class AllConditionsPlan(ConditionPlan):
+    def __init__(self, conditions: List[ConditionPlan]):
+        self.conditions = conditions
+        self.key = ("all", *(condition.key for condition in conditions))
+        self.columns = frozenset().union(*(c.columns for c in conditions))
+
+    def compute(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        result: Optional[np.ndarray] = None
+        for index, condition in enumerate(self.conditions):
+            mask: np.ndarray = condition.evaluate(dataset, masks)
+            result = mask if result is None else result & mask
+            if not result.any():
+                # the remaining conditions can't make any record true
+                for skipped_condition in self.conditions[index + 1 :]:
+                    skipped_condition.check_columns(dataset)
+                break
+        return result
+
+    def check_columns(self, dataset: pd.DataFrame):
+        for condition in self.conditions:
+            condition.check_columns(dataset)
+
+
+class AnyConditionsPlan(ConditionPlan):
+    """
+    Like business_rules, raises a KeyError only
+    when all the conditions are missing a column.
+    """
+
+    def __init__(self, conditions: List[ConditionPlan]):
+        self.conditions = conditions
+        self.key = ("any", *(condition.key for condition in conditions))
+        self.columns = frozenset().union(*(c.columns for c in conditions))
+
+    def compute(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        result: Optional[np.ndarray] = None
+        missing_variables: list = []
+        for condition in self.conditions:
+            try:
+                mask: Optional[np.ndarray] = condition.evaluate(dataset, masks)
+            except MissingColumnsError as e:
+                missing_variables.extend(e.columns)
+                mask = e.mask
+            except KeyError as e:
+                missing_variables.append(e.args[0])
+                continue
+            if mask is None:
+                continue
+            result = mask if result is None else result | mask
+            if result.all():
+                # the remaining conditions can't make any record false
+                break
+        self._raise_missing_variables(missing_variables)
+        return result
+
+    def check_columns(self, dataset: pd.DataFrame):
+        missing_variables: list = []
+        for condition in self.conditions:
+            try:
+                condition.check_columns(dataset)
+            except MissingColumnsError as e:
+                missing_variables.extend(e.columns)
+            except KeyError as e:
+                missing_variables.append(e.args[0])
+        self._raise_missing_variables(missing_variables)
+
+    def _raise_missing_variables(self, missing_variables: list):
+        if len(missing_variables) == sum(
+            condition.size for condition in self.conditions
+        ):
+            raise KeyError(", ".join(list(set(missing_variables))))
+
+
+class NotConditionPlan(ConditionPlan):
+    def __init__(self, condition: ConditionPlan):
+        self.condition = condition
+        self.key = ("not", condition.key)
+        self.columns = condition.columns
+
+    def compute(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        return ~self.condition.evaluate(dataset, masks)
+
+    def check_columns(self, dataset: pd.DataFrame):
+        self.condition.check_columns(dataset)
+
+
+class OperatorConditionPlan(ConditionPlan):
+    """
+    Single condition evaluated by a compiled operator.
+    The target and comparator have their prefixes replaced.
+    """
+
+    def __init__(
+        self, operator: str, target: str, comparator: Any, value_is_literal: bool
+    ):
+        self.operator = operator
+        self.target = target
+        self.comparator = comparator
+        self.value_is_literal = value_is_literal
+        self.key = ("operator", operator, target, *self.comparison_key)
+        self.columns = frozenset((target, *self.comparator_columns))
+
+    @property
+    def comparator_columns(self) -> List[str]:
+        """
+        Columns the comparator may name.
+        """
+        if self.value_is_literal:
+            return []
+        if isinstance(self.comparator, list):
+            return [item for item in self.comparator if isinstance(item, str)]
+        return [self.comparator] if isinstance(self.comparator, str) else []
+
+    @property
+    def comparison_key(self) -> tuple:
+        """
+        Operator and comparator of the condition,
+        shared by the conditions that differ only in their target.
+        """
+        comparator = self.comparator
+        if isinstance(comparator, list):
+            comparator = tuple(comparator)
+        return (
+            self.operator,
+            type(self.comparator).__name__,
+            comparator,
+            self.value_is_literal,
+        )
+
+    def compute(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        operator, _, _ = COMPILED_OPERATORS[self.operator]
+        return operator(dataset, self.target, self.comparator, self.value_is_literal)
+
+    def check_columns(self, dataset: pd.DataFrame):
+        _, _, reads_target = COMPILED_OPERATORS[self.operator]
+        if reads_target and self.target not in dataset.columns:
+            raise KeyError(self.target)
+
+
+class MultiColumnConditionPlan(ConditionPlan):
+    """
+    Conditions of a composite that apply the same operator to
+    several targets, like the conditions duplicated for all variables.
+    The operator is evaluated once over a 2-D block of the target columns,
+    which is reduced to the mask of the composite.
+    """
+
+    def __init__(self, conditions: List[OperatorConditionPlan], match_all: bool):
+        self.condition = conditions[0]
+        self.targets = [condition.target for condition in conditions]
+        self.match_all = match_all
+        self.size = len(conditions)
+        self.key = (
+            "columns",
+            tuple(self.targets),
+            match_all,
+            *self.condition.comparison_key,
+        )
+        self.columns = frozenset((*self.targets, *self.condition.comparator_columns))
+
+    def _get_missing_targets(self, dataset: pd.DataFrame) -> List[str]:
+        _, _, reads_target = COMPILED_OPERATORS[self.condition.operator]
+        if not reads_target:
+            return []
+        return [target for target in self.targets if target not in dataset.columns]
+
+    def compute(self, dataset: pd.DataFrame, masks: "ConditionMasks") -> np.ndarray:
+        missing_targets: List[str] = self._get_missing_targets(dataset)
+        targets: List[str] = [
+            target for target in self.targets if target not in missing_targets
+        ]
+        mask: Optional[np.ndarray] = None
+        if targets:
+            operator, _, _ = COMPILED_OPERATORS[self.condition.operator]
+            block: np.ndarray = operator(
+                dataset,
+                targets,
+                self.condition.comparator,
+                self.condition.value_is_literal,
+            )
+            mask = block.all(axis=1) if self.match_all else block.any(axis=1)
+        if missing_targets:
+            self._raise_missing_targets(missing_targets, mask)
+        return mask
+
+    def check_columns(self, dataset: pd.DataFrame):
+        missing_targets: List[str] = self._get_missing_targets(dataset)
+        if missing_targets:
+            self._raise_missing_targets(missing_targets, None)
+
+    def _raise_missing_targets(
+        self, missing_targets: List[str], mask: Optional[np.ndarray]
+    ):
+        if self.match_all:
+            # "all" composites stop at the first missing column
+            raise KeyError(missing_targets[0])
+        raise MissingColumnsError(missing_targets, mask)
+
+
+class ConditionMasks:
+    """
+    Masks of the plan nodes evaluated against a dataset,
+    so equal nodes of a plan are evaluated once.
+    """
+
+    def __init__(self):
+        self._masks: Dict[Hashable, np.ndarray] = {}
+
+    def get_mask(self, condition: ConditionPlan, dataset: pd.DataFrame) -> np.ndarray:
+        masks, key = self._get_masks(condition, dataset)
+        if key not in masks:
+            masks[key] = condition.compute(dataset, self)
+        return masks[key]
+
+    def _get_masks(
+        self, condition: ConditionPlan, dataset: pd.DataFrame
+    ) -> Tuple[Dict[Hashable, np.ndarray], Hashable]:
+        """
+        Returns the masks the mask of the node is kept in, with its key.
+        """
+        return self._masks, condition.key
+
+
+class PredicateCache:
+    """
+    Masks of compiled conditions shared by the rules validated
+    against a dataset, so a condition repeated in many rules
+    is evaluated once.
+
+    Masks are shared when the columns the condition reads
+    hold the same arrays as the dataset the rule was given,
+    before the rule added or replaced columns. The arrays are
+    referenced by the cache, so their memory isn't reused
+    for other values while their masks are kept. At most max_arrays
+    arrays are kept, masks of conditions reading other arrays
+    are kept by the rule only.
+    """
+
+    def __init__(self, max_arrays: int = DEFAULT_MAX_KEPT_ARRAYS):
+        self.masks: Dict[Hashable, np.ndarray] = {}
+        self.max_arrays = max_arrays
+        self._arrays: Dict[tuple, np.ndarray] = {}
+
+    def get_condition_masks(self, source: pd.DataFrame) -> "SharedConditionMasks":
+        """
+        Returns the masks for a rule validated against
+        a dataset built from the source dataset.
+        """
+        return SharedConditionMasks(self, source)
+
+    def keep_array(self, array_key: tuple, array: np.ndarray) -> bool:
+        """
+        Keeps the array while the cache is used.
+        Returns False if the cache already keeps max_arrays arrays.
+        """
+        if array_key not in self._arrays:
+            if len(self._arrays) >= self.max_arrays:
+                return False
+            self._arrays[array_key] = array
+        return True
+
+
+class SharedConditionMasks(ConditionMasks):
+    """
+    Masks of a rule, nodes reading columns of the source dataset only
+    are kept in the predicate cache.
+    """
+
+    def __init__(self, predicate_cache: PredicateCache, source: pd.DataFrame):
+        super().__init__()
+        self.predicate_cache = predicate_cache
+        self.source = source
+        self._column_keys: Dict[str, Optional[tuple]] = {}
+
+    def _get_masks(
+        self, condition: ConditionPlan, dataset: pd.DataFrame
+    ) -> Tuple[Dict[Hashable, np.ndarray], Hashable]:
+        column_keys: list = [
+            self._get_column_key(column, dataset) for column in condition.columns
+        ]
+        if any(column_key is None for column_key in column_keys):
+            return super()._get_masks(condition, dataset)
+        return self.predicate_cache.masks, (
+            condition.key,
+            len(dataset),
+            frozenset(column_keys),
+        )
+
+    def _get_column_key(self, column: str, dataset: pd.DataFrame) -> Optional[tuple]:
+        """
+        Returns a key of the column values, or None if they are not
+        the values of the source dataset.
+        """
+        if column not in self._column_keys:
+            self._column_keys[column] = self._get_source_column_key(column, dataset)
+        return self._column_keys[column]
+
+    def _get_source_column_key(
+        self, column: str, dataset: pd.DataFrame
+    ) -> Optional[tuple]:
+        if column not in dataset.columns:
+            # the masks depend on the number of records only
+            return column, None
+        if column not in self.source.columns:
+            return None
+        values: np.ndarray = dataset[column].to_numpy()
+        array_key: tuple = _get_array_key(values)
+        if array_key != _get_array_key(
+            self.source[column].to_numpy()
+        ) or not self.predicate_cache.keep_array(array_key, values):
+            return None
+        return column, array_key
+
+
+def _get_array_key(array: np.ndarray) -> tuple:
+    """
+    Returns a key of the memory the array views.
+    """
+    return (
+        array.__array_interface__["data"][0],
+        array.shape,
+        array.strides,
+        array.dtype.str,
+    )
+
+
+def _get_values(dataset: pd.DataFrame, columns: Union[str, List[str]]) -> np.ndarray:
+    # python objects compare the way the values of the records do
+    return dataset[columns].to_numpy(dtype=object)
+
+
+def _compare(comparison: np.ufunc, values: np.ndarray, other: Any) -> np.ndarray:
+    result = comparison(values, other)
+    if np.shape(result) != values.shape:
+        # numpy returns a single value for values like arrays,
+        # which compare differently in a row
+        raise ConditionNotCompiledError(comparison.__name__)
+    return result.astype(bool)
+
+
+def _is_null(values: np.ndarray) -> np.ndarray:
+    return _compare(np.equal, values, "") | _compare(np.equal, values, None)
+
+
+def _get_comparison_data(
+    dataset: pd.DataFrame, values: np.ndarray, comparator: Any, value_is_literal: bool
+) -> tuple:
+    if value_is_literal or comparator not in dataset.columns:
+        return comparator, comparator == "" or comparator is None
+    comparison_values: np.ndarray = _get_values(dataset, comparator)
+    if values.ndim == 2:
+        # the comparator column is compared to each target column
+        comparison_values = comparison_values[:, np.newaxis]
+    return comparison_values, _is_null(comparison_values)
+
+
+def _equal_to(
+    dataset: pd.DataFrame,
+    columns: Union[str, List[str]],
+    comparator: Any,
+    value_is_literal: bool,
+) -> np.ndarray:
+    """
+    Values that are "" or None are not equal to anything.
+    """
+    values: np.ndarray = _get_values(dataset, columns)
+    comparison_data, comparison_is_null = _get_comparison_data(
+        dataset, values, comparator, value_is_literal
+    )
+    both_null: np.ndarray = comparison_is_null & _is_null(values)
+    return ~both_null & _compare(np.equal, values, comparison_data)
+
+
+def _not_equal_to(
+    dataset: pd.DataFrame,
+    columns: Union[str, List[str]],
+    comparator: Any,
+    value_is_literal: bool,
+) -> np.ndarray:
+    """
+    Values that are "" or None are not equal to populated values.
+    """
+    values: np.ndarray = _get_values(dataset, columns)
+    comparison_data, comparison_is_null = _get_comparison_data(
+        dataset, values, comparator, value_is_literal
+    )
+    both_null: np.ndarray = comparison_is_null & _is_null(values)
+    return ~both_null & _compare(np.not_equal, values, comparison_data)
+
+
+def _exists(
+    dataset: pd.DataFrame,
+    columns: Union[str, List[str]],
+    comparator: Any,
+    value_is_literal: bool,
+) -> np.ndarray:
+    if isinstance(columns, str):
+        return np.full(len(dataset), columns in dataset)
+    return np.broadcast_to(
+        np.array([column in dataset for column in columns]),
+        (len(dataset), len(columns)),
+    )
+
+
+def _is_in(
+    dataset: pd.DataFrame, columns: Union[str, List[str]], values: list
+) -> np.ndarray:
+    if isinstance(columns, str):
+        return dataset[columns].isin(values).to_numpy(dtype=bool)
+    # Series.isin compares the values of each column in its own dtype
+    return np.column_stack([_is_in(dataset, column, values) for column in columns])
+
+
+def _empty(
+    dataset: pd.DataFrame,
+    columns: Union[str, List[str]],
+    comparator: Any,
+    value_is_literal: bool,
+) -> np.ndarray:
+    return _is_in(dataset, columns, ["", None])
+
+
+def _is_contained_by(
+    dataset: pd.DataFrame,
+    columns: Union[str, List[str]],
+    comparator: Any,
+    value_is_literal: bool,
+) -> np.ndarray:
+    comparison_data = comparator
+    if not value_is_literal:
+        comparison_data = dataset.get(comparator, comparator)
+    if not isinstance(comparison_data, list):
+        # the list names columns of the dataset
+        raise ConditionNotCompiledError(comparator)
+    return _is_in(dataset, columns, comparison_data)
+
+
+def _negate(operator: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+    return lambda *args: ~operator(*args)
+
+
+# Operators of business_rules DataframeType the compiler evaluates,
+# with the types of comparators they are compiled for
+# and whether they read the target column.
+COMPILED_OPERATORS: Dict[str, tuple] = {
+    "equal_to": (_equal_to, _SCALAR_TYPES, True),
+    "not_equal_to": (_not_equal_to, _SCALAR_TYPES, True),
+    "exists": (_exists, None, False),
+    "not_exists": (_negate(_exists), None, False),
+    "empty": (_empty, None, True),
+    "non_empty": (_negate(_empty), None, True),
+    "is_contained_by": (_is_contained_by, (list,), True),
+    "is_not_contained_by": (_negate(_is_contained_by), (list,), True),
+}
+
+
+class ConditionCompiler:
+    """
+    Compiles rule conditions to a plan evaluated over numpy arrays.
+
+    The plan gives the same results as business_rules.engine.run
+    for the operators in COMPILED_OPERATORS, but "all" conditions stop
+    at a mask without true records and "any" conditions stop
+    at a mask without false records, and single conditions
+    don't build a row for each record.
+    Conditions with other operators are not compiled,
+    they are run by business_rules.
+    """
+
+    def __init__(self, column_prefix_map: dict):
+        self.column_prefix_map = column_prefix_map
+
+    def compile(self, conditions: dict) -> Optional[ConditionPlan]:
+        """
+        Compiles the serialized conditions of a rule.
+        Returns None if they have a condition that can't be compiled.
+        """
+        if not isinstance(conditions, dict):
+            return None
+        keys: list = list(conditions.keys())
+        if keys == [AllowedConditionsKeys.NOT.value]:
+            condition: Optional[ConditionPlan] = self.compile(conditions["not"])
+            return NotConditionPlan(condition) if condition else None
+        if keys == [AllowedConditionsKeys.ALL.value] or keys == [
+            AllowedConditionsKeys.ANY.value
+        ]:
+            return self._compile_composite(keys[0], conditions[keys[0]])
+        if any(AllowedConditionsKeys.contains(key) for key in keys):
+            return None
+        return self._compile_single_condition(conditions)
+
+    def _compile_composite(
+        self, key: str, conditions: List[dict]
+    ) -> Optional[ConditionPlan]:
+        if not isinstance(conditions, list) or not conditions:
+            return None
+        compiled_conditions: List[Optional[ConditionPlan]] = [
+            self.compile(condition) for condition in conditions
+        ]
+        if not all(compiled_conditions):
+            return None
+        match_all: bool = key == AllowedConditionsKeys.ALL.value
+        compiled_conditions = self._group_multi_column_conditions(
+            compiled_conditions, match_all
+        )
+        if match_all:
+            return AllConditionsPlan(compiled_conditions)
+        return AnyConditionsPlan(compiled_conditions)
+
+    @staticmethod
+    def _group_multi_column_conditions(
+        conditions: List[ConditionPlan], match_all: bool
+    ) -> List[ConditionPlan]:
+        """
+        Replaces consecutive conditions that differ only in their target
+        with a condition over several columns. The conditions stay
+        in their order, so missing columns are reported in the same order.
+        """
+        grouped_conditions: List[ConditionPlan] = []
+        for _, group in groupby(
+            conditions,
+            key=lambda condition: isinstance(condition, OperatorConditionPlan)
+            and condition.comparison_key,
+        ):
+            group = list(group)
+            if len(group) > 1 and isinstance(group[0], OperatorConditionPlan):
+                grouped_conditions.append(MultiColumnConditionPlan(group, match_all))
+            else:
+                grouped_conditions.extend(group)
+        return grouped_conditions
+
+    def _compile_single_condition(self, condition: dict) -> Optional[ConditionPlan]:
+        value = condition.get("value")
+        if (
+            condition.get("name") != "get_dataset"
+            or condition.get("params")
+            or condition.get("operator") not in COMPILED_OPERATORS
+            or not isinstance(value, dict)
+        ):
+            return None
+        operator: str = condition["operator"]
+        _, comparator_types, _ = COMPILED_OPERATORS[operator]
+        value_is_literal: bool = value.get("value_is_literal", False)
+        comparator = value.get("comparator")
+        if comparator_types and not isinstance(comparator, comparator_types):
+            return None
+        try:
+            target = self._replace_prefix(value.get("target"))
+            if not value_is_literal:
+                comparator = self._replace_prefix(comparator)
+        except TypeError:
+            # the prefix is replaced with None when there is no domain
+            return None
+        if not isinstance(target, str):
+            return None
+        compiled_condition = OperatorConditionPlan(
+            operator, target, comparator, value_is_literal
+        )
+        try:
+            hash(compiled_condition.key)
+        except TypeError:
+            # comparator lists holding lists
+            return None
+        return compiled_condition
+
+    def _replace_prefix(self, value: Any) -> Any:
+        # same replacement as business_rules DataframeType
+        if isinstance(value, str):
+            for prefix, replacement in self.column_prefix_map.items():
+                if value.startswith(prefix):
+                    return value.replace(prefix, replacement, 1)
+        return value
+
+
+def evaluate_condition_plan(
+    plan: ConditionPlan,
+    dataset: pd.DataFrame,
+    masks: Optional[ConditionMasks] = None,
+) -> Optional[pd.Series]:
+    """
+    Returns the results of the compiled conditions for each record,
+    or None if business_rules has to evaluate them.
+    Missing columns raise a KeyError like in business_rules.
+    Masks are taken from and added to the given masks.
+    """
+    index: pd.Index = dataset.index
+    has_default_index: bool = isinstance(index, pd.RangeIndex) and (
+        index.start == 0 and index.step == 1
+    )
+    # business_rules aligns the results of the operators by index
+    # and builds no results for an empty dataset
+    if dataset.empty or not has_default_index or not dataset.columns.is_unique:
+        return None
+    try:
+        return pd.Series(plan.evaluate(dataset, masks or ConditionMasks()))
+    except (ConditionNotCompiledError, TypeError, ValueError):
+        return None
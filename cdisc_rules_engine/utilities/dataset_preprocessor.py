@@ -57,7 +57,8 @@ class DatasetPreprocessor:
 
         rule_targets = self._rule_processor.extract_referenced_variables_from_rule(rule)
         # Get all targets that reference the merge domain.
-        result: pd.DataFrame = self._dataset.copy()
+        # merging always produces a new dataset, so no copy is needed
+        result: pd.DataFrame = self._dataset
         for domain_details in rule_datasets:
             domain_name: str = domain_details.get("domain_name")
             if self._is_split_domain(domain_name):
@@ -69,7 +70,10 @@ class DatasetPreprocessor:
             )
             if not file_info:
                 continue
-            other_dataset: pd.DataFrame = self._download_dataset(file_info["filename"])
+            # shallow copy to rename columns without changing the cached dataset
+            other_dataset: pd.DataFrame = self._download_dataset(
+                file_info["filename"]
+            ).copy(deep=False)
             referenced_targets = set(
                 [
                     target.replace(f"{domain_name}.", "")
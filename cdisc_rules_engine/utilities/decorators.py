@@ -42,13 +42,20 @@ def cached(cache_key: str):  # noqa: C901
     """
     Generic decorator for cached data.
     #All cached data should have a cache key of the format:
-    {study_id}/{data_bundle_id}/{domain_name}/{arg}.../key.
+    {cache_key_prefix}/{study_id}/{data_bundle_id}/{domain_name}/{arg}.../key.
+    The cache_key_prefix of the instance scopes the data
+    to the source it was read from.
 
     Note: It is expected that the instance has a cache_service property.
     """
 
     def format_cache_key(
-        key: str, args=[], study_id=None, data_bundle_id=None, domain_name=None
+        key: str,
+        args=[],
+        study_id=None,
+        data_bundle_id=None,
+        domain_name=None,
+        cache_key_prefix=None,
     ):
         """
         If a study_id and data_bundle_id are available,
@@ -64,6 +71,8 @@ def cached(cache_key: str):  # noqa: C901
         for arg in args:
             if isinstance(arg, str):
                 key = f"{arg}/" + key
+        if cache_key_prefix:
+            key = f"{cache_key_prefix}/" + key
         return key
 
     def decorator(func: Callable):
@@ -95,6 +104,7 @@ def cached(cache_key: str):  # noqa: C901
                     study_id=study_id,
                     data_bundle_id=data_bundle_id,
                     domain_name=domain_name,
+                    cache_key_prefix=getattr(instance, "cache_key_prefix", None),
                 )
                 cached_data = instance.cache_service.get(key)
                 if cached_data is not None:
@@ -0,0 +1,192 @@
+import json
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional
+
+from cdisc_rules_engine.enums.rule_types import RuleTypes
+from cdisc_rules_engine.services import logger
+
+# Relative cost of validating a rule against one record, by rule type.
+# Rule types that are missing here are validated against the dataset contents.
+_RECORD_WEIGHTS: Dict[str, float] = {
+    RuleTypes.DATASET_METADATA_CHECK.value: 0.0,
+    RuleTypes.DATASET_METADATA_CHECK_AGAINST_DEFINE.value: 0.0,
+    RuleTypes.DEFINE_ITEM_GROUP_METADATA_CHECK.value: 0.0,
+    RuleTypes.DEFINE_ITEM_METADATA_CHECK.value: 0.0,
+    RuleTypes.DEFINE_ITEM_METADATA_CHECK_AGAINST_LIBRARY.value: 0.0,
+    RuleTypes.DOMAIN_PRESENCE_CHECK.value: 0.0,
+    RuleTypes.VARIABLE_METADATA_CHECK.value: 0.0,
+    RuleTypes.VARIABLE_METADATA_CHECK_AGAINST_DEFINE.value: 0.0,
+    RuleTypes.VARIABLE_METADATA_CHECK_AGAINST_LIBRARY.value: 0.0,
+    RuleTypes.VALUE_CHECK_AGAINST_DEFINE_XML_VARIABLE.value: 2.0,
+    RuleTypes.VALUE_CHECK_AGAINST_DEFINE_XML_VLM.value: 3.0,
+    RuleTypes.VALUE_LEVEL_METADATA_CHECK_AGAINST_DEFINE.value: 3.0,
+}
+_DEFAULT_RECORD_WEIGHT: float = 1.0
+# each operation scans the dataset once more
+_OPERATION_WEIGHT: float = 0.5
+# cost of validating a rule regardless of the dataset size, in records
+_TASK_OVERHEAD: float = 1000.0
+# weight of the latest run when timings of a rule are updated
+_HISTORY_SMOOTHING: float = 0.5
+
+
+class RuleTimingHistory:
+    """
+    Time spent validating each rule in earlier runs,
+    with the number of records the rule was validated against.
+    The history is kept in a JSON file, a missing or broken file
+    is treated as an empty history.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._timings: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.file_path) as f:
+                timings = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read the rule timings: {e}")
+            return {}
+        return timings if isinstance(timings, dict) else {}
+
+    def get(self, core_id: str) -> Optional[dict]:
+        return self._timings.get(core_id)
+
+    def update(self, core_id: str, seconds: float, records: int):
+        """
+        Adds a measurement of a rule. The time of the rule
+        is kept as a moving average over the runs.
+        """
+        previous: Optional[dict] = self._timings.get(core_id)
+        if previous:
+            seconds = (
+                _HISTORY_SMOOTHING * seconds
+                + (1 - _HISTORY_SMOOTHING) * previous["seconds"]
+            )
+        self._timings[core_id] = {"seconds": seconds, "records": records}
+
+    def save(self):
+        """
+        Writes the history atomically. The run does not fail
+        if the history can't be saved.
+        """
+        try:
+            directory: str = os.path.dirname(os.path.abspath(self.file_path))
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".json")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._timings, f)
+            os.replace(temp_path, self.file_path)
+        except OSError as e:
+            logger.warning(f"Could not save the rule timings: {e}")
+
+
+class RuleCostEstimator:
+    """
+    Estimates how long validating a rule against a domain takes.
+
+    The estimate is derived from the number of records in the domain
+    and in the domains the rule merges with, the rule type and the number
+    of operations of the rule. Rules validated in earlier runs are
+    estimated from their timings instead, scaled to the current number
+    of records. Estimates of the other rules are converted to seconds
+    with the ratio of measured to estimated time of the timed rules.
+    """
+
+    def __init__(self, datasets: List[dict], history: RuleTimingHistory = None):
+        self.history = history
+        self._records: Dict[str, int] = {}
+        for dataset in datasets:
+            self._records[dataset["domain"]] = self._records.get(
+                dataset["domain"], 0
+            ) + (dataset.get("length") or 0)
+        self._seconds_per_cost: float = 1.0
+
+    def get_records(self, domains: Iterable[str]) -> int:
+        return sum(self._records.get(domain, 0) for domain in domains)
+
+    def calibrate(self, rules: List[dict], applicable_domains: Dict[str, Iterable]):
+        """
+        Sets the ratio of measured to estimated time
+        from the rules that have timings.
+        """
+        measured_seconds: float = 0.0
+        estimated_cost: float = 0.0
+        for rule in rules:
+            timing: Optional[dict] = self._get_timing(rule)
+            if timing:
+                domains = applicable_domains[rule["core_id"]]
+                measured_seconds += self._get_timed_seconds(rule, timing, domains)
+                estimated_cost += sum(
+                    self._get_cost(rule, domain) for domain in domains
+                )
+        if measured_seconds and estimated_cost:
+            self._seconds_per_cost = measured_seconds / estimated_cost
+
+    def estimate(self, rule: dict, domain: str, domains: Iterable[str]) -> float:
+        """
+        Returns the estimated time of validating the rule against the domain.
+        domains are all the domains the rule is validated against.
+        """
+        cost: float = self._get_cost(rule, domain)
+        timing: Optional[dict] = self._get_timing(rule)
+        if not timing:
+            return cost * self._seconds_per_cost
+        # split the time of the rule between its domains
+        total_cost: float = sum(self._get_cost(rule, item) for item in domains)
+        share: float = cost / total_cost if total_cost else 0.0
+        return self._get_timed_seconds(rule, timing, domains) * share
+
+    def estimate_rule(self, rule: dict, domains: Iterable[str]) -> float:
+        """
+        Returns the estimated time of validating the rule
+        against all the given domains.
+        """
+        domains = list(domains)
+        return sum(self.estimate(rule, domain, domains) for domain in domains)
+
+    def estimate_domain(
+        self,
+        domain: str,
+        rules: List[dict],
+        applicable_domains: Dict[str, Iterable[str]],
+    ) -> float:
+        """
+        Returns the estimated time of validating the domain
+        against all the rules that apply to it.
+        """
+        return sum(
+            self.estimate(rule, domain, applicable_domains[rule["core_id"]])
+            for rule in rules
+            if domain in applicable_domains[rule["core_id"]]
+        )
+
+    def _get_timing(self, rule: dict) -> Optional[dict]:
+        return self.history.get(rule["core_id"]) if self.history else None
+
+    def _get_timed_seconds(
+        self, rule: dict, timing: dict, domains: Iterable[str]
+    ) -> float:
+        if not self._get_record_weight(rule):
+            return timing["seconds"]
+        return timing["seconds"] * (
+            max(self.get_records(domains), 1) / max(timing.get("records") or 0, 1)
+        )
+
+    def _get_cost(self, rule: dict, domain: str) -> float:
+        records: int = self._records.get(domain, 0) + self.get_records(
+            merged_dataset.get("domain_name")
+            for merged_dataset in rule.get("datasets") or []
+        )
+        operations: int = len(rule.get("operations") or [])
+        return _TASK_OVERHEAD + records * self._get_record_weight(rule) * (
+            1 + _OPERATION_WEIGHT * operations
+        )
+
+    @staticmethod
+    def _get_record_weight(rule: dict) -> float:
+        return _RECORD_WEIGHTS.get(rule.get("rule_type"), _DEFAULT_RECORD_WEIGHT)
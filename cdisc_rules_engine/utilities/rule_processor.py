@@ -1,5 +1,5 @@
 import re
-from typing import List, Optional, Set, Union, Tuple
+from typing import Callable, List, Optional, Set, Union, Tuple
 from cdisc_rules_engine.models.library_metadata_container import (
     LibraryMetadataContainer,
 )
@@ -15,7 +15,16 @@ from cdisc_rules_engine.constants.domains import (
     APFA_DOMAIN,
     SUPPLEMENTARY_DOMAINS,
 )
-from cdisc_rules_engine.constants.rule_constants import ALL_KEYWORD
+from cdisc_rules_engine.constants.rule_constants import (
+    ALL_KEYWORD,
+    COLUMN_COMPARATOR_CONTEXT_OPERATORS,
+    DATASET_CONTEXT_OPERATORS,
+    RECORD_DATA_RULE_TYPE,
+    RECORD_INDEPENDENT_OPERATIONS,
+    TARGET_OVERWRITING_OPERATORS,
+)
+from cdisc_rules_engine.enums.rule_types import RuleTypes
+from cdisc_rules_engine.enums.sensitivity import Sensitivity
 from cdisc_rules_engine.interfaces import ConditionInterface
 from cdisc_rules_engine.models.operation_params import OperationParams
 from cdisc_rules_engine.models.rule_conditions import AllowedConditionsKeys
@@ -174,25 +183,36 @@ class RuleProcessor:
         classes = rule.get("classes") or {}
         included_classes = classes.get("Include", [])
         excluded_classes = classes.get("Exclude", [])
+        if not included_classes and not excluded_classes:
+            return True
+        if ALL_KEYWORD in included_classes:
+            return True
+        dataset = self.data_service.get_dataset(dataset_name=file_path)
+        class_name = self.data_service.get_dataset_class(
+            dataset, file_path, datasets, domain
+        )
+        return self.rule_applies_to_class_name(rule, class_name)
+
+    @classmethod
+    def rule_applies_to_class_name(cls, rule: dict, class_name: Optional[str]) -> bool:
+        """
+        Check that rule is applicable to a dataset of the given class.
+        The rules are described in rule_applies_to_class.
+        """
+        classes = rule.get("classes") or {}
+        included_classes = classes.get("Include", [])
+        excluded_classes = classes.get("Exclude", [])
         is_included = True
         is_excluded = False
         if included_classes:
             if ALL_KEYWORD in included_classes:
                 return True
-            dataset = self.data_service.get_dataset(dataset_name=file_path)
-            class_name = self.data_service.get_dataset_class(
-                dataset, file_path, datasets, domain
-            )
             if (class_name not in included_classes) and not (
                 class_name == FINDINGS_ABOUT and FINDINGS in included_classes
             ):
                 is_included = False
 
         if excluded_classes:
-            dataset = self.data_service.get_dataset(dataset_name=file_path)
-            class_name = self.data_service.get_dataset_class(
-                dataset, file_path, datasets, domain
-            )
             if class_name and (
                 (class_name in excluded_classes)
                 or (class_name == FINDINGS_ABOUT and FINDINGS in excluded_classes)
@@ -227,7 +247,9 @@ class RuleProcessor:
             # stop function execution if no operations have been provided
             return dataset
 
-        dataset_copy = dataset.copy()
+        # operations add their results as new columns,
+        # so the columns of the given dataset can be shared
+        dataset_copy = dataset.copy(deep=False)
         for operation in operations:
             # change -- pattern to domain name
             original_target: str = operation.get("name")
@@ -345,6 +367,62 @@ class RuleProcessor:
         logger.info(f"is_relationship_dataset. domain={domain}, result={result}")
         return result
 
+    @staticmethod
+    def rule_overwrites_dataset_columns(rule: dict) -> bool:
+        """
+        Checks if any rule operator writes into existing dataset columns.
+        Other operators only add new columns to the dataset.
+        """
+        conditions: ConditionInterface = rule["conditions"]
+        return any(
+            condition.get("operator") in TARGET_OVERWRITING_OPERATORS
+            for condition in conditions.values()
+        )
+
+    def can_validate_in_chunks(self, rule: dict, domain: str) -> bool:
+        """
+        Checks if the rule checks each record of the domain on its own,
+        so it can be validated against parts of the dataset
+        and the errors of the parts put together.
+        """
+        conditions: ConditionInterface = rule["conditions"]
+        return (
+            rule.get("rule_type") == RECORD_DATA_RULE_TYPE
+            and rule.get("sensitivity") != Sensitivity.DATASET.value
+            and not rule.get("datasets")
+            and not (domain and self.is_relationship_dataset(domain))
+            and all(
+                operation.get("operator") in RECORD_INDEPENDENT_OPERATIONS
+                and not operation.get("group")
+                for operation in rule.get("operations") or []
+            )
+            and all(
+                action.get("name") == "generate_dataset_error_objects"
+                for action in rule.get("actions") or []
+            )
+            and not any(
+                self._condition_depends_on_other_records(condition)
+                for condition in conditions.values()
+            )
+        )
+
+    @staticmethod
+    def _condition_depends_on_other_records(condition: dict) -> bool:
+        """
+        Checks if the result of the condition for a record
+        depends on other records of the dataset.
+        """
+        operator: str = condition.get("operator")
+        if operator in DATASET_CONTEXT_OPERATORS:
+            return True
+        value: dict = condition.get("value") or {}
+        # a comparator column is compared with the values of all records
+        return (
+            operator in COLUMN_COMPARATOR_CONTEXT_OPERATORS
+            and not isinstance(value.get("comparator"), list)
+            and not value.get("value_is_literal", False)
+        )
+
     def get_size_unit_from_rule(self, rule: dict) -> Optional[str]:
         """
         Extracts size unit from rule if it was passed
@@ -453,6 +531,79 @@ class RuleProcessor:
         )
         return is_suitable
 
+    def is_applicable(
+        self,
+        rule: dict,
+        dataset_domain: str,
+        is_split_domain: bool,
+        get_dataset_class: Callable[[], Optional[str]],
+    ) -> bool:
+        """
+        Same check as is_suitable_for_validation, but the dataset class
+        is given by the caller and requested only if the rule
+        includes or excludes classes.
+        """
+        if not (
+            self.valid_rule_structure(rule)
+            and self.rule_applies_to_domain(dataset_domain, rule, is_split_domain)
+        ):
+            return False
+        classes = rule.get("classes") or {}
+        included_classes = classes.get("Include", [])
+        if not included_classes and not classes.get("Exclude"):
+            return True
+        if ALL_KEYWORD in included_classes:
+            return True
+        return self.rule_applies_to_class_name(rule, get_dataset_class())
+
+    @classmethod
+    def get_domains_read_by_rule(
+        cls, rule: dict, dataset_domain: str
+    ) -> Optional[Set[str]]:
+        """
+        Returns the domains whose datasets are read when the rule
+        is validated against the given domain.
+        Returns None if the rule may read any dataset of the study.
+        """
+        if cls._reads_related_domains(dataset_domain):
+            return None
+        if rule.get("rule_type") in cls._RULE_TYPES_READING_ALL_DATASETS:
+            return None
+        domains: Set[str] = {dataset_domain}
+        for merged_dataset in rule.get("datasets") or []:
+            domain_name: str = merged_dataset.get("domain_name") or ""
+            if "--" in domain_name or cls._reads_related_domains(domain_name):
+                return None
+            domains.add(domain_name)
+        for operation in rule.get("operations") or []:
+            operator: str = operation.get("operator")
+            if operator in cls._OPERATIONS_READING_ALL_DATASETS:
+                return None
+            if operator == "dy":
+                domains.add("DM")
+            domains.add(operation.get("domain", dataset_domain))
+        return domains
+
+    # rule types and operations that read datasets of other domains
+    _RULE_TYPES_READING_ALL_DATASETS = (
+        RuleTypes.DOMAIN_PRESENCE_CHECK.value,
+        RuleTypes.DATASET_METADATA_CHECK_AGAINST_DEFINE.value,
+    )
+    _OPERATIONS_READING_ALL_DATASETS = (
+        "get_parent_model_column_order",
+        "study_domains",
+        "variable_count",
+        "variable_value_count",
+    )
+
+    @staticmethod
+    def _reads_related_domains(domain: str) -> bool:
+        return (
+            domain in ("RELREC", "RELSUB", "CO")
+            or is_supp_domain(domain)
+            or is_ap_domain(domain)
+        )
+
     @staticmethod
     def extract_target_names_from_rule(
         rule: dict, domain: str, column_names: List[str]
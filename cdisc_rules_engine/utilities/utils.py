@@ -6,7 +6,7 @@ import copy
 import os
 import re
 from datetime import datetime
-from typing import Callable, List, Optional, Set, Union
+from typing import Callable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from cdisc_rules_engine.constants.domains import (
@@ -19,6 +19,7 @@ from cdisc_rules_engine.constants.classes import SPECIAL_PURPOSE
 from cdisc_rules_engine.enums.execution_status import ExecutionStatus
 from cdisc_rules_engine.interfaces import ConditionInterface
 from cdisc_rules_engine.models.base_validation_entity import BaseValidationEntity
+from cdisc_rules_engine.models.dataset_types import DatasetTypes
 
 
 def convert_file_size(size_in_bytes: int, desired_unit: str) -> float:
@@ -129,6 +130,43 @@ def get_dataset_cache_key_from_path(dataset_path: str, dataset_type: str) -> str
     )
 
 
+def get_dataset_path_from_cache_key(cache_key: str) -> Optional[str]:
+    """
+    Reverses DATASET_CACHE_KEY_TEMPLATE.
+    Returns None if the key is not a dataset cache key.
+    """
+    # longer types first, "raw_metadata" also ends with "_metadata"
+    for dataset_type in sorted(DatasetTypes.values(), key=len, reverse=True):
+        suffix: str = f"_{dataset_type}"
+        if cache_key.endswith(suffix):
+            return cache_key[: -len(suffix)]
+    return None
+
+
+def get_dataset_fingerprint(dataset_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Returns the size and modification time of a local dataset file.
+    The fingerprint changes when the file is rewritten, so it can be used
+    to detect stale cached data. Returns None if the file does not exist.
+    """
+    try:
+        stat = os.stat(dataset_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_define_xml_cache_key_prefix(define_xml_path: str) -> str:
+    """
+    Returns the prefix of the cache keys of metadata read from
+    a Define-XML file. It changes when the file is rewritten.
+    """
+    fingerprint = get_dataset_fingerprint(define_xml_path)
+    if fingerprint is None:
+        return define_xml_path
+    return f"{define_xml_path}:{fingerprint[0]}:{fingerprint[1]}"
+
+
 def is_supp_domain(dataset_domain: str) -> bool:
     """
     Returns true if domain name starts with SUPP or SQ
@@ -282,6 +320,14 @@ def get_meddra_code_term_pairs_cache_key(meddra_path: str) -> str:
     return f"meddra_valid_code_term_pairs_{meddra_path}"
 
 
+def get_meddra_code_hierarchies_cache_key(meddra_path: str) -> str:
+    return f"meddra_valid_code_hierarchies_{meddra_path}"
+
+
+def get_meddra_term_hierarchies_cache_key(meddra_path: str) -> str:
+    return f"meddra_valid_term_hierarchies_{meddra_path}"
+
+
 def get_item_index_by_condition(
     lit_of_dicts: List[dict], condition: Callable
 ) -> Optional[int]:
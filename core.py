@@ -5,7 +5,7 @@ import os
 import pickle
 from datetime import datetime
 from multiprocessing import freeze_support
-from typing import Tuple
+from typing import List, Tuple
 
 import click
 from pathlib import Path
@@ -13,14 +13,24 @@ from cdisc_rules_engine.config import config
 from cdisc_rules_engine.enums.default_file_paths import DefaultFilePaths
 from cdisc_rules_engine.enums.progress_parameter_options import ProgressParameterOptions
 from cdisc_rules_engine.enums.report_types import ReportTypes
+from cdisc_rules_engine.enums.schedule_parameter_options import (
+    ScheduleParameterOptions,
+)
 from cdisc_rules_engine.enums.dataformat_types import DataFormatTypes
+from cdisc_rules_engine.enums.executor_parameter_options import (
+    ExecutorParameterOptions,
+)
 from cdisc_rules_engine.models.validation_args import Validation_args
 from cdisc_rules_engine.models.test_args import TestArgs
-from scripts.run_validation import run_validation
+from scripts.run_validation import run_batch_validation
+from scripts.script_utils import get_library_source_files, read_manifest
 from scripts.test_rule import test as test_rule
+from scripts.validation_server import DEFAULT_HOST, DEFAULT_PORT
+from scripts.validation_server import serve as serve_validations
 from cdisc_rules_engine.services.cache.cache_populator_service import CachePopulator
 from cdisc_rules_engine.services.cache.cache_service_factory import CacheServiceFactory
 from cdisc_rules_engine.services.cdisc_library_service import CDISCLibraryService
+from cdisc_rules_engine.services.executors import run_queue_workers
 from cdisc_rules_engine.utilities.utils import (
     generate_report_filename,
     get_rules_cache_key,
@@ -44,6 +54,33 @@ def valid_data_file(data_path: list) -> Tuple[list, set]:
         return file_list, found_formats
 
 
+def get_manifest_studies(
+    ctx: click.Context, logger: logging.Logger, manifest: str, has_data: bool
+) -> List[dict]:
+    if has_data:
+        logger.error(
+            "Argument --manifest cannot be used together with "
+            "arguments --data, --dataset-path"
+        )
+        ctx.exit()
+    try:
+        studies: List[dict] = read_manifest(manifest)
+    except (OSError, ValueError) as e:
+        logger.error(f"Invalid manifest {manifest}: {e}")
+        ctx.exit()
+    for study in studies:
+        study["dataset_paths"], found_formats = valid_data_file(
+            study["dataset_paths"]
+        ) or ([], set())
+        if len(found_formats) != 1:
+            logger.error(
+                f"Datasets of study {study['output']} must have one of the "
+                f"allowed file formats, found: {', '.join(found_formats)}."
+            )
+            ctx.exit()
+    return studies
+
+
 @click.group()
 def cli():
     pass
@@ -147,6 +184,64 @@ def cli():
     ),
 )
 @click.option("-dxp", "--define-xml-path", required=False, help="Path to Define-XML")
+@click.option(
+    "-sc",
+    "--schedule",
+    default=ScheduleParameterOptions.RULE.value,
+    type=click.Choice(ScheduleParameterOptions.values()),
+    help=(
+        "Defines how validation work is split between processes. "
+        '"rule" runs each rule against all datasets in a separate process. '
+        '"dataset" runs all rules against each domain in a separate process, '
+        "so every dataset file is parsed once per validation."
+    ),
+)
+@click.option(
+    "-dc",
+    "--dataset-cache",
+    required=False,
+    help=(
+        "Path to a directory for the persistent dataset cache. "
+        "Parsed datasets are stored there in a columnar format "
+        "and reused by later validations until the dataset file "
+        "or the engine version changes."
+    ),
+)
+@click.option(
+    "-rs",
+    "--result-store",
+    required=False,
+    help=(
+        "Path to a file storing the results of validations. "
+        "Rules are validated again only against the domains "
+        "whose datasets, rules or library metadata changed "
+        "since the results were stored."
+    ),
+)
+@click.option(
+    "-ex",
+    "--executor",
+    default=ExecutorParameterOptions.LOCAL.value,
+    type=click.Choice(ExecutorParameterOptions.values()),
+    help=(
+        "Defines where validation tasks run. "
+        '"local" runs them in processes on this machine. '
+        '"redis" pushes them to a Redis task queue, '
+        "where workers started with the worker command pull them. "
+        "The workers must read the datasets from the same paths."
+    ),
+)
+@click.option(
+    "-m",
+    "--manifest",
+    required=False,
+    help=(
+        "Path to a JSON manifest of studies to validate in one run, "
+        "used instead of --data and --dataset-path. "
+        "The studies share the other options, the library metadata "
+        "and the validation processes, and each study gets its own report."
+    ),
+)
 @click.pass_context
 def validate(
     ctx,
@@ -168,6 +263,11 @@ def validate(
     rules: Tuple[str],
     progress: str,
     define_xml_path: str,
+    schedule: str,
+    dataset_cache: str,
+    result_store: str,
+    executor: str,
+    manifest: str,
 ):
     """
     Validate data using CDISC Rules Engine
@@ -191,7 +291,13 @@ def validate(
 
     print(os.path.dirname(__file__))
 
-    if data:
+    studies: List[dict] = []
+    if manifest:
+        studies = get_manifest_studies(
+            ctx, logger, manifest, bool(data or dataset_path)
+        )
+        dataset_paths = None
+    elif data:
         if dataset_path:
             logger.error(
                 "Argument --dataset-path cannot be used together with argument --data"
@@ -219,31 +325,45 @@ def validate(
             ctx.exit()
     else:
         logger.error(
-            "You must pass one of the following arguments: --dataset-path, --data"
+            "You must pass one of the following arguments: "
+            "--dataset-path, --data, --manifest"
         )
         # no need to define dataset_paths here, the program execution will stop
         ctx.exit()
 
-    run_validation(
-        Validation_args(
-            cache_path,
-            pool_size,
-            dataset_paths,
-            log_level,
-            report_template,
-            standard,
-            version,
-            set(controlled_terminology_package),  # avoiding duplicates
-            output,
-            set(output_format),  # avoiding duplicates
-            raw_report,
-            define_version,
-            whodrug,
-            meddra,
-            rules,
-            progress,
-            define_xml_path,
-        )
+    args = Validation_args(
+        cache_path,
+        pool_size,
+        dataset_paths,
+        log_level,
+        report_template,
+        standard,
+        version,
+        set(controlled_terminology_package),  # avoiding duplicates
+        output,
+        set(output_format),  # avoiding duplicates
+        raw_report,
+        define_version,
+        whodrug,
+        meddra,
+        rules,
+        progress,
+        define_xml_path,
+        schedule,
+        dataset_cache,
+        result_store,
+        executor,
+    )
+    run_batch_validation(
+        [
+            args._replace(
+                dataset_paths=study["dataset_paths"],
+                define_xml_path=study["define_xml_path"] or define_xml_path,
+                output=study["output"],
+            )
+            for study in studies
+        ]
+        or [args]
     )
 
 
@@ -286,6 +406,10 @@ def update_cache(ctx: click.Context, cache_path: str, apikey: str):
     cache_populator.save_variables_metadata_locally(
         os.path.join(cache_path, DefaultFilePaths.VARIABLE_METADATA_CACHE_FILE.value)
     )
+    cache_populator.save_library_metadata_store_locally(
+        os.path.join(cache_path, DefaultFilePaths.LIBRARY_METADATA_STORE_FILE.value),
+        get_library_source_files(cache_path),
+    )
 
 
 @click.command()
@@ -488,6 +612,59 @@ def list_ct(cache_path: str, subsets: Tuple[str]):
             print(os.path.splitext(file)[0])
 
 
+@click.command()
+@click.option(
+    "-ca",
+    "--cache",
+    default=DefaultFilePaths.CACHE.value,
+    help="Relative path to cache files containing pre loaded metadata and rules",
+)
+@click.option(
+    "-ps",
+    "--pool-size",
+    default=10,
+    type=int,
+    help="Number of parallel processes for validation",
+)
+@click.option("--host", default=DEFAULT_HOST, help="Host to listen on")
+@click.option("--port", default=DEFAULT_PORT, type=int, help="Port to listen on")
+def serve(cache: str, pool_size: int, host: str, port: int):
+    """
+    Run a validation server keeping the engine, the library metadata
+    and the rules loaded between validations.
+    Validations are submitted with scripts/validation_client.py.
+
+    Example:
+
+    python core.py serve --port 8765
+    """
+    serve_validations(
+        os.path.join(os.path.dirname(__file__), cache), pool_size, host, port
+    )
+
+
+@click.command()
+@click.option(
+    "-ps",
+    "--pool-size",
+    default=10,
+    type=int,
+    help="Number of worker processes on this node",
+)
+def worker(pool_size: int):
+    """
+    Run worker processes validating the tasks of validations
+    started with --executor redis.
+    The Redis connection is configured with the REDIS_HOST_NAME,
+    REDIS_ACCESS_KEY, REDIS_PORT and REDIS_SSL environment variables.
+
+    Example:
+
+    python core.py worker -ps 8
+    """
+    run_queue_workers(config, pool_size)
+
+
 cli.add_command(validate)
 cli.add_command(update_cache)
 cli.add_command(list_rules)
@@ -496,6 +673,8 @@ cli.add_command(list_dataset_metadata)
 cli.add_command(test)
 cli.add_command(version)
 cli.add_command(list_ct)
+cli.add_command(serve)
+cli.add_command(worker)
 
 if __name__ == "__main__":
     freeze_support()
@@ -0,0 +1,101 @@
+"""
+Compares the operators of the dataset variable with the business_rules
+dataframe operators they override, one operator at a time,
+on an adverse events (AE) dataset.
+
+Usage:
+    python -m scripts.benchmark_dataset_operators
+    python -m scripts.benchmark_dataset_operators -d path/to/ae.xpt -o matches_regex
+"""
+import time
+
+import click
+import numpy as np
+import pandas as pd
+from business_rules.operators import DataframeType
+
+from cdisc_rules_engine.models.dataset_operators import DatasetOperators
+
+OPERATOR_VALUES: dict = {
+    "matches_regex": {"target": "--TERM", "comparator": "^[A-Z ]+$"},
+    "not_matches_regex": {"target": "--DECOD", "comparator": "^[A-Z ]+$"},
+    "prefix_matches_regex": {"target": "--TERM", "comparator": "^H", "prefix": 2},
+    "suffix_matches_regex": {"target": "--TERM", "comparator": "A$", "suffix": 1},
+    "invalid_date": {"target": "--STDTC"},
+    "is_complete_date": {"target": "--STDTC"},
+    "is_incomplete_date": {"target": "--ENDTC"},
+    "date_less_than": {"target": "--STDTC", "comparator": "--ENDTC"},
+    "date_greater_than": {
+        "target": "--ENDTC",
+        "comparator": "2022-01-01",
+        "date_component": "year",
+    },
+}
+
+
+def generate_ae_dataset(length: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    terms = ["HEADACHE", "NAUSEA", "Fatigue", "BACK PAIN", "RASH", ""]
+    start_dates = pd.date_range("2021-01-01", periods=700).strftime("%Y-%m-%d")
+    end_dates = pd.date_range("2021-01-01T08:00", periods=700).strftime(
+        "%Y-%m-%dT%H:%M"
+    )
+    return pd.DataFrame(
+        {
+            "STUDYID": "CDISC01",
+            "DOMAIN": "AE",
+            "USUBJID": [f"CDISC01-{i // 10:06d}" for i in range(length)],
+            "AESEQ": np.arange(1, length + 1, dtype=np.float64),
+            "AETERM": rng.choice(terms, length),
+            "AEDECOD": rng.choice(terms, length),
+            "AESTDTC": rng.choice(list(start_dates) + ["2021-02", ""], length),
+            "AEENDTC": rng.choice(list(end_dates) + ["2021-03"], length),
+        }
+    )
+
+
+def measure(operator_type: type, operator: str, dataset: pd.DataFrame):
+    operators = operator_type(
+        {"value": dataset.copy(), "column_prefix_map": {"--": "AE"}}
+    )
+    start = time.perf_counter()
+    result = getattr(operators, operator)(OPERATOR_VALUES[operator])
+    return result, time.perf_counter() - start
+
+
+@click.command()
+@click.option(
+    "-d", "--dataset-path", default=None, help="Path to .xpt file of AE dataset."
+)
+@click.option(
+    "-l",
+    "--length",
+    default=200_000,
+    help="Number of records of the generated dataset, if no dataset is given.",
+)
+@click.option(
+    "-o",
+    "--operator",
+    "operators",
+    multiple=True,
+    type=click.Choice(list(OPERATOR_VALUES)),
+    help="Operators to measure, all of them by default.",
+)
+def benchmark(dataset_path: str, length: int, operators: tuple):
+    if dataset_path:
+        dataset = pd.read_sas(dataset_path, format="xport", encoding="utf-8")
+    else:
+        dataset = generate_ae_dataset(length)
+    click.echo(f"Records: {len(dataset)}")
+    for operator in operators or OPERATOR_VALUES:
+        expected, business_rules_time = measure(DataframeType, operator, dataset)
+        result, engine_time = measure(DatasetOperators, operator, dataset)
+        assert result.tolist() == expected.tolist()
+        click.echo(
+            f"{operator}: business_rules {business_rules_time:.3f} s, "
+            f"engine {engine_time:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,73 @@
+"""
+Compares the vectorized float normalization of the data readers
+with the element-wise rounding on a laboratory (LB) dataset.
+
+Usage:
+    python -m scripts.benchmark_float_normalization
+    python -m scripts.benchmark_float_normalization -d path/to/lb.xpt
+"""
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from cdisc_rules_engine.services.data_readers.float_normalization import (
+    normalize_floats,
+)
+
+
+def generate_lb_dataset(length: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    results = rng.lognormal(2, 1.5, length)
+    return pd.DataFrame(
+        {
+            "STUDYID": "CDISC01",
+            "DOMAIN": "LB",
+            "USUBJID": [f"CDISC01-{i // 100:06d}" for i in range(length)],
+            "LBSEQ": np.arange(1, length + 1, dtype=np.float64),
+            "LBTESTCD": rng.choice(["ALT", "AST", "GLUC", "HGB", "WBC"], length),
+            "LBORRES": results.astype(str),
+            "LBSTRESN": results,
+            "LBSTNRLO": rng.uniform(0, 1, length),
+            "LBSTNRHI": rng.uniform(1, 100, length),
+            "VISITNUM": rng.integers(1, 12, length).astype(np.float64),
+            "LBDY": rng.integers(-10, 300, length).astype(np.float64),
+        }
+    )
+
+
+def measure(function, dataset: pd.DataFrame):
+    start = time.perf_counter()
+    result = function(dataset.copy())
+    return result, time.perf_counter() - start
+
+
+@click.command()
+@click.option(
+    "-d", "--dataset-path", default=None, help="Path to .xpt file of LB dataset."
+)
+@click.option(
+    "-l",
+    "--length",
+    default=1_000_000,
+    help="Number of records of the generated dataset, if no dataset is given.",
+)
+def benchmark(dataset_path: str, length: int):
+    if dataset_path:
+        dataset = pd.read_sas(dataset_path, format="xport", encoding="utf-8")
+    else:
+        dataset = generate_lb_dataset(length)
+    expected, elementwise_time = measure(
+        lambda df: df.applymap(lambda x: round(x, 15) if isinstance(x, float) else x),
+        dataset,
+    )
+    result, vectorized_time = measure(normalize_floats, dataset)
+    pd.testing.assert_frame_equal(result, expected)
+    click.echo(f"Records: {len(dataset)}")
+    click.echo(f"Element-wise rounding: {elementwise_time:.3f} s")
+    click.echo(f"Vectorized normalization: {vectorized_time:.3f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,16 +1,37 @@
 import itertools
+import json
+import os
 import time
-from functools import partial
-from multiprocessing import Pool
 from multiprocessing.managers import SyncManager
-from typing import List, Iterable, Callable
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from cdisc_rules_engine.config import config
+from cdisc_rules_engine.constants.define_xml_constants import DEFINE_XML_FILE_NAME
+from cdisc_rules_engine.enums.default_file_paths import DefaultFilePaths
+from cdisc_rules_engine.enums.execution_status import ExecutionStatus
 from cdisc_rules_engine.enums.progress_parameter_options import ProgressParameterOptions
+from cdisc_rules_engine.enums.schedule_parameter_options import (
+    ScheduleParameterOptions,
+)
+from cdisc_rules_engine.interfaces import (
+    ConditionInterface,
+    DataServiceInterface,
+    TaskExecutorInterface,
+)
 from cdisc_rules_engine.models.library_metadata_container import (
     LibraryMetadataContainer,
 )
-from cdisc_rules_engine.models.rule_conditions import ConditionCompositeFactory
+from cdisc_rules_engine.models.rule_plan import compile_conditions
 from cdisc_rules_engine.models.rule_validation_result import RuleValidationResult
 from cdisc_rules_engine.models.validation_args import Validation_args
 from cdisc_rules_engine.rules_engine import RulesEngine
@@ -18,18 +39,30 @@ from cdisc_rules_engine.services import logger as engine_logger
 from cdisc_rules_engine.services.cache import (
     InMemoryCacheService,
     RedisCacheService,
+    TieredCacheService,
+    ValidationResultStore,
 )
-from cdisc_rules_engine.services.data_services import (
-    DataServiceFactory,
+from cdisc_rules_engine.services.cache.tiered_cache_service import (
+    DEFAULT_L1_CACHE_MAX_SIZE,
 )
+from cdisc_rules_engine.services.executors import TaskExecutorFactory
+from cdisc_rules_engine.services.data_services import DataServiceFactory
 from scripts.script_utils import (
     fill_cache_with_dictionaries,
     get_cache_service,
+    get_library_cache_files,
     get_library_metadata_from_cache,
-    get_rules,
+    get_rule_plans,
 )
 from cdisc_rules_engine.services.reporting import BaseReport, ReportFactory
+from cdisc_rules_engine.utilities.rule_cost_estimator import (
+    RuleCostEstimator,
+    RuleTimingHistory,
+)
+from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
+from cdisc_rules_engine.utilities.utils import is_split_dataset
 from cdisc_rules_engine.utilities.progress_displayers import get_progress_displayer
+from version import __version__
 from warnings import simplefilter
 
 simplefilter(
@@ -46,20 +79,216 @@ class CacheManager(SyncManager):
     pass
 
 
+"""
+Objects shared by every task of a validation run.
+They are installed once per worker process by the pool initializer,
+so tasks only carry the index of the study and the rule
+or the domain to validate.
+"""
+_worker_context: dict = {}
+
+
+class StudyContext(NamedTuple):
+    """
+    Inputs of the tasks of one study.
+    applicable_domains maps rule core ids to the domains
+    the rule is validated against in this run.
+    """
+
+    datasets: List[dict]
+    args: Validation_args
+    applicable_domains: Optional[Dict[str, FrozenSet[str]]] = None
+
+
+def init_worker(
+    cache,
+    library_metadata: LibraryMetadataContainer,
+    rules: List[dict],
+    studies: List[StudyContext],
+):
+    """
+    Pool initializer. With the fork start method the arguments are
+    inherited by the worker, otherwise they are pickled once per worker
+    instead of once per task.
+    The shared cache is wrapped with a process-local cache,
+    so repeated reads of the same dataset do not go through the manager.
+    Workers of a distributed executor get no cache, as they can't reach
+    the one of the coordinator, and read the datasets into their own.
+    The data service of each study is created by the first task
+    of the study the worker runs.
+    """
+    if cache is None:
+        worker_cache = InMemoryCacheService()
+        fill_cache_with_dictionaries(worker_cache, studies[0].args)
+    else:
+        worker_cache = TieredCacheService(
+            cache,
+            max_size=int(
+                config.getValue("L1_CACHE_MAX_SIZE") or DEFAULT_L1_CACHE_MAX_SIZE
+            ),
+        )
+    _worker_context.update(
+        cache=worker_cache,
+        library_metadata=library_metadata,
+        rules=rules,
+        studies=studies,
+        data_services={},
+    )
+
+
+def _get_worker_data_service(study_index: int) -> DataServiceInterface:
+    """
+    Returns the data service reading the datasets of the study
+    through the cache of the worker.
+    """
+    data_services: Dict[int, DataServiceInterface] = _worker_context["data_services"]
+    if study_index not in data_services:
+        data_services[study_index] = get_study_data_service(
+            _worker_context["studies"][study_index].args,
+            _worker_context["cache"],
+            _worker_context["library_metadata"],
+        )
+    return data_services[study_index]
+
+
+def _start_worker_task():
+    """
+    Datasets may change between tasks of a long-running worker,
+    so the local cache checks the dataset files again once per task.
+    """
+    if isinstance(_worker_context["cache"], TieredCacheService):
+        _worker_context["cache"].refresh_fingerprints()
+
+
+def validate_rule_in_worker(
+    task: Tuple[int, dict]
+) -> Tuple[int, str, Dict[str, List[dict]], float]:
+    """
+    Validates the rule against the domains of the study.
+    Returns the study index, the rule core id, the rule results by domain
+    and the seconds spent validating the rule.
+    """
+    study_index, rule = task
+    _start_worker_task()
+    study: StudyContext = _worker_context["studies"][study_index]
+    start: float = time.perf_counter()
+    results: Dict[str, List[dict]] = validate_single_rule(
+        _worker_context["cache"],
+        study.datasets,
+        study.args,
+        _worker_context["library_metadata"],
+        rule,
+        study.applicable_domains[rule["core_id"]] if study.applicable_domains else None,
+        _get_worker_data_service(study_index),
+    )
+    return study_index, rule["core_id"], results, time.perf_counter() - start
+
+
+def validate_domain_in_worker(
+    task: Tuple[int, str]
+) -> Tuple[int, str, Dict[str, List[dict]], Dict[str, float]]:
+    """
+    Validates the rules that apply to the domain of the study.
+    Returns the study index followed by the result of validate_dataset_group.
+    """
+    study_index, domain = task
+    _start_worker_task()
+    study: StudyContext = _worker_context["studies"][study_index]
+    rules: List[dict] = _worker_context["rules"]
+    if study.applicable_domains:
+        rules = [
+            rule
+            for rule in rules
+            if domain in study.applicable_domains[rule["core_id"]]
+        ]
+    return (
+        study_index,
+        *validate_dataset_group(
+            _worker_context["cache"],
+            study.datasets,
+            study.args,
+            _worker_context["library_metadata"],
+            rules,
+            domain,
+            _get_worker_data_service(study_index),
+        ),
+    )
+
+
 def validate_single_rule(
     cache,
     datasets,
     args: Validation_args,
     library_metadata: LibraryMetadataContainer,
     rule: dict = None,
-):
-    rule["conditions"] = ConditionCompositeFactory.get_condition_composite(
-        rule["conditions"]
-    )
+    applicable_domains: FrozenSet[str] = None,
+    data_service: DataServiceInterface = None,
+) -> Dict[str, List[dict]]:
+    """
+    Validates a rule against all domains, or only against
+    the given domains, and returns the results by domain.
+    The datasets are read by the given data service
+    or by the one created by the data service factory.
+    """
+    rule["conditions"] = compile_conditions(rule["conditions"])
     set_log_level(args)
     # call rule engine
     engine = RulesEngine(
         cache=cache,
+        data_service=data_service,
+        standard=args.standard,
+        standard_version=args.version.replace(".", "-"),
+        ct_packages=args.controlled_terminology_package,
+        meddra_path=args.meddra,
+        whodrug_path=args.whodrug,
+        define_xml_path=args.define_xml_path,
+        library_metadata=library_metadata,
+        dataset_cache_path=args.dataset_cache_path,
+    )
+    domain_datasets: List[dict] = [
+        dataset
+        for dataset in get_unique_domain_datasets(datasets)
+        if applicable_domains is None or dataset["domain"] in applicable_domains
+    ]
+    # the next datasets are read while the rule is validated
+    engine.data_service.prefetch_datasets(
+        get_prefetch_paths(
+            [rule], [dataset["domain"] for dataset in domain_datasets], datasets
+        )
+    )
+    results = {}
+    try:
+        for dataset in domain_datasets:
+            results[dataset["domain"]] = engine.validate_single_rule(
+                rule, dataset["full_path"], datasets, dataset["domain"]
+            )
+    finally:
+        engine.data_service.prefetch_datasets([])
+    if args.progress == ProgressParameterOptions.VERBOSE_OUTPUT.value:
+        engine_logger.log(f"{rule['core_id']} validation complete")
+    return results
+
+
+def validate_dataset_group(
+    cache,
+    datasets,
+    args: Validation_args,
+    library_metadata: LibraryMetadataContainer,
+    rules: List[dict],
+    domain: str = None,
+    data_service: DataServiceInterface = None,
+) -> Tuple[str, Dict[str, List[dict]], Dict[str, float]]:
+    """
+    Validates all rules against a single domain.
+    The worker owns the domain, so its dataset is read
+    once and then served from the cache for every rule.
+    Returns the domain, a map of rule core id to the rule results
+    and a map of rule core id to the seconds spent validating the rule.
+    """
+    set_log_level(args)
+    engine = RulesEngine(
+        cache=cache,
+        data_service=data_service,
         standard=args.standard,
         standard_version=args.version.replace(".", "-"),
         ct_packages=args.controlled_terminology_package,
@@ -67,25 +296,281 @@ def validate_single_rule(
         whodrug_path=args.whodrug,
         define_xml_path=args.define_xml_path,
         library_metadata=library_metadata,
+        dataset_cache_path=args.dataset_cache_path,
     )
-    results = []
+    dataset: dict = next(dataset for dataset in datasets if dataset["domain"] == domain)
+    # datasets of other domains the rules read are read in the background
+    engine.data_service.prefetch_datasets(get_prefetch_paths(rules, [domain], datasets))
+    results = {}
+    durations = {}
+    try:
+        # rules on the domain share the masks of their conditions
+        with engine.shared_predicates():
+            for rule in rules:
+                start: float = time.perf_counter()
+                rule["conditions"] = compile_conditions(rule["conditions"])
+                results[rule["core_id"]] = engine.validate_single_rule(
+                    rule, dataset["full_path"], datasets, domain
+                )
+                durations[rule["core_id"]] = time.perf_counter() - start
+    finally:
+        engine.data_service.prefetch_datasets([])
+    if args.progress == ProgressParameterOptions.VERBOSE_OUTPUT.value:
+        engine_logger.log(f"{domain} validation complete")
+    return domain, results, durations
+
+
+def get_unique_domain_datasets(datasets: List[dict]) -> List[dict]:
+    """
+    Returns the first dataset of each domain.
+    This addresses the case where a domain is split
+    and appears multiple times within the list of datasets.
+    """
     validated_domains = set()
+    unique_datasets = []
     for dataset in datasets:
-        # Check if the domain has been validated before
-        # This addresses the case where a domain is split
-        # and appears multiple times within the list of datasets
         if dataset["domain"] not in validated_domains:
             validated_domains.add(dataset["domain"])
-            results.append(
-                engine.validate_single_rule(
-                    rule, dataset["full_path"], datasets, dataset["domain"]
+            unique_datasets.append(dataset)
+    return unique_datasets
+
+
+def get_prefetch_paths(
+    rules: List[dict], domains: List[str], datasets: List[dict]
+) -> List[str]:
+    """
+    Returns the paths of the datasets read when the rules are validated
+    against the domains, in the order they are first read.
+    Datasets of rules that may read any dataset are left out.
+    """
+    paths_by_domain: Dict[str, str] = {
+        dataset["domain"]: dataset["full_path"]
+        for dataset in get_unique_domain_datasets(datasets)
+    }
+    paths: Dict[str, None] = {}
+    for domain in domains:
+        paths[paths_by_domain[domain]] = None
+        for rule in rules:
+            read_domains = RuleProcessor.get_domains_read_by_rule(rule, domain)
+            for read_domain in sorted(read_domains or ()):
+                if read_domain in paths_by_domain:
+                    paths[paths_by_domain[read_domain]] = None
+    return list(paths)
+
+
+def get_applicable_domains(
+    rules: List[dict],
+    datasets: List[dict],
+    rule_processor: RuleProcessor,
+) -> Dict[str, FrozenSet[str]]:
+    """
+    Returns a map of rule core id to the domains the rule applies to.
+    The checks done by the rules engine before validation are applied
+    here, once, instead of in every worker. Dataset classes are detected
+    from dataset metadata, so datasets are not read to be skipped.
+    If a check can't be done up front, the domain is kept
+    and the rules engine repeats the check.
+    """
+    data_service = rule_processor.data_service
+    domain_datasets: List[dict] = get_unique_domain_datasets(datasets)
+    # class of the domain or the error raised while detecting it
+    dataset_classes: Dict[str, Union[str, None, Exception]] = {}
+
+    def get_dataset_class(dataset: dict) -> Optional[str]:
+        domain: str = dataset["domain"]
+        if domain not in dataset_classes:
+            try:
+                dataset_classes[domain] = data_service.get_dataset_class_from_metadata(
+                    dataset["full_path"], datasets, domain
                 )
+            except Exception as e:
+                dataset_classes[domain] = e
+        if isinstance(dataset_classes[domain], Exception):
+            raise dataset_classes[domain]
+        return dataset_classes[domain]
+
+    def rule_applies(rule: dict, dataset: dict) -> bool:
+        domain: str = dataset["domain"]
+        try:
+            return rule_processor.is_applicable(
+                rule,
+                domain,
+                is_split_dataset(datasets, domain),
+                lambda: get_dataset_class(dataset),
+            )
+        except Exception as e:
+            engine_logger.info(
+                f"Could not check if rule {rule.get('core_id')} applies "
+                f"to domain {domain} before validation. Error: {e}"
             )
+            return True
+
+    return {
+        rule["core_id"]: frozenset(
+            dataset["domain"]
+            for dataset in domain_datasets
+            if rule_applies(rule, dataset)
+        )
+        for rule in rules
+    }
 
-    results = list(itertools.chain(*results))
-    if args.progress == ProgressParameterOptions.VERBOSE_OUTPUT.value:
-        engine_logger.log(f"{rule['core_id']} validation complete")
-    return RuleValidationResult(rule, results)
+
+def merge_dataset_group_results(
+    rules: List[dict],
+    domains: List[str],
+    group_results: Iterable[Tuple[str, Dict[str, List[dict]]]],
+    applicable_domains: Dict[str, FrozenSet[str]] = None,
+) -> List[RuleValidationResult]:
+    """
+    Converts results produced per domain into results per rule.
+    Rule results keep the order of the domains in the list of datasets,
+    so the report matches the one produced by rule scheduling.
+    Domains a rule doesn't apply to are reported as skipped.
+    """
+    results_by_domain: Dict[str, Dict[str, List[dict]]] = dict(group_results)
+
+    def get_results(rule: dict, domain: str) -> List[dict]:
+        if applicable_domains and domain not in applicable_domains[rule["core_id"]]:
+            return RulesEngine.get_skipped_result(domain)
+        return results_by_domain.get(domain, {}).get(rule["core_id"], [])
+
+    return [
+        RuleValidationResult(
+            rule,
+            list(itertools.chain(*(get_results(rule, domain) for domain in domains))),
+        )
+        for rule in rules
+    ]
+
+
+def get_validation_context(
+    args: Validation_args, datasets: List[dict], store: ValidationResultStore
+) -> tuple:
+    """
+    Returns the inputs of the run that can change the result of any rule:
+    the engine version, the standard, the library metadata,
+    Define-XML and the external dictionaries.
+    """
+    define_paths: List[str] = (
+        [args.define_xml_path]
+        if args.define_xml_path
+        else sorted(
+            {
+                os.path.join(
+                    os.path.dirname(dataset["full_path"]), DEFINE_XML_FILE_NAME
+                )
+                for dataset in datasets
+            }
+        )
+    )
+    return (
+        __version__,
+        args.standard,
+        args.version,
+        args.define_version,
+        tuple(
+            (os.path.basename(file_path), store.get_path_digest(file_path))
+            for file_path in get_library_cache_files(args)
+        ),
+        tuple(store.get_path_digest(path) for path in define_paths),
+        store.get_path_digest(args.meddra),
+        store.get_path_digest(args.whodrug),
+    )
+
+
+def get_rule_digest(rule: dict) -> str:
+    conditions = rule.get("conditions")
+    if isinstance(conditions, ConditionInterface):
+        rule = {**rule, "conditions": conditions.to_dict()}
+    return json.dumps(rule, sort_keys=True, default=str)
+
+
+def get_result_keys(
+    rules: List[dict],
+    datasets: List[dict],
+    applicable_domains: Dict[str, FrozenSet[str]],
+    store: ValidationResultStore,
+    context: tuple,
+) -> Dict[Tuple[str, str], str]:
+    """
+    Returns the keys of the stored results of each rule
+    for each domain the rule applies to.
+    A key changes when the rule, the inputs shared by all rules
+    or the contents of any dataset the rule reads change.
+    """
+    dataset_digests: Dict[str, List[Tuple[str, str]]] = {}
+    for dataset in datasets:
+        dataset_digests.setdefault(dataset["domain"], []).append(
+            (dataset["filename"], store.get_file_digest(dataset["full_path"]))
+        )
+    keys: Dict[Tuple[str, str], str] = {}
+    for rule in rules:
+        rule_digest: str = get_rule_digest(rule)
+        for domain in applicable_domains[rule["core_id"]]:
+            read_domains = RuleProcessor.get_domains_read_by_rule(rule, domain)
+            inputs = sorted(
+                digest
+                for read_domain, digests in dataset_digests.items()
+                if read_domains is None or read_domain in read_domains
+                for digest in digests
+            )
+            keys[(rule["core_id"], domain)] = store.get_key(
+                rule_digest, context, domain, inputs
+            )
+    return keys
+
+
+def load_stored_results(
+    store: ValidationResultStore,
+    result_keys: Dict[Tuple[str, str], str],
+    applicable_domains: Dict[str, FrozenSet[str]],
+    results_by_domain: Dict[str, Dict[str, List[dict]]],
+) -> Dict[str, FrozenSet[str]]:
+    """
+    Adds the stored results to results_by_domain and returns
+    the domains each rule still has to be validated against.
+    """
+    stored_results: dict = store.get_many(result_keys.values())
+    engine_logger.info(
+        f"Reusing {len(stored_results)} stored results of rules and domains"
+    )
+    pending_domains: Dict[str, FrozenSet[str]] = {}
+    for core_id, domains in applicable_domains.items():
+        pending_domains[core_id] = frozenset(
+            domain
+            for domain in domains
+            if result_keys[(core_id, domain)] not in stored_results
+        )
+        for domain in domains - pending_domains[core_id]:
+            results_by_domain[domain][core_id] = stored_results[
+                result_keys[(core_id, domain)]
+            ]
+    return pending_domains
+
+
+def store_results(
+    store: ValidationResultStore,
+    result_keys: Dict[Tuple[str, str], str],
+    validated_domains: Dict[str, FrozenSet[str]],
+    results_by_domain: Dict[str, Dict[str, List[dict]]],
+):
+    """
+    Stores the results of the rules and domains validated in this run,
+    unless the validation ended with an execution error.
+    """
+    stored_statuses = (ExecutionStatus.SUCCESS.value, ExecutionStatus.SKIPPED.value)
+    items: Dict[str, List[dict]] = {}
+    for (core_id, domain), key in result_keys.items():
+        results: Optional[List[dict]] = results_by_domain[domain].get(core_id)
+        if (
+            domain in validated_domains[core_id]
+            and results is not None
+            and all(
+                result.get("executionStatus") in stored_statuses for result in results
+            )
+        ):
+            items[key] = results
+    store.add_many(items)
 
 
 def set_log_level(args):
@@ -98,43 +583,268 @@ def set_log_level(args):
         engine_logger.setLevel("verbose")
 
 
-def run_validation(args: Validation_args):
-    set_log_level(args)
-    # fill cache
+def start_cache_manager() -> CacheManager:
     CacheManager.register("RedisCacheService", RedisCacheService)
     CacheManager.register("InMemoryCacheService", InMemoryCacheService)
     manager = CacheManager()
     manager.start()
-    shared_cache = get_cache_service(manager)
+    return manager
+
+
+def get_study_data_service(
+    args: Validation_args, cache, library_metadata: LibraryMetadataContainer
+):
+    """
+    Creates the data service reading the datasets of the study.
+    Data services keep the datasets they were created for,
+    so each study gets its own.
+    """
+    return DataServiceFactory(
+        config,
+        cache,
+        args.standard,
+        args.version.replace(".", "-"),
+        library_metadata,
+    ).create_data_service(
+        args.dataset_paths, dataset_cache_path=args.dataset_cache_path
+    )
+
+
+def run_validation(args: Validation_args):
+    run_batch_validation([args])
+
+
+def run_batch_validation(studies: List[Validation_args]):
+    """
+    Validates one or more studies. The studies share the standard,
+    the controlled terminology, the dictionaries and the rules,
+    which are taken from the arguments of the first study.
+    """
+    args: Validation_args = studies[0]
+    set_log_level(args)
+    # fill cache
+    shared_cache = get_cache_service(start_cache_manager())
     engine_logger.info(f"Populating cache, cache path: {args.cache}")
     library_metadata: LibraryMetadataContainer = get_library_metadata_from_cache(args)
+    rules = [plan.rule for plan in get_rule_plans(args)]
+    validate_studies(studies, shared_cache, library_metadata, rules)
+
+
+class StudyValidation:
+    """
+    Validation of the datasets of one study. Keeps the domains each rule
+    applies to and collects the stored results and the results of the tasks.
+    """
+
+    def __init__(
+        self,
+        args: Validation_args,
+        shared_cache,
+        library_metadata: LibraryMetadataContainer,
+        rules: List[dict],
+        timing_history: RuleTimingHistory,
+    ):
+        self.args = args
+        self.data_service = get_study_data_service(args, shared_cache, library_metadata)
+        self.datasets: List[dict] = self.data_service.get_datasets()
+        engine_logger.info(
+            f"Running {len(rules)} rules against {len(self.datasets)} datasets"
+        )
+        self.applicable_domains: Dict[str, FrozenSet[str]] = get_applicable_domains(
+            rules,
+            self.datasets,
+            RuleProcessor(self.data_service, shared_cache, library_metadata),
+        )
+        self.domains: List[str] = [
+            dataset["domain"] for dataset in get_unique_domain_datasets(self.datasets)
+        ]
+        # results of each domain by rule core id
+        self.results_by_domain: Dict[str, Dict[str, List[dict]]] = {
+            domain: {} for domain in self.domains
+        }
+        # domains each rule is validated against in this run
+        self.pending_domains: Dict[str, FrozenSet[str]] = self.applicable_domains
+        self.result_keys: Dict[Tuple[str, str], str] = {}
+        self.store: Optional[ValidationResultStore] = (
+            ValidationResultStore(args.result_store_path)
+            if args.result_store_path
+            else None
+        )
+        if self.store:
+            self.result_keys = get_result_keys(
+                rules,
+                self.datasets,
+                self.applicable_domains,
+                self.store,
+                get_validation_context(args, self.datasets, self.store),
+            )
+            self.pending_domains = load_stored_results(
+                self.store,
+                self.result_keys,
+                self.applicable_domains,
+                self.results_by_domain,
+            )
+        self.cost_estimator = RuleCostEstimator(self.datasets, timing_history)
+        self.cost_estimator.calibrate(rules, self.pending_domains)
+        self.durations: Dict[str, float] = {}
+
+    def get_context(self) -> StudyContext:
+        return StudyContext(self.datasets, self.args, self.pending_domains)
+
+    def get_rule_tasks(self, rules: List[dict]) -> List[Tuple[float, dict]]:
+        """
+        Returns the rules to validate in separate processes
+        with their estimated durations.
+        """
+        return [
+            (
+                self.cost_estimator.estimate_rule(
+                    rule, self.pending_domains[rule["core_id"]]
+                ),
+                rule,
+            )
+            for rule in rules
+            if self.pending_domains[rule["core_id"]]
+        ]
+
+    def get_domain_tasks(self, rules: List[dict]) -> List[Tuple[float, str]]:
+        """
+        Returns the domains to validate in separate processes
+        with their estimated durations.
+        """
+        pending_for_any_rule: FrozenSet[str] = frozenset().union(
+            *self.pending_domains.values()
+        )
+        return [
+            (
+                self.cost_estimator.estimate_domain(
+                    domain, rules, self.pending_domains
+                ),
+                domain,
+            )
+            for domain in self.domains
+            if domain in pending_for_any_rule
+        ]
+
+    def add_rule_results(
+        self, core_id: str, results: Dict[str, List[dict]], duration: float
+    ):
+        for domain, rule_domain_results in results.items():
+            self.results_by_domain[domain][core_id] = rule_domain_results
+        self.durations[core_id] = duration
+
+    def add_domain_results(
+        self,
+        domain: str,
+        results: Dict[str, List[dict]],
+        durations: Dict[str, float],
+    ):
+        self.results_by_domain[domain].update(results)
+        for core_id, duration in durations.items():
+            self.durations[core_id] = self.durations.get(core_id, 0.0) + duration
+
+    def finish(
+        self, rules: List[dict], timing_history: RuleTimingHistory, elapsed_time: float
+    ):
+        """
+        Stores the new results, adds the durations of the rules
+        to the timing history and writes the reports.
+        """
+        # domains a rule doesn't apply to are reported as skipped
+        results: List[RuleValidationResult] = merge_dataset_group_results(
+            rules, self.domains, self.results_by_domain.items(), self.applicable_domains
+        )
+        if self.store:
+            store_results(
+                self.store,
+                self.result_keys,
+                self.pending_domains,
+                self.results_by_domain,
+            )
+        for core_id, duration in self.durations.items():
+            timing_history.update(
+                core_id,
+                duration,
+                self.cost_estimator.get_records(self.pending_domains[core_id]),
+            )
+        # build all desired reports
+        reporting_factory = ReportFactory(
+            self.datasets, results, elapsed_time, self.args, self.data_service
+        )
+        reporting_services: List[BaseReport] = reporting_factory.get_report_services()
+        for reporting_service in reporting_services:
+            reporting_service.write_report(self.args.define_xml_path)
+
+
+def validate_studies(
+    studies: List[Validation_args],
+    shared_cache,
+    library_metadata: LibraryMetadataContainer,
+    rules: List[dict],
+):
+    """
+    Validates the datasets of the studies against the rules
+    and writes the report of each study.
+    The shared cache, the library metadata and the rules
+    are prepared by the caller.
+    Tasks of all studies are run by one executor, a pool of processes
+    on this machine by default.
+    """
+    args: Validation_args = studies[0]
     # install dictionaries if needed
     fill_cache_with_dictionaries(shared_cache, args)
-    rules = get_rules(args)
-    data_service = DataServiceFactory(config, shared_cache).get_data_service(
-        args.dataset_paths
+    timing_history = RuleTimingHistory(
+        os.path.join(args.cache, DefaultFilePaths.RULE_TIMINGS_FILE.value)
     )
-    datasets = data_service.get_datasets()
-    engine_logger.info(f"Running {len(rules)} rules against {len(datasets)} datasets")
     start = time.time()
-    results = []
-    # run each rule in a separate process
-    with Pool(args.pool_size) as pool:
-        validation_results: Iterable[RuleValidationResult] = pool.imap_unordered(
-            partial(
-                validate_single_rule, shared_cache, datasets, args, library_metadata
-            ),
-            rules,
+    validations: List[StudyValidation] = [
+        StudyValidation(
+            study_args, shared_cache, library_metadata, rules, timing_history
         )
-        progress_handler: Callable = get_progress_displayer(args)
-        results = progress_handler(rules, validation_results, results)
-
-    # build all desired reports
-    end = time.time()
-    elapsed_time = end - start
-    reporting_factory = ReportFactory(
-        datasets, results, elapsed_time, args, data_service
+        for study_args in studies
+    ]
+    is_dataset_schedule: bool = args.schedule == ScheduleParameterOptions.DATASET.value
+    if is_dataset_schedule:
+        # run the rules that apply to each domain in a separate process
+        worker = validate_domain_in_worker
+        estimated_tasks = [
+            (duration, (index, domain))
+            for index, validation in enumerate(validations)
+            for duration, domain in validation.get_domain_tasks(rules)
+        ]
+    else:
+        # run each rule that applies to any domain in a separate process
+        worker = validate_rule_in_worker
+        estimated_tasks = [
+            (duration, (index, rule))
+            for index, validation in enumerate(validations)
+            for duration, rule in validation.get_rule_tasks(rules)
+        ]
+    # Tasks are submitted longest first and handed out one at a time,
+    # so idle workers take the next task and the run ends with short tasks.
+    estimated_tasks.sort(key=lambda estimated_task: estimated_task[0], reverse=True)
+    tasks: List[tuple] = [task for _, task in estimated_tasks]
+    progress_handler: Callable = get_progress_displayer(args)
+    executor: TaskExecutorInterface = TaskExecutorFactory(config).get_service(
+        args.executor, pool_size=args.pool_size
+    )
+    task_results = executor.imap_unordered(
+        worker,
+        tasks,
+        init_worker,
+        (
+            None if executor.is_distributed else shared_cache,
+            library_metadata,
+            rules,
+            [validation.get_context() for validation in validations],
+        ),
     )
-    reporting_services: List[BaseReport] = reporting_factory.get_report_services()
-    for reporting_service in reporting_services:
-        reporting_service.write_report(args.define_xml_path)
+    for study_index, *task_result in progress_handler(tasks, task_results, []):
+        if is_dataset_schedule:
+            validations[study_index].add_domain_results(*task_result)
+        else:
+            validations[study_index].add_rule_results(*task_result)
+    elapsed_time = time.time() - start
+    for validation in validations:
+        validation.finish(rules, timing_history, elapsed_time)
+    timing_history.save()
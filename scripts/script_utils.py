@@ -5,9 +5,14 @@ from cdisc_rules_engine.models.library_metadata_container import (
 from cdisc_rules_engine.services.data_services import (
     DataServiceFactory,
 )
-from typing import List
+from typing import Dict, List, Optional
 from cdisc_rules_engine.config import config
+from cdisc_rules_engine.enums.default_file_paths import DefaultFilePaths
+from cdisc_rules_engine.enums.library_metadata_types import LibraryMetadataTypes
+from cdisc_rules_engine.models.rule_plan import RulePlan, select_rule_plans
+from cdisc_rules_engine.services.cache import LibraryMetadataStore
 from cdisc_rules_engine.services import logger as engine_logger
+import json
 import os
 import pickle
 from cdisc_rules_engine.models.dictionaries import DictionaryTypes
@@ -23,7 +28,73 @@ from cdisc_rules_engine.utilities.utils import (
 )
 
 
+def get_library_source_files(cache_path: str) -> List[str]:
+    """
+    Returns the paths of the pickled cache files
+    the library metadata store is built from.
+    """
+    cache_files = next(os.walk(cache_path), (None, None, []))[2]
+    file_names: List[str] = [
+        file_path.value
+        for file_path in (
+            DefaultFilePaths.RULES_CACHE_FILE,
+            DefaultFilePaths.STANDARD_DETAILS_CACHE_FILE,
+            DefaultFilePaths.STANDARD_MODELS_CACHE_FILE,
+            DefaultFilePaths.VARIABLE_METADATA_CACHE_FILE,
+            DefaultFilePaths.VARIABLE_CODELIST_CACHE_FILE,
+        )
+    ] + sorted(file_name for file_name in cache_files if "ct-" in file_name)
+    return [os.path.join(cache_path, file_name) for file_name in file_names]
+
+
+def get_library_metadata_store(args) -> Optional[LibraryMetadataStore]:
+    """
+    Returns the indexed metadata store if update-cache has created it
+    in the cache directory and the pickled cache files
+    have not changed since.
+    """
+    store_file = os.path.join(
+        args.cache, DefaultFilePaths.LIBRARY_METADATA_STORE_FILE.value
+    )
+    if not os.path.isfile(store_file):
+        return None
+    store = LibraryMetadataStore(store_file)
+    if not store.is_up_to_date(get_library_source_files(args.cache)):
+        engine_logger.warning(
+            f"{store_file} is older than the cache files and is not used. "
+            "Run update-cache to rebuild it"
+        )
+        return None
+    return store
+
+
+def get_library_cache_files(args) -> List[str]:
+    """
+    Returns the paths of the cache files the library metadata
+    and the rules of a validation are loaded from.
+    """
+    file_names: List[str] = [
+        file_path.value
+        for file_path in (
+            DefaultFilePaths.RULES_CACHE_FILE,
+            DefaultFilePaths.STANDARD_DETAILS_CACHE_FILE,
+            DefaultFilePaths.STANDARD_MODELS_CACHE_FILE,
+            DefaultFilePaths.VARIABLE_METADATA_CACHE_FILE,
+            DefaultFilePaths.VARIABLE_CODELIST_CACHE_FILE,
+            DefaultFilePaths.CODELIST_TERM_MAP_CACHE_FILE,
+            DefaultFilePaths.LIBRARY_METADATA_STORE_FILE,
+        )
+    ] + [
+        f"{package}.pkl"
+        for package in sorted(args.controlled_terminology_package or [])
+    ]
+    return [os.path.join(args.cache, file_name) for file_name in file_names]
+
+
 def get_library_metadata_from_cache(args) -> LibraryMetadataContainer:
+    store: Optional[LibraryMetadataStore] = get_library_metadata_store(args)
+    if store:
+        return get_library_metadata_from_store(args, store)
     standards_file = os.path.join(args.cache, "standards_details.pkl")
     models_file = os.path.join(args.cache, "standards_models.pkl")
     variables_codelist_file = os.path.join(args.cache, "variable_codelist_maps.pkl")
@@ -79,10 +150,62 @@ def get_library_metadata_from_cache(args) -> LibraryMetadataContainer:
     )
 
 
+def get_library_metadata_from_store(
+    args, store: LibraryMetadataStore
+) -> LibraryMetadataContainer:
+    """
+    Loads only the metadata of the validated standard
+    and of the requested CT packages.
+    """
+    standard_metadata = (
+        store.get(
+            LibraryMetadataTypes.STANDARDS.value,
+            get_standard_details_cache_key(
+                args.standard, args.version.replace(".", "-")
+            ),
+        )
+        or {}
+    )
+    model_details = (
+        store.get(
+            LibraryMetadataTypes.MODELS.value,
+            get_model_details_cache_key_from_ig(standard_metadata),
+        )
+        or {}
+    )
+    variable_codelist_maps = store.get(
+        LibraryMetadataTypes.VARIABLE_CODELIST_MAPS.value,
+        get_standard_codelist_cache_key(args.standard, args.version),
+    )
+    variables_metadata = store.get(
+        LibraryMetadataTypes.VARIABLES_METADATA.value,
+        get_library_variables_metadata_cache_key(args.standard, args.version),
+    )
+    published_ct_packages = set(store.keys(LibraryMetadataTypes.CT_PACKAGES.value))
+    ct_package_data = store.get_many(
+        LibraryMetadataTypes.CT_PACKAGES.value,
+        [
+            ct_version
+            for ct_version in published_ct_packages
+            if args.controlled_terminology_package
+            and ct_version in args.controlled_terminology_package
+        ],
+    )
+    return LibraryMetadataContainer(
+        standard_metadata=standard_metadata,
+        model_metadata=model_details,
+        variable_codelist_map=variable_codelist_maps,
+        variables_metadata=variables_metadata,
+        ct_package_metadata=ct_package_data,
+        published_ct_packages=published_ct_packages,
+    )
+
+
 def fill_cache_with_dictionaries(cache: CacheServiceInterface, args):
     """
     Extracts file contents from provided dictionaries files
     and saves to cache (inmemory or redis).
+    Dictionaries already in the cache are not extracted again.
     """
     if not args.meddra and not args.whodrug:
         return
@@ -94,7 +217,7 @@ def fill_cache_with_dictionaries(cache: CacheServiceInterface, args):
         DictionaryTypes.WHODRUG: args.whodrug,
     }
     for dictionary_type, dictionary_path in dictionary_type_to_path_map.items():
-        if not dictionary_path:
+        if not dictionary_path or cache.exists(dictionary_path):
             continue
         terms = extract_dictionary_terms(data_service, dictionary_type, dictionary_path)
         cache.add(dictionary_path, terms)
@@ -113,28 +236,118 @@ def get_cache_service(manager):
 def get_rules(args) -> List[dict]:
     core_ids = set()
     rules_file = os.path.join(args.cache, "rules.pkl")
+    store: Optional[LibraryMetadataStore] = get_library_metadata_store(args)
     rules = []
     if args.rules:
         keys = [
             get_rules_cache_key(args.standard, args.version.replace(".", "-"), rule)
             for rule in args.rules
         ]
-        with open(rules_file, "rb") as f:
-            rules_data = pickle.load(f)
-            rules = [rules_data.get(key) for key in keys]
+        if store:
+            rules_data = store.get_many(LibraryMetadataTypes.RULES.value, keys)
+        else:
+            with open(rules_file, "rb") as f:
+                rules_data = pickle.load(f)
+        rules = [rules_data.get(key) for key in keys]
     else:
         engine_logger.warning(
             f"No rules specified. Running all rules for {args.standard}"
             + f" version {args.version}"
         )
-        with open(rules_file, "rb") as f:
-            rules_data = pickle.load(f)
-            for key, rule in rules_data.items():
-                core_id = rule.get("core_id")
-                rule_identifier = get_rules_cache_key(
-                    args.standard, args.version.replace(".", "-"), core_id
-                )
-                if core_id not in core_ids and key == rule_identifier:
-                    rules.append(rule)
-                    core_ids.add(rule.get("core_id"))
+        if store:
+            rules_data = store.get_by_prefix(
+                LibraryMetadataTypes.RULES.value,
+                get_rules_cache_key(args.standard, args.version.replace(".", "-")),
+            )
+        else:
+            with open(rules_file, "rb") as f:
+                rules_data = pickle.load(f)
+        for key, rule in rules_data.items():
+            core_id = rule.get("core_id")
+            rule_identifier = get_rules_cache_key(
+                args.standard, args.version.replace(".", "-"), core_id
+            )
+            if core_id not in core_ids and key == rule_identifier:
+                rules.append(rule)
+                core_ids.add(rule.get("core_id"))
     return rules
+
+
+def get_rule_plans(args) -> List[RulePlan]:
+    """
+    Returns the plans of the rules to validate.
+    The precompiled plans are taken from the library metadata store
+    when update-cache has written them for the standard version,
+    otherwise they are built from the cached rules.
+    """
+    plans: Optional[List[Optional[RulePlan]]] = None
+    store: Optional[LibraryMetadataStore] = get_library_metadata_store(args)
+    if store:
+        try:
+            index: Optional[dict] = store.get(
+                LibraryMetadataTypes.RULE_PLANS.value,
+                get_rules_cache_key(args.standard, args.version.replace(".", "-")),
+            )
+        except (pickle.UnpicklingError, AttributeError, ImportError) as e:
+            engine_logger.warning(f"Could not load the rule plans: {e}")
+            index = None
+        if index and index.get("format_version") == RulePlan.FORMAT_VERSION:
+            if not args.rules:
+                engine_logger.warning(
+                    f"No rules specified. Running all rules for {args.standard}"
+                    + f" version {args.version}"
+                )
+            plans_by_core_id: Dict[str, RulePlan] = index["plans"]
+            plans = select_rule_plans(plans_by_core_id, args.rules)
+    if plans is None:
+        plans = [RulePlan(rule) if rule else None for rule in get_rules(args)]
+    for core_id, plan in zip(args.rules or [], plans):
+        if not plan:
+            engine_logger.warning(f"Rule {core_id} is not found in the cache")
+    return [plan for plan in plans if plan]
+
+
+def read_manifest(manifest_path: str) -> List[dict]:
+    """
+    Reads the studies of a batch validation from a JSON manifest.
+    The manifest is a list of studies, each with "output",
+    the report file destination, "data", the directory of the datasets,
+    or "dataset_paths", the paths of the datasets,
+    and optionally "define_xml_path".
+    Relative paths are resolved against the directory of the manifest.
+    Raises ValueError if the manifest is invalid.
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, list) or not manifest:
+        raise ValueError("The manifest must be a non-empty list of studies")
+    manifest_directory: str = os.path.dirname(os.path.abspath(manifest_path))
+    studies: List[dict] = []
+    for index, study in enumerate(manifest):
+        if not isinstance(study, dict) or not study.get("output"):
+            raise ValueError(f"Study {index} has no output")
+        if bool(study.get("data")) == bool(study.get("dataset_paths")):
+            raise ValueError(f"Study {index} must have either data or dataset_paths")
+        if study.get("data"):
+            data: str = os.path.join(manifest_directory, study["data"])
+            dataset_paths = [
+                os.path.join(data, file_name) for file_name in sorted(os.listdir(data))
+            ]
+        else:
+            dataset_paths = [
+                os.path.join(manifest_directory, path)
+                for path in study["dataset_paths"]
+            ]
+        define_xml_path: Optional[str] = study.get("define_xml_path")
+        studies.append(
+            {
+                "output": os.path.join(manifest_directory, study["output"]),
+                "dataset_paths": dataset_paths,
+                "define_xml_path": define_xml_path
+                and os.path.join(manifest_directory, define_xml_path),
+            }
+        )
+    outputs = [study["output"] for study in studies]
+    if len(set(outputs)) < len(outputs):
+        raise ValueError("Studies must have different outputs")
+    return studies
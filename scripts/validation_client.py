@@ -0,0 +1,208 @@
+"""
+Client of the validation server started with "python core.py serve".
+It imports only the standard library and click, so submitting a validation
+doesn't pay for importing the engine.
+
+Example:
+
+python scripts/validation_client.py -s sdtmig -v 3-4 -d /path/to/datasets
+"""
+import json
+import os
+import urllib.error
+import urllib.request
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import click
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+DATASET_EXTENSIONS: Tuple[str, ...] = (".xpt", ".json")
+
+
+def _absolute_path(path: Optional[str]) -> Optional[str]:
+    return os.path.abspath(path) if path else None
+
+
+def get_dataset_paths(data: Optional[str], dataset_path: Tuple[str]) -> List[str]:
+    if data:
+        dataset_path = [os.path.join(data, file_name) for file_name in os.listdir(data)]
+    return [
+        os.path.abspath(path)
+        for path in dataset_path
+        if os.path.splitext(path)[1].lower() in DATASET_EXTENSIONS
+    ]
+
+
+def submit_job(host: str, port: int, job: dict, timeout: Optional[float]) -> dict:
+    """
+    Sends the validation to the server and returns its response.
+    Raises click.ClickException if the validation can't be run.
+    """
+    request = urllib.request.Request(
+        f"http://{host}:{port}/validate",
+        data=json.dumps(job).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.load(response)
+    except urllib.error.HTTPError as e:
+        try:
+            error = json.load(e).get("error")
+        except ValueError:
+            error = e.reason
+        raise click.ClickException(f"Validation failed: {error}")
+    except urllib.error.URLError as e:
+        raise click.ClickException(
+            f"Could not connect to the validation server at {host}:{port}: "
+            f"{e.reason}"
+        )
+
+
+@click.command()
+@click.option("--host", default=DEFAULT_HOST, help="Host of the validation server")
+@click.option(
+    "--port", default=DEFAULT_PORT, type=int, help="Port of the validation server"
+)
+@click.option(
+    "--timeout",
+    type=float,
+    help="Seconds to wait for the validation, waits until it ends by default",
+)
+@click.option(
+    "-d", "--data", required=False, help="Path to directory containing data files"
+)
+@click.option(
+    "-dp",
+    "--dataset-path",
+    required=False,
+    multiple=True,
+    help="Path to dataset file",
+)
+@click.option(
+    "-l",
+    "--log-level",
+    default="disabled",
+    type=click.Choice(["info", "debug", "error", "critical", "disabled", "warn"]),
+    help="Sets log level for engine logs, logs are disabled by default",
+)
+@click.option(
+    "-s", "--standard", required=True, help="CDISC standard to validate against"
+)
+@click.option(
+    "-v", "--version", required=True, help="Standard version to validate against"
+)
+@click.option(
+    "-ct",
+    "--controlled-terminology-package",
+    multiple=True,
+    help=(
+        "Controlled terminology package to validate against, "
+        "can provide more than one"
+    ),
+)
+@click.option("-o", "--output", help="Report output file destination")
+@click.option(
+    "-of",
+    "--output-format",
+    multiple=True,
+    default=["XLSX"],
+    type=click.Choice(["XLSX", "JSON"], case_sensitive=False),
+    help="Output file format",
+)
+@click.option(
+    "-rr",
+    "--raw-report",
+    default=False,
+    is_flag=True,
+    help="Report in a raw format as it is generated by the engine. "
+    "This flag must be used only with --output-format JSON.",
+)
+@click.option("-dv", "--define-version", help="Define-XML version used for validation")
+@click.option("--whodrug", help="Path to directory with WHODrug dictionary files")
+@click.option("--meddra", help="Path to directory with MedDRA dictionary files")
+@click.option("--rules", "-r", multiple=True)
+@click.option("-dxp", "--define-xml-path", required=False, help="Path to Define-XML")
+@click.option(
+    "-sc",
+    "--schedule",
+    type=click.Choice(["rule", "dataset"]),
+    help="Defines how validation work is split between processes",
+)
+@click.option(
+    "-dc",
+    "--dataset-cache",
+    help="Path to a directory for the persistent dataset cache",
+)
+@click.option(
+    "-rs",
+    "--result-store",
+    help="Path to a file storing the results of validations",
+)
+def submit(
+    host: str,
+    port: int,
+    timeout: Optional[float],
+    data: str,
+    dataset_path: Tuple[str],
+    log_level: str,
+    standard: str,
+    version: str,
+    controlled_terminology_package: Tuple[str],
+    output: str,
+    output_format: Tuple[str],
+    raw_report: bool,
+    define_version: str,
+    whodrug: str,
+    meddra: str,
+    rules: Tuple[str],
+    define_xml_path: str,
+    schedule: str,
+    dataset_cache: str,
+    result_store: str,
+):
+    """
+    Submit a validation to the validation server
+    """
+    if bool(data) == bool(dataset_path):
+        raise click.UsageError(
+            "You must pass one of the following arguments: --dataset-path, --data"
+        )
+    dataset_paths: List[str] = get_dataset_paths(data, dataset_path)
+    if not dataset_paths:
+        raise click.UsageError("No .xpt or .json datasets found")
+    # same report name as the validate command
+    output = output or "CORE-Report-" + datetime.now().replace(
+        microsecond=0
+    ).isoformat().replace(":", "-")
+    job: dict = {
+        "dataset_paths": dataset_paths,
+        "log_level": log_level,
+        "standard": standard,
+        "version": version,
+        "controlled_terminology_package": list(controlled_terminology_package),
+        # the server may run in another directory
+        "output": os.path.abspath(output),
+        "output_format": [output_type.upper() for output_type in output_format],
+        "raw_report": raw_report,
+        "define_version": define_version,
+        "whodrug": _absolute_path(whodrug),
+        "meddra": _absolute_path(meddra),
+        "rules": list(rules),
+        "define_xml_path": _absolute_path(define_xml_path),
+        "schedule": schedule,
+        "dataset_cache_path": _absolute_path(dataset_cache),
+        "result_store_path": _absolute_path(result_store),
+    }
+    result: dict = submit_job(host, port, job, timeout)
+    click.echo(
+        f"Validation of {len(dataset_paths)} datasets took "
+        f"{result['elapsed_time']:.2f} seconds, report: {result['output']}"
+    )
+
+
+if __name__ == "__main__":
+    submit()
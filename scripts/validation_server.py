@@ -0,0 +1,324 @@
+import json
+import os
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from cdisc_rules_engine.constants.define_xml_constants import DEFINE_XML_FILE_NAME
+from cdisc_rules_engine.enums.dataformat_types import DataFormatTypes
+from cdisc_rules_engine.enums.default_file_paths import DefaultFilePaths
+from cdisc_rules_engine.enums.progress_parameter_options import ProgressParameterOptions
+from cdisc_rules_engine.enums.report_types import ReportTypes
+from cdisc_rules_engine.enums.schedule_parameter_options import (
+    ScheduleParameterOptions,
+)
+from cdisc_rules_engine.models.library_metadata_container import (
+    LibraryMetadataContainer,
+)
+from cdisc_rules_engine.models.dataset_types import DatasetTypes
+from cdisc_rules_engine.models.rule_plan import RulePlan
+from cdisc_rules_engine.models.validation_args import Validation_args
+from cdisc_rules_engine.services import logger as engine_logger
+from cdisc_rules_engine.utilities.utils import (
+    get_dataset_cache_key_from_path,
+    get_dataset_fingerprint,
+    get_directory_path,
+    get_meddra_code_hierarchies_cache_key,
+    get_meddra_code_term_pairs_cache_key,
+    get_meddra_term_hierarchies_cache_key,
+)
+from scripts.run_validation import (
+    set_log_level,
+    start_cache_manager,
+    validate_studies,
+)
+from scripts.script_utils import (
+    get_cache_service,
+    get_library_cache_files,
+    get_library_metadata_from_cache,
+    get_rule_plans,
+)
+from version import __version__
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+
+
+class ValidationServer:
+    """
+    Runs validations for the requests of the serve command.
+
+    The server process imports the engine once and keeps the cache manager,
+    the library metadata and the rules of each standard version resident
+    between validations. Validation processes are forked from the server
+    process for each validation, so they start with everything loaded.
+    The shared cache keeps the datasets, Define-XML files and dictionaries
+    of the previous validations, entries of files that have changed
+    since they were read are dropped before the next validation.
+    """
+
+    def __init__(self, cache_path: str, pool_size: int):
+        self.cache_path = cache_path
+        self.pool_size = pool_size
+        self.shared_cache = get_cache_service(start_cache_manager())
+        # library metadata and rule plans by the cache files they are read from
+        self._library_metadata: Dict[tuple, LibraryMetadataContainer] = {}
+        self._rule_plans: Dict[tuple, List[RulePlan]] = {}
+        # fingerprints of the files read into the cache
+        self._file_fingerprints: Dict[str, Any] = {}
+
+    def get_validation_args(self, job: dict) -> Validation_args:
+        """
+        Converts a validation request to validation arguments.
+        The request has the same fields as Validation_args, except for
+        the cache and the pool size, which are options of the server.
+        Paths in the request must be absolute.
+        """
+        for field in ("dataset_paths", "standard", "version", "output"):
+            if not job.get(field):
+                raise ValueError(f"Missing required field: {field}")
+        dataset_paths: List[str] = get_data_files(job["dataset_paths"])
+        output_format = set(job.get("output_format") or [ReportTypes.XLSX.value])
+        if not output_format.issubset(ReportTypes.values()):
+            raise ValueError(f"Unsupported output format: {output_format}")
+        schedule: str = job.get("schedule") or ScheduleParameterOptions.RULE.value
+        if schedule not in ScheduleParameterOptions.values():
+            raise ValueError(f"Unsupported schedule: {schedule}")
+        return Validation_args(
+            cache=self.cache_path,
+            pool_size=self.pool_size,
+            dataset_paths=dataset_paths,
+            log_level=job.get("log_level") or "disabled",
+            report_template=job.get("report_template")
+            or DefaultFilePaths.EXCEL_TEMPLATE_FILE.value,
+            standard=job["standard"],
+            version=job["version"],
+            controlled_terminology_package=set(
+                job.get("controlled_terminology_package") or []
+            ),
+            output=job["output"],
+            output_format=output_format,
+            raw_report=bool(job.get("raw_report")),
+            define_version=job.get("define_version"),
+            whodrug=job.get("whodrug"),
+            meddra=job.get("meddra"),
+            rules=tuple(job.get("rules") or []),
+            progress=ProgressParameterOptions.DISABLED.value,
+            define_xml_path=job.get("define_xml_path"),
+            schedule=schedule,
+            dataset_cache_path=job.get("dataset_cache_path"),
+            result_store_path=job.get("result_store_path"),
+        )
+
+    def validate(self, args: Validation_args) -> dict:
+        set_log_level(args)
+        library_metadata, plans = self._get_library(args)
+        self._clear_changed_files(args)
+        start: float = time.time()
+        validate_studies(
+            [args], self.shared_cache, library_metadata, [plan.rule for plan in plans]
+        )
+        return {
+            "output": args.output,
+            "output_format": sorted(args.output_format),
+            "elapsed_time": time.time() - start,
+        }
+
+    def _clear_changed_files(self, args: Validation_args):
+        """
+        Drops the cached datasets, Define-XML files and dictionaries
+        whose files have changed since a previous validation read them.
+        Results of operations depend on the arguments of the validation
+        and are always computed again.
+        """
+        self.shared_cache.clear_all("operations/")
+        dictionary_paths: List[str] = [
+            path for path in (args.meddra, args.whodrug) if path
+        ]
+        define_xml_paths: List[str] = get_define_xml_paths(args)
+        for path in [*args.dataset_paths, *define_xml_paths, *dictionary_paths]:
+            fingerprint = get_file_fingerprint(path)
+            if path not in self._file_fingerprints:
+                self._file_fingerprints[path] = fingerprint
+            elif self._file_fingerprints[path] != fingerprint:
+                engine_logger.info(f"{path} has changed, reading it again")
+                self._file_fingerprints[path] = fingerprint
+                for cache_key in get_file_cache_keys(path):
+                    self.shared_cache.clear(cache_key)
+                if path in define_xml_paths:
+                    # metadata read from the previous version of the file
+                    self.shared_cache.clear_all(f"{path}:")
+
+    def _get_library(
+        self, args: Validation_args
+    ) -> Tuple[LibraryMetadataContainer, List[RulePlan]]:
+        """
+        Returns the library metadata and the rule plans of the validation.
+        They are loaded again when update-cache has changed the cache files.
+        """
+        library_key: tuple = (
+            args.standard,
+            args.version,
+            tuple(
+                (file_path, get_dataset_fingerprint(file_path))
+                for file_path in get_library_cache_files(args)
+            ),
+        )
+        if library_key not in self._library_metadata:
+            engine_logger.info(f"Loading library metadata, cache path: {args.cache}")
+            self._library_metadata[library_key] = get_library_metadata_from_cache(args)
+        rules_key: tuple = (library_key, args.rules)
+        if rules_key not in self._rule_plans:
+            self._rule_plans[rules_key] = get_rule_plans(args)
+        return self._library_metadata[library_key], self._rule_plans[rules_key]
+
+
+def get_data_files(dataset_paths: List[str]) -> List[str]:
+    """
+    Returns the paths of the datasets in an allowed file format.
+    Raises ValueError if the datasets have none or several of the formats.
+    """
+    allowed_formats: List[str] = DataFormatTypes.values()
+    data_files: List[str] = []
+    found_formats = set()
+    for dataset_path in dataset_paths:
+        file_format: str = os.path.splitext(dataset_path)[1][1:].upper()
+        if file_format in allowed_formats:
+            found_formats.add(file_format)
+            data_files.append(dataset_path)
+    if len(found_formats) != 1:
+        raise ValueError(
+            "Datasets must have one of the allowed file formats "
+            f"{', '.join(allowed_formats)}, found: {', '.join(sorted(found_formats))}"
+        )
+    return data_files
+
+
+def get_define_xml_paths(args: Validation_args) -> List[str]:
+    """
+    Returns the paths of the Define-XML files read by the validation,
+    the given file or the define.xml files in the dataset directories.
+    """
+    if args.define_xml_path:
+        return [args.define_xml_path]
+    return sorted(
+        {
+            os.path.join(get_directory_path(dataset_path), DEFINE_XML_FILE_NAME)
+            for dataset_path in args.dataset_paths
+        }
+    )
+
+
+def get_file_fingerprint(path: str) -> Optional[tuple]:
+    """
+    Returns the fingerprint of a dataset file or of the files
+    of a dictionary directory.
+    """
+    if not os.path.isdir(path):
+        return get_dataset_fingerprint(path)
+    return tuple(
+        (file_name, get_dataset_fingerprint(os.path.join(path, file_name)))
+        for file_name in sorted(os.listdir(path))
+    )
+
+
+def get_file_cache_keys(path: str) -> List[str]:
+    """
+    Returns the keys of the cache entries read from a dataset file
+    or from a dictionary directory.
+    """
+    return [
+        *(
+            get_dataset_cache_key_from_path(path, dataset_type)
+            for dataset_type in DatasetTypes.values()
+        ),
+        path,
+        get_meddra_code_term_pairs_cache_key(path),
+        get_meddra_code_hierarchies_cache_key(path),
+        get_meddra_term_hierarchies_cache_key(path),
+    ]
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests of validation clients.
+
+    GET /health returns the engine version.
+    POST /validate runs the validation described by the JSON body
+    and returns the paths of the reports.
+    """
+
+    server: "ValidationHTTPServer"
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        self._send_json(HTTPStatus.OK, {"status": "ok", "version": __version__})
+
+    def do_POST(self):
+        if self.path != "/validate":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        try:
+            length: int = int(self.headers.get("Content-Length") or 0)
+            job = json.loads(self.rfile.read(length))
+            if not isinstance(job, dict):
+                raise ValueError("Request body must be a JSON object")
+            args: Validation_args = self.server.validation_server.get_validation_args(
+                job
+            )
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        try:
+            result: dict = self.server.validation_server.validate(args)
+        except Exception as e:
+            engine_logger.error(f"Validation of {args.dataset_paths} failed: {e}")
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+            return
+        self._send_json(HTTPStatus.OK, result)
+
+    def log_message(self, format: str, *args):
+        engine_logger.info(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: HTTPStatus, body: dict):
+        content: bytes = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class ValidationHTTPServer(HTTPServer):
+    """
+    HTTP server handling one request at a time,
+    so validations run one after another.
+    """
+
+    def __init__(
+        self,
+        validation_server: ValidationServer,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+    ):
+        super().__init__((host, port), ValidationRequestHandler)
+        self.validation_server = validation_server
+
+
+def serve(
+    cache_path: str,
+    pool_size: int,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+):
+    server = ValidationHTTPServer(ValidationServer(cache_path, pool_size), host, port)
+    print(f"Serving validations on http://{host}:{port}, pid {os.getpid()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -21,12 +21,11 @@ setuptools.setup(
     include_package_data=True,
     python_requires=">=3.9",
     install_requires=[
-        "pandas>=1.3.5",
+        "pandas>=1.5.3",
         "business-rules-enhanced==1.4.0",
         "python-dotenv==0.20.0",
         "cdisc-library-client==0.1.4",
         "odmlib==0.1.4",
-        "xport==3.6.1",
         "redis==4.0.2",
         "openpyxl==3.0.10",
         "importlib-metadata==5.0.0",
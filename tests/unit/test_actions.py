@@ -139,3 +139,57 @@ def test_json_serializable_value(data):
     result = action.generate_targeted_error_object(targets, df, "TVSEQ greater than 2")
     # Ensure json dumps does not throw an error
     json.dumps(result.to_representation())
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pd.DataFrame(
+            {
+                "USUBJID": ["01", "02", "03"],
+                "AESEQ": [1.0, None, 3.0],
+                "AETERM": ["A", "B", None],
+                "AESTDY": [1, 2, 3],
+            }
+        ),
+        pd.DataFrame(
+            {"AESEQ": [1, 2, 3], "AETERM": [1.5, 2.5, 3.5], "AESTDY": [1, 2, 3]},
+            index=[4, 7, 9],
+        ),
+        pd.DataFrame(
+            {
+                "USUBJID": [1, 2, 3],
+                "AESEQ": ["1", "", None],
+                "AETERM": pd.Categorical(["A", "B", "A"]),
+                "AESTDY": pd.array([1, None, 3], dtype="Int64"),
+            }
+        ),
+        pd.DataFrame(
+            {
+                "AETERM": pd.array([1, 2, None], dtype="Int64"),
+                "AESTDY": pd.array([1, None, 3], dtype="Int64"),
+            }
+        ),
+    ],
+)
+def test_targeted_error_batch(data: pd.DataFrame):
+    rule = {"core_id": "MockRule", "output_variables": ["AETERM", "AESTDY", "AEOUT"]}
+    action = COREActions([], DatasetVariable(data), "AE", rule)
+    targets = set(rule["output_variables"])
+    result = action.generate_targeted_error_object(targets, data, "AETERM")
+    # the same errors as created for each record by DataFrame.apply
+    errors_df = data[list(targets.intersection(data))]
+    expected = [
+        {
+            **error.to_representation(),
+            "value": {**error.to_representation()["value"], "AEOUT": "Not in dataset"},
+        }
+        for error in errors_df.apply(
+            lambda df_row: action._create_error_object(df_row, data), axis=1
+        )
+    ]
+    assert [error.to_representation() for error in result.errors] == expected
+    representation: dict = result.to_representation(lazy_errors=True)
+    assert representation["errors"] == expected
+    assert representation["errors"][-1] == expected[-1]
+    assert result.to_representation()["errors"] == expected
@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from business_rules.operators import DataframeType
+from business_rules.utils import is_complete_date
+
+from cdisc_rules_engine.models.dataset_operators import (
+    DatasetOperators,
+    _parse_date_string,
+)
+
+dataset = pd.DataFrame(
+    {
+        "AESEQ": [1, 2, 3, 4, 5, 6],
+        "AETERM": ["HEADACHE", "", None, "NAUSEA", "HEADACHE", np.nan],
+        "AEDECOD": ["Headache", "A1", "12", 13, 2.0, None],
+        "AESTDTC": [
+            "2021-01-01",
+            "2021-01-01T10:20",
+            "2021-13-01",
+            "",
+            "2021-01-01",
+            "2021---01",
+        ],
+        "AEENDTC": [
+            "2021-01-02",
+            "2021-01-01T10:20:30",
+            "2020",
+            "2021-02",
+            None,
+            "2021-01-01",
+        ],
+        "AESEV": pd.Categorical(["MILD", "MILD", None, "SEVERE", "MILD", "MODERATE"]),
+    }
+)
+
+
+def _run(operator_type: type, operator: str, data: pd.DataFrame, value: dict):
+    operators = operator_type({"value": data.copy(), "column_prefix_map": {"--": "AE"}})
+    try:
+        results = getattr(operators, operator)(value)
+    except Exception as e:
+        return type(e), operators.value
+    return results.tolist(), operators.value
+
+
+@pytest.mark.parametrize(
+    "operator, value",
+    [
+        ("matches_regex", {"target": "AETERM", "comparator": "^HEAD"}),
+        ("not_matches_regex", {"target": "--TERM", "comparator": ".*A$"}),
+        ("matches_regex", {"target": "AEDECOD", "comparator": r"^\d+$"}),
+        ("not_matches_regex", {"target": "AESEQ", "comparator": "[2-4]"}),
+        ("matches_regex", {"target": "AESEV", "comparator": "^M"}),
+        ("matches_regex", {"target": "AEOUT", "comparator": "^M"}),
+        ("prefix_matches_regex", {"target": "AETERM", "comparator": "^H", "prefix": 2}),
+        (
+            "not_prefix_matches_regex",
+            {"target": "AEDECOD", "comparator": "A", "prefix": 1},
+        ),
+        ("suffix_matches_regex", {"target": "AETERM", "comparator": "E$", "suffix": 1}),
+        (
+            "not_suffix_matches_regex",
+            {"target": "AETERM", "comparator": "HE", "suffix": 3},
+        ),
+        ("suffix_matches_regex", {"target": "AETERM", "comparator": "E$"}),
+        ("invalid_date", {"target": "AESTDTC"}),
+        ("invalid_date", {"target": "AEENDTC"}),
+        ("is_complete_date", {"target": "AESTDTC"}),
+        ("is_incomplete_date", {"target": "AEENDTC"}),
+        ("date_equal_to", {"target": "AESTDTC", "comparator": "2021-01-01"}),
+        (
+            "date_less_than",
+            {"target": "AESTDTC", "comparator": "AEENDTC", "date_component": "year"},
+        ),
+        (
+            "date_greater_than_or_equal_to",
+            {"target": "AEENDTC", "comparator": "--STDTC", "date_component": "day"},
+        ),
+        (
+            "date_not_equal_to",
+            {
+                "target": "AESTDTC",
+                "comparator": "AEENDTC",
+                "value_is_literal": True,
+            },
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "data",
+    [
+        dataset,
+        # a target without missing values, a missing comparator column
+        dataset.iloc[[0, 1, 3, 4]].drop(columns=["AESTDTC"]).reset_index(drop=True),
+        dataset.iloc[0:0],
+    ],
+)
+def test_operators_match_business_rules(operator: str, value: dict, data):
+    results, operator_dataset = _run(DatasetOperators, operator, data, value)
+    expected, expected_dataset = _run(DataframeType, operator, data, value)
+    assert results == expected
+    # business_rules converts numbers of the regex targets to strings
+    pd.testing.assert_frame_equal(operator_dataset, expected_dataset)
+
+
+def test_distinct_values_are_checked_once():
+    data = pd.DataFrame({"AESTDTC": ["2021-01-01", "2021-02", None] * 100})
+    check = MagicMock(wraps=is_complete_date)
+    with patch("cdisc_rules_engine.models.dataset_operators.is_complete_date", check):
+        results = DatasetOperators({"value": data}).is_complete_date(
+            {"target": "AESTDTC"}
+        )
+    assert results.tolist() == [True, False, False] * 100
+    # the distinct dates and each missing value
+    assert check.call_count == 102
+
+
+def test_only_complete_dates_are_cached():
+    data = pd.DataFrame(
+        {
+            "AESTDTC": ["2021-01-01", "2021-02", "2021-01-01T10:20", "2021"],
+            "AEENDTC": ["2021-01-02", "2021-02-15", "2021", "2022"],
+        }
+    )
+    _parse_date_string.cache_clear()
+    results = DatasetOperators({"value": data}).date_less_than(
+        {"target": "AESTDTC", "comparator": "AEENDTC"}
+    )
+    expected = DataframeType({"value": data}).date_less_than(
+        {"target": "AESTDTC", "comparator": "AEENDTC"}
+    )
+    assert results.tolist() == expected.tolist()
+    # parts missing from the other dates are taken from the current date
+    assert _parse_date_string.cache_info().currsize == 4
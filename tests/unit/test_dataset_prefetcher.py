@@ -0,0 +1,103 @@
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from cdisc_rules_engine.config.config import ConfigService
+from cdisc_rules_engine.models.dataset_types import DatasetTypes
+from cdisc_rules_engine.services.cache import InMemoryCacheService
+from cdisc_rules_engine.services.data_readers import DataReaderFactory
+from cdisc_rules_engine.services.data_services import LocalDataService
+from cdisc_rules_engine.services.data_services.dataset_prefetcher import (
+    DatasetPrefetcher,
+)
+from cdisc_rules_engine.utilities.utils import get_dataset_cache_key_from_path
+
+
+def _write_files(directory, sizes: dict) -> dict:
+    paths = {}
+    for name, size in sizes.items():
+        paths[name] = os.path.join(directory, name)
+        with open(paths[name], "wb") as f:
+            f.write(b"x" * size)
+    return paths
+
+
+def test_pop_returns_dataset_loaded_in_background(tmp_path):
+    paths = _write_files(tmp_path, {"ae.xpt": 10, "dm.xpt": 10})
+    threads = set()
+
+    def load(path):
+        threads.add(threading.get_ident())
+        return path.upper()
+
+    prefetcher = DatasetPrefetcher(load, memory_budget=100)
+    prefetcher.schedule([paths["ae.xpt"], paths["dm.xpt"], paths["ae.xpt"]])
+    assert prefetcher.pop(paths["ae.xpt"]) == paths["ae.xpt"].upper()
+    assert prefetcher.pop(paths["dm.xpt"]) == paths["dm.xpt"].upper()
+    # a dataset is taken once
+    assert prefetcher.pop(paths["ae.xpt"]) is None
+    assert threading.get_ident() not in threads
+    assert prefetcher.prefetched_size == 0
+    prefetcher.close()
+
+
+def test_memory_budget(tmp_path):
+    paths = _write_files(tmp_path, {"ae.xpt": 40, "dm.xpt": 40, "lb.xpt": 200})
+    load = MagicMock(side_effect=lambda path: path)
+    prefetcher = DatasetPrefetcher(load, memory_budget=60)
+    prefetcher.schedule([paths["ae.xpt"], paths["dm.xpt"], paths["lb.xpt"]])
+    assert prefetcher.prefetched_size == 40
+    # taking a dataset frees its budget for the next one
+    assert prefetcher.pop(paths["ae.xpt"]) == paths["ae.xpt"]
+    assert prefetcher.prefetched_size == 40
+    assert prefetcher.pop(paths["dm.xpt"]) == paths["dm.xpt"]
+    # datasets larger than the budget are not prefetched
+    assert prefetcher.pop(paths["lb.xpt"]) is None
+    assert [call.args[0] for call in load.call_args_list] == [
+        paths["ae.xpt"],
+        paths["dm.xpt"],
+    ]
+    prefetcher.close()
+
+
+def test_schedule_drops_datasets_of_earlier_schedule(tmp_path):
+    paths = _write_files(tmp_path, {"ae.xpt": 10, "dm.xpt": 10})
+    prefetcher = DatasetPrefetcher(lambda path: path, memory_budget=100)
+    prefetcher.schedule([paths["ae.xpt"]])
+    prefetcher.schedule([paths["dm.xpt"]])
+    assert prefetcher.pop(paths["ae.xpt"]) is None
+    assert prefetcher.pop(paths["dm.xpt"]) == paths["dm.xpt"]
+    prefetcher.close()
+
+
+def test_failed_load_is_not_returned(tmp_path):
+    paths = _write_files(tmp_path, {"ae.xpt": 10})
+    prefetcher = DatasetPrefetcher(
+        MagicMock(side_effect=ValueError("Invalid file")), memory_budget=100
+    )
+    prefetcher.schedule([paths["ae.xpt"]])
+    assert prefetcher.pop(paths["ae.xpt"]) is None
+    prefetcher.close()
+
+
+def test_local_data_service_reads_prefetched_dataset():
+    dataset_path = f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    cache = InMemoryCacheService()
+    data_service = LocalDataService(cache, DataReaderFactory(), ConfigService())
+    data_service.prefetch_datasets([dataset_path])
+    data_service._load_dataset = MagicMock()
+    data = data_service.get_dataset(dataset_name=dataset_path)
+    data_service._load_dataset.assert_not_called()
+    assert isinstance(data, pd.DataFrame)
+    # the contents metadata read with the dataset is cached
+    assert cache.exists(
+        get_dataset_cache_key_from_path(
+            dataset_path, DatasetTypes.CONTENTS_METADATA.value
+        )
+    )
+    # cached datasets are not prefetched
+    data_service.prefetch_datasets([dataset_path])
+    assert data_service.prefetcher.prefetched_size == 0
+    data_service.prefetcher.close()
@@ -0,0 +1,77 @@
+"""
+This module contains unit tests for DatasetJSONParser class.
+"""
+import json
+import os
+
+import jsonschema
+import pandas as pd
+import pytest
+
+from cdisc_rules_engine.services.datasetjson_parser import (
+    DatasetJSONParser,
+    get_dataset_json_validators,
+)
+
+test_dataset_path: str = f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+
+
+def _load_expected_dataset() -> pd.DataFrame:
+    with open(test_dataset_path) as file:
+        item_group: dict = json.load(file)["clinicalData"]["itemGroupData"]["EX"]
+    return pd.DataFrame(
+        [row[1:] for row in item_group["itemData"]],
+        columns=[item["name"] for item in item_group["items"][1:]],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024 * 1024])
+def test_read(chunk_size):
+    document, item_group, dataset = DatasetJSONParser(
+        test_dataset_path, chunk_size=chunk_size
+    ).read()
+    assert document["creationDateTime"] == "2023-07-31T14:44:09"
+    assert item_group["name"] == "EX"
+    assert item_group["records"] == len(dataset) == 591
+    assert len(item_group["itemData"]) == 100
+    pd.testing.assert_frame_equal(dataset, _load_expected_dataset())
+
+
+def test_read_header():
+    document, item_group = DatasetJSONParser(test_dataset_path).read_header()
+    assert item_group["name"] == "EX"
+    assert item_group["itemData"][0][2] == "EX"
+
+
+@pytest.mark.parametrize(
+    "validation, is_valid",
+    [
+        ("full", False),
+        ("sample", True),
+        ("none", True),
+    ],
+)
+def test_read_invalid_row(tmp_path, validation, is_valid):
+    with open(test_dataset_path) as file:
+        datasetjson: dict = json.load(file)
+    datasetjson["clinicalData"]["itemGroupData"]["EX"]["itemData"][-1][1] = {}
+    file_path = tmp_path / "ex.json"
+    file_path.write_text(json.dumps(datasetjson))
+
+    parser = DatasetJSONParser(str(file_path), validation=validation)
+    if is_valid:
+        assert len(parser.read()[2]) == 591
+    else:
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            parser.read()
+
+
+def test_read_invalid_header(tmp_path):
+    file_path = tmp_path / "ex.json"
+    file_path.write_text(json.dumps({"clinicalData": {}}))
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        DatasetJSONParser(str(file_path)).read()
+
+
+def test_validators_are_compiled_once():
+    assert get_dataset_json_validators() is get_dataset_json_validators()
@@ -88,3 +88,22 @@ def test_read_metadata_with_variable_formats():
         "",
         "",
     ]
+
+
+def test_read_metadata_without_records():
+    """
+    Unit test for function read.
+    Metadata read from the headers matches the metadata
+    extracted while decoding the whole file.
+    """
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    )
+    metadata: dict = DatasetXPTMetadataReader(
+        test_dataset_path, file_name="test_dataset.xpt"
+    ).read()
+    full_metadata, dataset = DatasetXPTMetadataReader(
+        test_dataset_path, file_name="test_dataset.xpt"
+    ).read_with_dataset()
+    assert metadata == full_metadata
+    assert metadata["dataset_length"] == len(dataset) == 1583
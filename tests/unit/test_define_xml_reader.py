@@ -1,14 +1,17 @@
 """
 This module contains unit tests for DefineXMLReader class.
 """
+import os
 from pathlib import Path
 from typing import List
+from unittest.mock import MagicMock
 
 import pytest
 
 from cdisc_rules_engine.exceptions.custom_exceptions import (
     DomainNotFoundInDefineXMLError,
 )
+from cdisc_rules_engine.services.cache import InMemoryCacheService
 from cdisc_rules_engine.services.define_xml.base_define_xml_reader import (
     BaseDefineXMLReader,
 )
@@ -337,3 +340,39 @@ def test_get_domain_key_sequence_for_supp():
             "IDVARVAL",
             "QNAM",
         ]
+
+
+def test_cached_metadata_is_scoped_to_define_xml_file(tmp_path):
+    """
+    Studies validated together share a cache,
+    each reads the metadata of its own Define-XML file.
+    """
+    with open(test_define_file_path, "rb") as file:
+        contents: bytes = file.read()
+    define_xml_paths: List[str] = []
+    for study, label in (("a", b"Trial Summary"), ("b", b"Trial Summary B")):
+        os.mkdir(tmp_path / study)
+        define_xml_path: str = str(tmp_path / study / "define.xml")
+        with open(define_xml_path, "wb") as file:
+            file.write(
+                contents.replace(
+                    b'<TranslatedText xml:lang="en">Trial Summary</TranslatedText>',
+                    b'<TranslatedText xml:lang="en">' + label + b"</TranslatedText>",
+                )
+            )
+        define_xml_paths.append(define_xml_path)
+    data_service = MagicMock()
+
+    def get_define_xml_contents(dataset_name: str) -> bytes:
+        with open(dataset_name, "rb") as file:
+            return file.read()
+
+    data_service.get_define_xml_contents.side_effect = get_define_xml_contents
+    cache = InMemoryCacheService()
+    labels = [
+        DefineXMLReaderFactory.get_define_xml_reader(
+            "ts.xpt", define_xml_path, data_service, cache
+        ).extract_domain_metadata(domain_name="TS")["define_dataset_label"]
+        for define_xml_path in define_xml_paths
+    ]
+    assert labels == ["Trial Summary", "Trial Summary B"]
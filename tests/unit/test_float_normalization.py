@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from cdisc_rules_engine.services.data_readers.float_normalization import (
+    normalize_floats,
+    round_floats,
+)
+
+
+def test_round_floats_matches_python_round():
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(100000) * 10.0 ** rng.integers(-20, 20, 100000)
+    values = np.concatenate(
+        [
+            values,
+            np.round(values, 2),
+            (np.arange(-1000, 1000) + 0.5) / 10**15,
+            [0.1 + 0.2, 1e-16, -1e-16, 2.5e-15, 1e308, -0.0, np.inf, -np.inf],
+        ]
+    )
+    expected = np.array([round(float(value), 15) for value in values])
+    result = round_floats(values)
+    assert np.array_equal(result, expected)
+    assert np.array_equal(np.signbit(result), np.signbit(expected))
+    assert np.isnan(round_floats(np.array([np.nan]))).all()
+
+
+def test_normalize_floats():
+    dataframe = pd.DataFrame(
+        {
+            "LBSTRESN": [1e-16, 0.1 + 0.2, np.nan],
+            "LBSTRESC": ["1e-16", "0.3", None],
+            "LBSEQ": [1, 2, 3],
+        }
+    )
+    result = normalize_floats(dataframe)
+    expected = pd.DataFrame(
+        {
+            "LBSTRESN": [0.0, 0.3, np.nan],
+            "LBSTRESC": ["1e-16", "0.3", None],
+            "LBSEQ": [1, 2, 3],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
@@ -1,11 +1,17 @@
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 from cdisc_rules_engine.config.config import ConfigService
 
+from cdisc_rules_engine.services.cache import InMemoryCacheService
+from cdisc_rules_engine.services.data_readers import DataReaderFactory
 from cdisc_rules_engine.services.data_services import LocalDataService
+from cdisc_rules_engine.services.datasetjson_parser import DatasetJSONParser
+from cdisc_rules_engine.services.datasetxpt_metadata_reader import (
+    DatasetXPTMetadataReader,
+)
 
 
 def test_read_metadata():
@@ -13,7 +19,9 @@ def test_read_metadata():
     Unit test for read_data method.
     """
     dataset_path = f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
-    data_service = LocalDataService(MagicMock(), MagicMock(), MagicMock())
+    mock_cache = MagicMock()
+    mock_cache.get.return_value = None
+    data_service = LocalDataService(mock_cache, MagicMock(), MagicMock())
     metadata = data_service.read_metadata(dataset_path)
     assert "file_metadata" in metadata
     assert metadata["file_metadata"].get("name") == "test_dataset.xpt"
@@ -71,3 +79,62 @@ def test_get_variables_metdata():
     ]
     for key in expected_keys:
         assert key in data
+
+
+def test_xpt_file_is_decoded_once():
+    """
+    Reading the contents of .xpt file also caches its contents metadata.
+    Reading the metadata alone does not decode the records.
+    """
+    dataset_path = f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    cache = InMemoryCacheService()
+    data_service = LocalDataService(cache, DataReaderFactory(), ConfigService())
+    read_with_dataset = DatasetXPTMetadataReader.read_with_dataset
+    with patch.object(
+        DatasetXPTMetadataReader,
+        "read_with_dataset",
+        autospec=True,
+        side_effect=read_with_dataset,
+    ) as mock_read_with_dataset:
+        data = data_service.get_dataset(dataset_name=dataset_path)
+        metadata = data_service.read_metadata(dataset_path)
+        assert mock_read_with_dataset.call_count == 1
+        assert len(data) == metadata["contents_metadata"]["dataset_length"]
+
+        cache.clear_all()
+        data_service.read_metadata(dataset_path)
+        assert mock_read_with_dataset.call_count == 1
+
+
+def test_dataset_json_file_is_parsed_once():
+    dataset_path = f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+    cache = InMemoryCacheService()
+    data_service = LocalDataService(cache, DataReaderFactory(), ConfigService())
+    with patch.object(
+        DatasetJSONParser, "read_header", autospec=True
+    ) as mock_read_header:
+        data = data_service.get_dataset(dataset_name=dataset_path)
+        metadata = data_service.read_metadata(dataset_path)
+        mock_read_header.assert_not_called()
+        assert len(data) == metadata["contents_metadata"]["dataset_length"]
+
+
+@pytest.mark.parametrize("file_name", ["test_dataset.xpt", "test_dataset.json"])
+def test_get_dataset_preview(file_name):
+    """
+    The preview has the columns and the first DOMAIN value of the dataset
+    and is built without reading the dataset contents.
+    """
+    dataset_path = f"{os.path.dirname(__file__)}/../resources/{file_name}"
+    data_service = LocalDataService(
+        InMemoryCacheService(), DataReaderFactory(), ConfigService()
+    )
+    with patch.object(LocalDataService, "get_dataset") as mock_get_dataset:
+        preview = data_service.get_dataset_preview(dataset_name=dataset_path)
+        mock_get_dataset.assert_not_called()
+    data = LocalDataService(
+        InMemoryCacheService(), DataReaderFactory(), ConfigService()
+    ).get_dataset(dataset_name=dataset_path)
+    assert list(preview.columns) == list(data.columns)
+    assert len(preview) == 1
+    assert preview["DOMAIN"].values[0] == data["DOMAIN"].values[0]
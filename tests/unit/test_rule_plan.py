@@ -0,0 +1,90 @@
+import pickle
+
+from cdisc_rules_engine.interfaces import ConditionInterface
+from cdisc_rules_engine.models.rule_plan import (
+    RulePlan,
+    build_rule_plan_index,
+    compile_conditions,
+    select_rule_plans,
+)
+
+rule: dict = {
+    "core_id": "CORE-000001",
+    "rule_type": "Record Data",
+    "domains": {"Include": ["AE", "EC"], "Exclude": ["DM"]},
+    "classes": {"Include": ["EVENTS"]},
+    "operations": [{"id": "$max_date", "operator": "max_date", "name": "AESTDTC"}],
+    "conditions": {
+        "all": [
+            {
+                "name": "get_dataset",
+                "operator": "less_than",
+                "value": {"target": "AEENDTC", "comparator": "AESTDTC"},
+            },
+            {
+                "not": {
+                    "any": [
+                        {
+                            "name": "get_dataset",
+                            "operator": "equal_to",
+                            "value": {"target": "AESER", "comparator": "Y"},
+                        }
+                    ]
+                }
+            },
+        ]
+    },
+}
+
+
+def test_rule_plan():
+    plan = RulePlan(rule)
+    assert plan.core_id == "CORE-000001"
+    assert isinstance(plan.rule["conditions"], ConditionInterface)
+    assert plan.rule["conditions"].to_dict() == rule["conditions"]
+    # the original rule is not modified
+    assert isinstance(rule["conditions"], dict)
+    assert plan.referenced_variables == {"AEENDTC", "AESTDTC", "AESER", "Y"}
+    assert plan.operations == rule["operations"]
+    assert plan.included_domains == {"AE", "EC"}
+    assert plan.excluded_domains == {"DM"}
+    assert plan.included_classes == {"EVENTS"}
+    assert plan.excluded_classes == frozenset()
+    assert plan.dataset_builder_type == "Record Data"
+
+
+def test_rule_plan_is_picklable():
+    plan = pickle.loads(pickle.dumps(RulePlan(rule)))
+    assert plan.rule["conditions"].to_dict() == rule["conditions"]
+    assert plan.referenced_variables == {"AEENDTC", "AESTDTC", "AESER", "Y"}
+
+
+def test_rule_plan_with_invalid_conditions():
+    invalid_rule: dict = {"core_id": "CORE-000002", "conditions": {"one": []}}
+    plan = RulePlan(invalid_rule)
+    assert plan.rule == invalid_rule
+    assert plan.referenced_variables == frozenset()
+
+
+def test_compile_conditions_is_idempotent():
+    conditions = compile_conditions(rule["conditions"])
+    assert compile_conditions(conditions) is conditions
+
+
+def test_build_rule_plan_index():
+    rules: dict = {
+        "rules/sdtmig/3-4/CORE-000002": {"core_id": "CORE-000002"},
+        "rules/sdtmig/3-3/CORE-000001": {"core_id": "CORE-000001"},
+        "rules/sdtmig/3-4/CORE-000001": rule,
+        "rules/sdtmig/3-4/CORE-000003": {"core_id": "CORE-000004"},
+    }
+    index = build_rule_plan_index(rules)
+    assert list(index) == ["rules/sdtmig/3-4/", "rules/sdtmig/3-3/"]
+    assert list(index["rules/sdtmig/3-4/"]) == ["CORE-000002", "CORE-000001"]
+    assert list(index["rules/sdtmig/3-3/"]) == ["CORE-000001"]
+    plans = index["rules/sdtmig/3-4/"]
+    assert select_rule_plans(plans) == list(plans.values())
+    assert select_rule_plans(plans, ["CORE-000001", "CORE-000005"]) == [
+        plans["CORE-000001"],
+        None,
+    ]
@@ -18,6 +18,7 @@ from cdisc_rules_engine.rules_engine import RulesEngine
 from cdisc_rules_engine.services.cache.in_memory_cache_service import (
     InMemoryCacheService,
 )
+from cdisc_rules_engine.utilities.condition_compiler import COMPILED_OPERATORS
 from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
 
 
@@ -500,6 +501,57 @@ def test_validate_record_rule_numbers_separated_by_dash_pattern():
         ]
 
 
+def test_validate_record_rule_does_not_modify_cached_dataset():
+    """
+    The test checks that executing a rule whose operator
+    overwrites the target column does not modify
+    the dataset returned by the data service.
+    """
+    rule: dict = get_matches_regex_pattern_rule(r"^\d+\-\d+$")
+    dataset_mock = pd.DataFrame.from_dict({"AESTDY": ["5-5", "10-10", "test"]})
+    expected_dataset = dataset_mock.copy()
+    with patch(
+        "cdisc_rules_engine.services.data_services.LocalDataService.get_dataset",
+        return_value=dataset_mock,
+    ):
+        RulesEngine().validate_single_rule(rule, "study/bundle", [{}], "AE")
+    assert dataset_mock.equals(expected_dataset)
+
+
+def test_validate_rule_does_not_modify_cached_dataset(
+    dataset_rule_equal_to_error_objects: dict,
+):
+    """
+    The test checks that a rule deriving columns and overwriting
+    a column of the shallow copy of the dataset it is validated against
+    does not modify the dataset returned by the data service.
+    """
+    rule: dict = {
+        **dataset_rule_equal_to_error_objects,
+        "operations": [
+            {"operator": "record_count", "id": "$record_count"},
+            {"operator": "distinct", "name": "AESTDY", "id": "DOMAIN"},
+        ],
+    }
+    dataset_mock = pd.DataFrame.from_dict(
+        {"AESTDY": ["test", "alex", "test"], "AESEQ": [1, 2, 3], "DOMAIN": "AE"}
+    )
+    expected_dataset = dataset_mock.copy()
+    with patch(
+        "cdisc_rules_engine.services.data_services.LocalDataService.get_dataset",
+        return_value=dataset_mock,
+    ):
+        validation_result: List[dict] = RulesEngine().validate_single_rule(
+            rule, "study/bundle", [{"domain": "AE", "filename": "ae.xpt"}], "AE"
+        )
+    assert validation_result[0]["errors"] == [
+        {"value": {"AESTDY": "test"}, "row": 1, "SEQ": 1},
+        {"value": {"AESTDY": "test"}, "row": 3, "SEQ": 3},
+    ]
+    assert dataset_mock.columns.tolist() == ["AESTDY", "AESEQ", "DOMAIN"]
+    pd.testing.assert_frame_equal(dataset_mock, expected_dataset)
+
+
 def test_validate_record_rule_semi_colon_delimited_pattern():
     """
     The test checks matching semi-colon delimited pattern.
@@ -919,6 +971,132 @@ def test_validate_single_rule(dataset_rule_equal_to_error_objects: dict):
         ]
 
 
+@patch.dict(os.environ, {"EVALUATION_CHUNK_SIZE": "2"})
+def test_validate_single_rule_in_chunks(dataset_rule_equal_to_error_objects: dict):
+    """
+    Record level rules are evaluated against parts of large datasets.
+    Errors keep the row numbers of the whole dataset.
+    """
+    df = pd.DataFrame.from_dict(
+        {
+            "AESTDY": ["test", "alex", "alex", "test", "test"],
+            "USUBJID": [1, 2, 2, 1, 3],
+            "AESEQ": [1, 2, 3, 4, 5],
+        }
+    )
+    rule: dict = {**dataset_rule_equal_to_error_objects, "rule_type": "Record Data"}
+    engine = RulesEngine()
+    with patch(
+        "cdisc_rules_engine.services.data_services.LocalDataService.get_dataset",
+        return_value=df,
+    ), patch.object(
+        engine, "evaluate_rule", wraps=engine.evaluate_rule
+    ) as mock_evaluate_rule:
+        validation_result: List[dict] = engine.validate_single_rule(
+            rule, "study/bundle", [{"domain": "AE", "filename": "ae.xpt"}], "AE"
+        )
+    assert mock_evaluate_rule.call_count == 3
+    assert validation_result == [
+        {
+            "domain": "AE",
+            "executionStatus": ExecutionStatus.SUCCESS.value,
+            "variables": ["AESTDY"],
+            "errors": [
+                {"row": 1, "value": {"AESTDY": "test"}, "USUBJID": "1", "SEQ": 1},
+                {"row": 4, "value": {"AESTDY": "test"}, "USUBJID": "1", "SEQ": 4},
+                {"row": 5, "value": {"AESTDY": "test"}, "USUBJID": "3", "SEQ": 5},
+            ],
+            "message": "Value of AESTDY is equal to test.",
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "operator",
+    [
+        "contains_all",
+        "not_contains_all",
+        "is_contained_by",
+        "is_not_contained_by",
+        "is_contained_by_case_insensitive",
+        "is_not_contained_by_case_insensitive",
+    ],
+)
+def test_validate_single_rule_with_column_comparator_not_in_chunks(
+    dataset_rule_equal_to_error_objects: dict, operator: str
+):
+    """
+    Rules comparing a record with values of other records
+    find the same errors when the dataset is larger than the chunk size.
+    """
+    df = pd.DataFrame.from_dict(
+        {
+            "AESTDY": ["a", "b", "c", "d", "e"],
+            "AETERM": ["c", "a", "e", "b", "d"],
+            "USUBJID": [1, 2, 3, 4, 5],
+            "AESEQ": [1, 2, 3, 4, 5],
+        }
+    )
+    condition: dict = {
+        "name": "get_dataset",
+        "operator": operator,
+        "value": {"target": "AESTDY", "comparator": "AETERM"},
+    }
+    results: List[List[dict]] = []
+    for chunk_size in ("100", "2"):
+        rule: dict = {
+            **dataset_rule_equal_to_error_objects,
+            "rule_type": "Record Data",
+            "conditions": ConditionCompositeFactory.get_condition_composite(
+                {"all": [dict(condition, value=dict(condition["value"]))]}
+            ),
+        }
+        with patch.dict(os.environ, {"EVALUATION_CHUNK_SIZE": chunk_size}), patch(
+            "cdisc_rules_engine.services.data_services.LocalDataService.get_dataset",
+            return_value=df.copy(),
+        ):
+            results.append(
+                RulesEngine().validate_single_rule(
+                    rule, "study/bundle", [{"domain": "AE", "filename": "ae.xpt"}], "AE"
+                )
+            )
+    assert results[0] == results[1]
+
+
+def test_validate_rules_share_predicates(dataset_rule_equal_to_error_objects: dict):
+    """
+    Rules validated together against a dataset evaluate
+    a condition they have in common once.
+    """
+    df = pd.DataFrame.from_dict(
+        {
+            "AESTDY": ["test", "alex", "test"],
+            "USUBJID": [1, 2, 3],
+            "AESEQ": [1, 2, 3],
+        }
+    )
+    rules: List[dict] = [
+        {**dataset_rule_equal_to_error_objects, "core_id": core_id}
+        for core_id in ("MockRule1", "MockRule2")
+    ]
+    equal_to = MagicMock(wraps=COMPILED_OPERATORS["equal_to"][0])
+    engine = RulesEngine()
+    with patch(
+        "cdisc_rules_engine.services.data_services.LocalDataService.get_dataset",
+        return_value=df,
+    ), patch.dict(
+        COMPILED_OPERATORS,
+        {"equal_to": (equal_to, *COMPILED_OPERATORS["equal_to"][1:])},
+    ):
+        output: dict = engine.validate(
+            rules, "study/bundle", [{"domain": "AE", "filename": "ae.xpt"}], "AE"
+        )
+    equal_to.assert_called_once()
+    assert engine.predicate_cache is None
+    assert output["MockRule1"] == output["MockRule2"]
+    assert [error["row"] for error in output["MockRule2"][0]["errors"]] == [1, 3]
+
+
 def test_validate_single_rule_not_equal_to(
     dataset_rule_not_equal_to_error_objects: dict,
 ):
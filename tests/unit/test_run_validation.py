@@ -0,0 +1,362 @@
+import os
+from unittest.mock import MagicMock, patch
+
+from cdisc_rules_engine.services.cache import (
+    InMemoryCacheService,
+    TieredCacheService,
+    ValidationResultStore,
+)
+from cdisc_rules_engine.services.data_services import (
+    LocalDataService,
+    USDMDataService,
+)
+from cdisc_rules_engine.constants.classes import EVENTS, FINDINGS
+from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
+from scripts.run_validation import (
+    StudyContext,
+    get_applicable_domains,
+    get_prefetch_paths,
+    get_result_keys,
+    get_unique_domain_datasets,
+    init_worker,
+    load_stored_results,
+    merge_dataset_group_results,
+    store_results,
+    validate_domain_in_worker,
+    validate_rule_in_worker,
+)
+
+
+def test_get_unique_domain_datasets():
+    datasets = [
+        {"domain": "AE", "filename": "ae.xpt"},
+        {"domain": "QS", "filename": "qs1.xpt"},
+        {"domain": "QS", "filename": "qs2.xpt"},
+        {"domain": "DM", "filename": "dm.xpt"},
+    ]
+    assert get_unique_domain_datasets(datasets) == [
+        {"domain": "AE", "filename": "ae.xpt"},
+        {"domain": "QS", "filename": "qs1.xpt"},
+        {"domain": "DM", "filename": "dm.xpt"},
+    ]
+
+
+def test_merge_dataset_group_results():
+    rules = [{"core_id": "CORE-000001"}, {"core_id": "CORE-000002"}]
+    ae_result = {"domain": "AE", "executionStatus": "success", "errors": []}
+    dm_result = {"domain": "DM", "executionStatus": "skipped", "errors": []}
+    # results arrive in completion order, not in dataset order
+    group_results = [
+        ("DM", {"CORE-000001": [dm_result], "CORE-000002": [dm_result]}),
+        ("AE", {"CORE-000001": [ae_result]}),
+    ]
+    results = merge_dataset_group_results(rules, ["AE", "DM"], group_results)
+    assert [result.id for result in results] == ["CORE-000001", "CORE-000002"]
+    assert results[0].results == [ae_result, dm_result]
+    assert results[0].execution_status == "success"
+    assert results[1].results == [dm_result]
+    assert results[1].execution_status == "skipped"
+
+
+def test_merge_dataset_group_results_with_applicable_domains():
+    rules = [{"core_id": "CORE-000001"}, {"core_id": "CORE-000002"}]
+    ae_result = {"domain": "AE", "executionStatus": "success", "errors": []}
+    # DM is not validated, none of the rules apply to it
+    group_results = [("AE", {"CORE-000001": [ae_result]})]
+    applicable_domains = {
+        "CORE-000001": frozenset({"AE"}),
+        "CORE-000002": frozenset(),
+    }
+    results = merge_dataset_group_results(
+        rules, ["AE", "DM"], group_results, applicable_domains
+    )
+    assert results[0].results == [
+        ae_result,
+        {
+            "executionStatus": "skipped",
+            "domain": "DM",
+            "variables": [],
+            "message": None,
+            "errors": [],
+        },
+    ]
+    assert [result["executionStatus"] for result in results[1].results] == [
+        "skipped",
+        "skipped",
+    ]
+
+
+@patch("scripts.run_validation.get_study_data_service")
+@patch("scripts.run_validation.validate_dataset_group")
+@patch("scripts.run_validation.validate_single_rule")
+def test_worker_context(
+    mock_validate_single_rule: MagicMock,
+    mock_validate_dataset_group: MagicMock,
+    mock_get_study_data_service: MagicMock,
+):
+    cache, args, library_metadata = MagicMock(), MagicMock(), MagicMock()
+    datasets = [{"domain": "AE", "filename": "ae.xpt"}]
+    rules = [{"core_id": "CORE-000001"}]
+    mock_validate_dataset_group.return_value = ("AE", {}, {})
+    init_worker(cache, library_metadata, rules, [StudyContext(datasets, args)])
+    # tasks carry only the study index and the rule or the domain
+    validate_rule_in_worker((0, rules[0]))
+    worker_cache, *call_args = mock_validate_single_rule.call_args.args
+    # the shared cache is wrapped with a process-local cache
+    assert isinstance(worker_cache, TieredCacheService)
+    assert worker_cache.shared_cache is cache
+    data_service = mock_get_study_data_service.return_value
+    assert call_args == [datasets, args, library_metadata, rules[0], None, data_service]
+    assert validate_domain_in_worker((0, "AE")) == (0, "AE", {}, {})
+    mock_validate_dataset_group.assert_called_once_with(
+        worker_cache, datasets, args, library_metadata, rules, "AE", data_service
+    )
+    # the data service of the study is created once per worker
+    mock_get_study_data_service.assert_called_once_with(
+        args, worker_cache, library_metadata
+    )
+
+
+@patch("scripts.run_validation.get_study_data_service")
+@patch("scripts.run_validation.validate_single_rule")
+def test_worker_data_service_per_study(
+    mock_validate_single_rule: MagicMock, mock_get_study_data_service: MagicMock
+):
+    cache, library_metadata = MagicMock(), MagicMock()
+    local_args, usdm_args = MagicMock(standard="sdtmig"), MagicMock(standard="usdm")
+    mock_get_study_data_service.side_effect = lambda args, *_: MagicMock(
+        standard=args.standard
+    )
+    rule = {"core_id": "CORE-000001"}
+    init_worker(
+        cache,
+        library_metadata,
+        [rule],
+        [StudyContext([], local_args), StudyContext([], usdm_args)],
+    )
+    data_services = []
+    for study_index in (0, 1, 0):
+        validate_rule_in_worker((study_index, rule))
+        data_services.append(mock_validate_single_rule.call_args.args[-1])
+    # tasks of each study read the datasets through the data service of the study
+    assert [data_service.standard for data_service in data_services] == [
+        "sdtmig",
+        "usdm",
+        "sdtmig",
+    ]
+    assert data_services[0] is data_services[2]
+    assert mock_get_study_data_service.call_count == 2
+
+
+@patch("scripts.run_validation.get_study_data_service")
+@patch("scripts.run_validation.validate_dataset_group")
+@patch("scripts.run_validation.validate_single_rule")
+def test_worker_context_with_applicable_domains(
+    mock_validate_single_rule: MagicMock,
+    mock_validate_dataset_group: MagicMock,
+    mock_get_study_data_service: MagicMock,
+):
+    cache, args, library_metadata = MagicMock(), MagicMock(), MagicMock()
+    datasets = [
+        {"domain": "AE", "filename": "ae.xpt"},
+        {"domain": "DM", "filename": "dm.xpt"},
+    ]
+    rules = [{"core_id": "CORE-000001"}, {"core_id": "CORE-000002"}]
+    applicable_domains = {
+        "CORE-000001": frozenset({"AE"}),
+        "CORE-000002": frozenset({"AE", "DM"}),
+    }
+    other_study = StudyContext([{"domain": "LB", "filename": "lb.xpt"}], args)
+    mock_validate_dataset_group.return_value = ("DM", {}, {})
+    init_worker(
+        cache,
+        library_metadata,
+        rules,
+        [other_study, StudyContext(datasets, args, applicable_domains)],
+    )
+    validate_rule_in_worker((1, rules[0]))
+    assert mock_validate_single_rule.call_args.args[1] == datasets
+    assert mock_validate_single_rule.call_args.args[-2] == {"AE"}
+    # only the rules that apply to the domain are validated
+    validate_domain_in_worker((1, "DM"))
+    assert mock_validate_dataset_group.call_args.args[-3:-1] == (rules[1:], "DM")
+
+
+def test_get_applicable_domains():
+    datasets = [
+        {"domain": "AE", "filename": "ae.xpt", "full_path": "ae.xpt"},
+        {"domain": "LB", "filename": "lb1.xpt", "full_path": "lb1.xpt"},
+        {"domain": "LB", "filename": "lb2.xpt", "full_path": "lb2.xpt"},
+        {"domain": "XX", "filename": "xx.xpt", "full_path": "xx.xpt"},
+    ]
+    classes: dict = {"ae.xpt": EVENTS, "lb1.xpt": FINDINGS}
+
+    def get_dataset_class_from_metadata(file_path, datasets, domain):
+        if file_path not in classes:
+            raise ValueError("Unknown dataset")
+        return classes[file_path]
+
+    data_service = MagicMock()
+    data_service.get_dataset_class_from_metadata.side_effect = (
+        get_dataset_class_from_metadata
+    )
+    rules = [
+        {"core_id": "CORE-000001", "standards": []},
+        {"core_id": "CORE-000002", "standards": [], "domains": {"Include": ["AE"]}},
+        {"core_id": "CORE-000003", "standards": [], "classes": {"Include": [EVENTS]}},
+        {"core_id": "CORE-000004", "standards": [], "classes": {"Exclude": [EVENTS]}},
+        {"core_id": "CORE-000005"},
+    ]
+    applicable_domains = get_applicable_domains(
+        rules, datasets, RuleProcessor(data_service, MagicMock())
+    )
+    assert applicable_domains == {
+        "CORE-000001": {"AE", "LB", "XX"},
+        "CORE-000002": {"AE"},
+        # the class of XX is not known up front, the workers check it
+        "CORE-000003": {"AE", "XX"},
+        "CORE-000004": {"LB", "XX"},
+        # invalid rule
+        "CORE-000005": set(),
+    }
+    # the class is detected once for each domain, from the first dataset
+    assert data_service.get_dataset_class_from_metadata.call_count == 3
+    data_service.get_dataset.assert_not_called()
+
+
+@patch("scripts.run_validation.validate_single_rule")
+def test_worker_data_service_uses_worker_cache(mock_validate_single_rule: MagicMock):
+    args = MagicMock(
+        standard="sdtmig", version="3.4", dataset_paths=[], dataset_cache_path=None
+    )
+    shared_service = MagicMock()
+    with patch.object(LocalDataService, "_instance", shared_service), patch.object(
+        USDMDataService, "_instance", shared_service
+    ):
+        init_worker(MagicMock(), MagicMock(), [], [StudyContext([], args)] * 2)
+        validate_rule_in_worker((0, {"core_id": "CORE-000001"}))
+        validate_rule_in_worker((1, {"core_id": "CORE-000001"}))
+        # the shared instances are left to the other users of the data services
+        assert LocalDataService._instance is shared_service
+        assert USDMDataService._instance is shared_service
+    data_services = [call.args[-1] for call in mock_validate_single_rule.call_args_list]
+    assert all(isinstance(service, LocalDataService) for service in data_services)
+    assert data_services[0] is not data_services[1]
+    assert isinstance(data_services[0].cache_service, TieredCacheService)
+
+
+def test_get_result_keys(tmp_path):
+    datasets = []
+    for domain in ("AE", "DM", "LB"):
+        file_path = os.path.join(tmp_path, f"{domain.lower()}.xpt")
+        with open(file_path, "w") as f:
+            f.write(domain)
+        datasets.append(
+            {"domain": domain, "filename": f"{domain}.xpt", "full_path": file_path}
+        )
+    store = ValidationResultStore(os.path.join(tmp_path, "results.db"))
+    rules = [
+        {"core_id": "CORE-000001"},
+        {"core_id": "CORE-000002", "datasets": [{"domain_name": "DM"}]},
+    ]
+    applicable_domains = {
+        "CORE-000001": frozenset({"AE", "LB"}),
+        "CORE-000002": frozenset({"AE"}),
+    }
+    keys = get_result_keys(rules, datasets, applicable_domains, store, ("context",))
+    assert set(keys) == {
+        ("CORE-000001", "AE"),
+        ("CORE-000001", "LB"),
+        ("CORE-000002", "AE"),
+    }
+    assert len(set(keys.values())) == 3
+    assert keys == get_result_keys(
+        rules, datasets, applicable_domains, store, ("context",)
+    )
+    # only the keys of the rules that read the dataset change
+    with open(datasets[1]["full_path"], "w") as f:
+        f.write("DM changed")
+    new_keys = get_result_keys(rules, datasets, applicable_domains, store, ("context",))
+    assert [pair for pair in keys if keys[pair] != new_keys[pair]] == [
+        ("CORE-000002", "AE")
+    ]
+    # the shared inputs change every key
+    other_keys = get_result_keys(
+        rules, datasets, applicable_domains, store, ("other context",)
+    )
+    assert not set(other_keys.values()) & set(new_keys.values())
+    # the rule is a part of the key
+    changed_rule = {"core_id": "CORE-000001", "sensitivity": "Record"}
+    assert get_result_keys(
+        [changed_rule], datasets, applicable_domains, store, ("context",)
+    )[("CORE-000001", "AE")] != (new_keys[("CORE-000001", "AE")])
+
+
+def test_load_and_store_results(tmp_path):
+    store = ValidationResultStore(os.path.join(tmp_path, "results.db"))
+    success = [{"domain": "AE", "executionStatus": "success", "errors": []}]
+    error = [{"domain": "LB", "executionStatus": "execution_error", "errors": []}]
+    result_keys = {
+        ("CORE-000001", "AE"): "key-1",
+        ("CORE-000001", "LB"): "key-2",
+        ("CORE-000002", "AE"): "key-3",
+    }
+    applicable_domains = {
+        "CORE-000001": frozenset({"AE", "LB"}),
+        "CORE-000002": frozenset({"AE"}),
+    }
+    results_by_domain = {"AE": {}, "LB": {}}
+    store.add_many({"key-3": success})
+    pending_domains = load_stored_results(
+        store, result_keys, applicable_domains, results_by_domain
+    )
+    assert pending_domains == {
+        "CORE-000001": frozenset({"AE", "LB"}),
+        "CORE-000002": frozenset(),
+    }
+    assert results_by_domain == {"AE": {"CORE-000002": success}, "LB": {}}
+    results_by_domain["AE"]["CORE-000001"] = success
+    results_by_domain["LB"]["CORE-000001"] = error
+    store_results(store, result_keys, pending_domains, results_by_domain)
+    # results with execution errors are validated again in the next run
+    assert store.get_many(result_keys.values()) == {
+        "key-1": success,
+        "key-3": success,
+    }
+
+
+@patch("scripts.run_validation.validate_single_rule")
+@patch("scripts.run_validation.fill_cache_with_dictionaries")
+@patch("scripts.run_validation.get_study_data_service")
+def test_distributed_worker_context(
+    mock_get_study_data_service: MagicMock,
+    mock_fill_cache: MagicMock,
+    mock_validate_single_rule: MagicMock,
+):
+    args, other_args, library_metadata = MagicMock(), MagicMock(), MagicMock()
+    studies = [StudyContext([], args), StudyContext([], other_args)]
+    # workers of a distributed executor read datasets into their own cache
+    init_worker(None, library_metadata, [], studies)
+    worker_cache = mock_fill_cache.call_args.args[0]
+    assert isinstance(worker_cache, InMemoryCacheService)
+    assert mock_fill_cache.call_args.args[1] is args
+    validate_rule_in_worker((1, {"core_id": "CORE-000001"}))
+    mock_get_study_data_service.assert_called_once_with(
+        other_args, worker_cache, library_metadata
+    )
+
+
+def test_get_prefetch_paths():
+    datasets = [
+        {"domain": "AE", "full_path": "/data/ae.xpt"},
+        {"domain": "DM", "full_path": "/data/dm.xpt"},
+        {"domain": "LB", "full_path": "/data/lb.xpt"},
+    ]
+    merge_rule = {"core_id": "CORE-000001", "datasets": [{"domain_name": "DM"}]}
+    all_datasets_rule = {"core_id": "CORE-000002", "rule_type": "Domain Presence Check"}
+    assert get_prefetch_paths([merge_rule], ["AE", "LB"], datasets) == [
+        "/data/ae.xpt",
+        "/data/dm.xpt",
+        "/data/lb.xpt",
+    ]
+    assert get_prefetch_paths([all_datasets_rule], ["LB"], datasets) == ["/data/lb.xpt"]
@@ -0,0 +1,246 @@
+import json
+import os
+import pickle
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cdisc_rules_engine.enums.library_metadata_types import LibraryMetadataTypes
+from cdisc_rules_engine.models.rule_plan import RulePlan, build_rule_plan_index
+from cdisc_rules_engine.services.cache import InMemoryCacheService, LibraryMetadataStore
+from scripts.script_utils import (
+    fill_cache_with_dictionaries,
+    get_library_metadata_from_cache,
+    get_library_source_files,
+    get_rule_plans,
+    get_rules,
+    read_manifest,
+)
+
+rules: dict = {
+    "rules/sdtmig/3-4/CORE-000002": {"core_id": "CORE-000002"},
+    "rules/sdtmig/3-3/CORE-000001": {"core_id": "CORE-000001"},
+    "rules/sdtmig/3-4/CORE-000001": {"core_id": "CORE-000001"},
+}
+standard_metadata: dict = {"_links": {"model": {"href": "/mdr/sdtm/2-0"}}}
+
+
+def _write_pickled_cache(cache_path: str):
+    pickled_files: dict = {
+        "rules.pkl": rules,
+        "standards_details.pkl": {"standards/sdtmig/3-4": standard_metadata},
+        "standards_models.pkl": {"models/sdtm/2-0": {"name": "SDTM"}},
+        "variable_codelist_maps.pkl": {"sdtmig-3-4-codelists": {"AESEV": "C1"}},
+        "variables_metadata.pkl": {},
+        "sdtmct-2022-12-16.pkl": {"package": "sdtmct-2022-12-16"},
+        "sdtmct-2022-09-30.pkl": {"package": "sdtmct-2022-09-30"},
+    }
+    for file_name, data in pickled_files.items():
+        with open(os.path.join(cache_path, file_name), "wb") as f:
+            pickle.dump(data, f)
+
+
+def _write_store(cache_path: str, with_rule_plans: bool = False):
+    def load(file_name: str) -> dict:
+        with open(os.path.join(cache_path, file_name), "rb") as f:
+            return pickle.load(f)
+
+    rule_plans: dict = {}
+    if with_rule_plans:
+        rule_plans = {
+            key: {"format_version": RulePlan.FORMAT_VERSION, "plans": plans}
+            for key, plans in build_rule_plan_index(load("rules.pkl")).items()
+        }
+    LibraryMetadataStore.write(
+        os.path.join(cache_path, "library_metadata.db"),
+        {
+            LibraryMetadataTypes.RULES.value: load("rules.pkl"),
+            LibraryMetadataTypes.RULE_PLANS.value: rule_plans,
+            LibraryMetadataTypes.STANDARDS.value: load("standards_details.pkl"),
+            LibraryMetadataTypes.MODELS.value: load("standards_models.pkl"),
+            LibraryMetadataTypes.VARIABLE_CODELIST_MAPS.value: load(
+                "variable_codelist_maps.pkl"
+            ),
+            LibraryMetadataTypes.VARIABLES_METADATA.value: load(
+                "variables_metadata.pkl"
+            ),
+            LibraryMetadataTypes.CT_PACKAGES.value: {
+                package: load(f"{package}.pkl")
+                for package in ("sdtmct-2022-12-16", "sdtmct-2022-09-30")
+            },
+        },
+        get_library_source_files(cache_path),
+    )
+
+
+def _fail_pickled_cache_reads():
+    # the store is up to date, the pickled cache files are not read
+    return patch(
+        "scripts.script_utils.pickle.load",
+        side_effect=AssertionError("read the pickled cache"),
+    )
+
+
+@pytest.mark.parametrize("selected_rules", [None, ["CORE-000001", "CORE-000003"]])
+def test_get_rules_from_store(tmp_path, selected_rules):
+    _write_pickled_cache(tmp_path)
+    args = MagicMock(
+        cache=str(tmp_path), standard="sdtmig", version="3.4", rules=selected_rules
+    )
+    expected_rules = get_rules(args)
+    _write_store(tmp_path)
+    with _fail_pickled_cache_reads():
+        assert get_rules(args) == expected_rules
+
+
+@pytest.mark.parametrize("selected_rules", [None, ["CORE-000001", "CORE-000003"]])
+@pytest.mark.parametrize("with_rule_plans", [True, False])
+def test_get_rule_plans(tmp_path, selected_rules, with_rule_plans):
+    _write_pickled_cache(tmp_path)
+    args = MagicMock(
+        cache=str(tmp_path), standard="sdtmig", version="3.4", rules=selected_rules
+    )
+    expected_rules = [rule for rule in get_rules(args) if rule]
+    _write_store(tmp_path, with_rule_plans)
+    with _fail_pickled_cache_reads():
+        plans = get_rule_plans(args)
+    assert [plan.rule for plan in plans] == expected_rules
+
+
+def test_get_library_metadata_from_store(tmp_path):
+    _write_pickled_cache(tmp_path)
+    args = MagicMock(
+        cache=str(tmp_path),
+        standard="sdtmig",
+        version="3.4",
+        controlled_terminology_package=("sdtmct-2022-12-16",),
+    )
+    expected = get_library_metadata_from_cache(args)
+    _write_store(tmp_path)
+    with _fail_pickled_cache_reads():
+        library_metadata = get_library_metadata_from_cache(args)
+    assert library_metadata.standard_metadata == expected.standard_metadata
+    assert (
+        library_metadata.model_metadata == expected.model_metadata == {"name": "SDTM"}
+    )
+    assert library_metadata.variable_codelist_map == expected.variable_codelist_map
+    assert library_metadata.variables_metadata == expected.variables_metadata
+    assert library_metadata.get_all_ct_package_metadata() == [
+        {"package": "sdtmct-2022-12-16"}
+    ]
+    assert (
+        library_metadata.get_all_ct_package_metadata()
+        == expected.get_all_ct_package_metadata()
+    )
+    assert library_metadata.published_ct_packages == expected.published_ct_packages
+
+
+def test_outdated_store_is_not_used(tmp_path):
+    _write_pickled_cache(tmp_path)
+    _write_store(tmp_path)
+    args = MagicMock(
+        cache=str(tmp_path),
+        standard="sdtmig",
+        version="3.4",
+        rules=None,
+        controlled_terminology_package=("sdtmct-2023-03-31",),
+    )
+    # a CT package added to the cache after update-cache
+    with open(os.path.join(tmp_path, "sdtmct-2023-03-31.pkl"), "wb") as f:
+        pickle.dump({"package": "sdtmct-2023-03-31"}, f)
+    library_metadata = get_library_metadata_from_cache(args)
+    assert library_metadata.get_all_ct_package_metadata() == [
+        {"package": "sdtmct-2023-03-31"}
+    ]
+    assert "sdtmct-2023-03-31" in library_metadata.published_ct_packages
+    # rules updated after update-cache
+    with open(os.path.join(tmp_path, "rules.pkl"), "wb") as f:
+        pickle.dump({"rules/sdtmig/3-4/CORE-000004": {"core_id": "CORE-000004"}}, f)
+    assert get_rules(args) == [{"core_id": "CORE-000004"}]
+
+
+def test_store_without_source_fingerprints_is_not_used(tmp_path):
+    _write_pickled_cache(tmp_path)
+    LibraryMetadataStore.write(
+        os.path.join(tmp_path, "library_metadata.db"),
+        {LibraryMetadataTypes.RULES.value: {}},
+    )
+    args = MagicMock(cache=str(tmp_path), standard="sdtmig", version="3.4", rules=None)
+    assert get_rules(args) == [{"core_id": "CORE-000002"}, {"core_id": "CORE-000001"}]
+
+
+@patch("scripts.script_utils.DataServiceFactory")
+@patch("scripts.script_utils.extract_dictionary_terms")
+def test_fill_cache_with_dictionaries(
+    mock_extract_dictionary_terms: MagicMock, mock_data_service_factory: MagicMock
+):
+    cache = InMemoryCacheService()
+    cache.add("/dictionaries/meddra", {"pt": []})
+    args = MagicMock(meddra="/dictionaries/meddra", whodrug="/dictionaries/whodrug")
+    fill_cache_with_dictionaries(cache, args)
+    # the dictionary already in the cache is not extracted again
+    mock_extract_dictionary_terms.assert_called_once()
+    assert mock_extract_dictionary_terms.call_args.args[2] == "/dictionaries/whodrug"
+    assert cache.get("/dictionaries/meddra") == {"pt": []}
+    assert (
+        cache.get("/dictionaries/whodrug") == mock_extract_dictionary_terms.return_value
+    )
+
+
+def _write_manifest(tmp_path, studies) -> str:
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    with open(manifest_path, "w") as f:
+        json.dump(studies, f)
+    return manifest_path
+
+
+def test_read_manifest(tmp_path):
+    os.makedirs(os.path.join(tmp_path, "study1"))
+    for file_name in ("dm.xpt", "ae.xpt"):
+        with open(os.path.join(tmp_path, "study1", file_name), "w") as f:
+            f.write("")
+    manifest_path = _write_manifest(
+        tmp_path,
+        [
+            {
+                "data": "study1",
+                "define_xml_path": "study1/define.xml",
+                "output": "reports/study1",
+            },
+            {"dataset_paths": ["/data/study2/ae.xpt"], "output": "/reports/study2"},
+        ],
+    )
+    assert read_manifest(manifest_path) == [
+        {
+            "output": os.path.join(tmp_path, "reports/study1"),
+            "dataset_paths": [
+                os.path.join(tmp_path, "study1", "ae.xpt"),
+                os.path.join(tmp_path, "study1", "dm.xpt"),
+            ],
+            "define_xml_path": os.path.join(tmp_path, "study1/define.xml"),
+        },
+        {
+            "output": "/reports/study2",
+            "dataset_paths": ["/data/study2/ae.xpt"],
+            "define_xml_path": None,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "studies",
+    [
+        [],
+        {"output": "report"},
+        [{"data": "study1"}],
+        [{"output": "report"}],
+        [{"data": "study1", "dataset_paths": ["ae.xpt"], "output": "report"}],
+        [
+            {"dataset_paths": ["ae.xpt"], "output": "report"},
+            {"dataset_paths": ["dm.xpt"], "output": "report"},
+        ],
+    ],
+)
+def test_read_invalid_manifest(tmp_path, studies):
+    with pytest.raises(ValueError):
+        read_manifest(_write_manifest(tmp_path, studies))
@@ -0,0 +1,71 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+
+from cdisc_rules_engine.services.cache import DatasetFileCache
+
+
+def _write_dataset_file(path: str, content: str) -> str:
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def test_get_missing_dataset(tmp_path):
+    cache = DatasetFileCache(os.path.join(tmp_path, "cache"))
+    dataset_path = _write_dataset_file(os.path.join(tmp_path, "ae.xpt"), "ae")
+    assert cache.get(dataset_path) is None
+    assert cache.get(os.path.join(tmp_path, "missing.xpt")) is None
+
+
+def test_add_and_get_dataset(tmp_path):
+    cache = DatasetFileCache(os.path.join(tmp_path, "cache"))
+    dataset_path = _write_dataset_file(os.path.join(tmp_path, "ae.xpt"), "ae")
+    dataset = pd.DataFrame.from_dict(
+        {
+            "AESEQ": [1.0, 2.0, float("nan")],
+            "AETERM": ["HEADACHE", "", None],
+        }
+    )
+    cache.add(dataset_path, dataset)
+    cached_dataset = cache.get(dataset_path)
+    pd.testing.assert_frame_equal(cached_dataset, dataset)
+    assert cached_dataset["AETERM"].tolist() == ["HEADACHE", "", None]
+
+
+def test_mixed_type_columns_are_cached(tmp_path):
+    cache = DatasetFileCache(os.path.join(tmp_path, "cache"))
+    dataset_path = _write_dataset_file(os.path.join(tmp_path, "ae.json"), "ae")
+    dataset = pd.DataFrame.from_dict({"AESTDY": [1, "test", None]})
+    cache.add(dataset_path, dataset)
+    pd.testing.assert_frame_equal(cache.get(dataset_path), dataset)
+
+
+def test_changed_dataset_is_not_served(tmp_path):
+    cache_path = os.path.join(tmp_path, "cache")
+    cache = DatasetFileCache(cache_path)
+    dataset_path = _write_dataset_file(os.path.join(tmp_path, "ae.xpt"), "ae")
+    cache.add(dataset_path, pd.DataFrame.from_dict({"AESEQ": [1]}))
+
+    _write_dataset_file(dataset_path, "new ae")
+    assert cache.get(dataset_path) is None
+    cache.add(dataset_path, pd.DataFrame.from_dict({"AESEQ": [2]}))
+    assert cache.get(dataset_path)["AESEQ"].tolist() == [2]
+    # the file cached for the previous version is removed
+    assert len(os.listdir(cache_path)) == 1
+
+
+def test_dataset_cached_by_other_engine_version_is_not_served(tmp_path):
+    cache_path = os.path.join(tmp_path, "cache")
+    cache = DatasetFileCache(cache_path)
+    dataset_path = _write_dataset_file(os.path.join(tmp_path, "ae.xpt"), "ae")
+    with patch(
+        "cdisc_rules_engine.services.cache.dataset_file_cache.__version__", "0.0.1"
+    ):
+        cache.add(dataset_path, pd.DataFrame.from_dict({"AESEQ": [1]}))
+        assert cache.get(dataset_path)["AESEQ"].tolist() == [1]
+    assert cache.get(dataset_path) is None
+    cache.add(dataset_path, pd.DataFrame.from_dict({"AESEQ": [2]}))
+    assert cache.get(dataset_path)["AESEQ"].tolist() == [2]
+    assert len(os.listdir(cache_path)) == 1
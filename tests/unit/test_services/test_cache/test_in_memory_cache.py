@@ -42,3 +42,17 @@ def test_clear_all_with_prefix():
     cache.clear_all("te")
     assert cache.exists("hi")
     assert not cache.exists("test")
+
+
+def test_custom_size_estimator():
+    cache = InMemoryCacheService(max_size=10, size_estimator=lambda data: len(data))
+    cache.add("small", "a" * 10)
+    cache.add("large", "a" * 11)
+    assert cache.get("small") == "a" * 10
+    assert cache.get("large") is None
+
+
+def test_get_sizing_stats():
+    cache = InMemoryCacheService()
+    cache.add("test", "this is a test")
+    assert cache.get_sizing_stats()["calls"] == 1
@@ -0,0 +1,85 @@
+import os
+
+from cdisc_rules_engine.enums.library_metadata_types import LibraryMetadataTypes
+from cdisc_rules_engine.services.cache import LibraryMetadataStore
+
+rules: dict = {
+    "rules/sdtmig/3-4/CORE-000002": {"core_id": "CORE-000002"},
+    "rules/sdtmig/3-4/CORE-000001": {"core_id": "CORE-000001"},
+    "rules/sdtmig/3-3/CORE-000001": {"core_id": "CORE-000001"},
+    "rules/sdtmig/3-4_1/CORE-000003": {"core_id": "CORE-000003"},
+}
+
+
+def _write_store(tmp_path) -> LibraryMetadataStore:
+    file_path = os.path.join(tmp_path, "library_metadata.db")
+    LibraryMetadataStore.write(
+        file_path,
+        {
+            LibraryMetadataTypes.RULES.value: rules,
+            LibraryMetadataTypes.CT_PACKAGES.value: {
+                "sdtmct-2022-12-16": {"package": "sdtmct-2022-12-16"},
+                "adamct-2022-06-24": {"package": "adamct-2022-06-24"},
+            },
+        },
+    )
+    return LibraryMetadataStore(file_path)
+
+
+def test_get(tmp_path):
+    store = _write_store(tmp_path)
+    assert store.get(LibraryMetadataTypes.CT_PACKAGES.value, "sdtmct-2022-12-16") == {
+        "package": "sdtmct-2022-12-16"
+    }
+    assert store.get(LibraryMetadataTypes.CT_PACKAGES.value, "missing") is None
+    assert store.get(LibraryMetadataTypes.RULES.value, "sdtmct-2022-12-16") is None
+
+
+def test_get_many(tmp_path):
+    store = _write_store(tmp_path)
+    keys = list(rules.keys())[:2] + ["rules/sdtmig/3-4/missing"]
+    assert store.get_many(LibraryMetadataTypes.RULES.value, keys) == {
+        key: rules[key] for key in keys[:2]
+    }
+    assert store.get_many(LibraryMetadataTypes.RULES.value, []) == {}
+
+
+def test_get_by_prefix_keeps_order(tmp_path):
+    store = _write_store(tmp_path)
+    result = store.get_by_prefix(LibraryMetadataTypes.RULES.value, "rules/sdtmig/3-4/")
+    assert list(result.items()) == list(rules.items())[:2]
+
+
+def test_keys(tmp_path):
+    store = _write_store(tmp_path)
+    assert store.keys(LibraryMetadataTypes.CT_PACKAGES.value) == [
+        "sdtmct-2022-12-16",
+        "adamct-2022-06-24",
+    ]
+    assert store.keys(LibraryMetadataTypes.MODELS.value) == []
+
+
+def test_write_replaces_store(tmp_path):
+    store = _write_store(tmp_path)
+    LibraryMetadataStore.write(
+        store.file_path, {LibraryMetadataTypes.RULES.value: {"rules/a": {}}}
+    )
+    assert store.keys(LibraryMetadataTypes.RULES.value) == ["rules/a"]
+    assert store.keys(LibraryMetadataTypes.CT_PACKAGES.value) == []
+    assert store.is_up_to_date([])
+    assert os.listdir(tmp_path) == ["library_metadata.db"]
+
+
+def test_is_up_to_date(tmp_path):
+    source_files = [os.path.join(tmp_path, name) for name in ("rules.pkl", "ct.pkl")]
+    for source_file in source_files:
+        with open(source_file, "wb") as f:
+            f.write(b"data")
+    file_path = os.path.join(tmp_path, "library_metadata.db")
+    LibraryMetadataStore.write(file_path, {}, source_files)
+    store = LibraryMetadataStore(file_path)
+    assert store.is_up_to_date(source_files)
+    assert not store.is_up_to_date(source_files[:1])
+    with open(source_files[1], "wb") as f:
+        f.write(b"new data")
+    assert not store.is_up_to_date(source_files)
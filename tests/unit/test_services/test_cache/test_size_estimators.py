@@ -0,0 +1,53 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from pympler import asizeof
+
+from cdisc_rules_engine.services.cache.size_estimators import (
+    SizeEstimator,
+    estimate_array_size,
+    estimate_dataframe_size,
+)
+
+
+def test_estimate_dataframe_size():
+    df = pd.DataFrame.from_dict({"AESEQ": [1, 2, 3], "AETERM": ["A", "B", "C"]})
+    assert estimate_dataframe_size(df) == df.memory_usage(deep=True).sum()
+    assert estimate_dataframe_size(df, deep=False) < estimate_dataframe_size(df)
+
+
+def test_estimate_array_size():
+    array = np.zeros(1000, dtype=np.float64)
+    assert estimate_array_size(array) >= array.nbytes
+    assert estimate_array_size(array[:500]) >= array[:500].nbytes
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {str(i): "value" * (i % 5) for i in range(10)},
+        {str(i): {"code": i, "term": "test"} for i in range(1000)},
+        [str(i) for i in range(1000)],
+    ],
+)
+def test_estimate_container_size_is_close_to_asizeof(data):
+    estimate = SizeEstimator()(data)
+    assert 0.5 < estimate / asizeof.asizeof(data) < 2
+
+
+def test_size_estimator_stats():
+    estimator = SizeEstimator()
+    estimator("test")
+    estimator(pd.DataFrame.from_dict({"AESEQ": [1]}))
+    stats = estimator.get_stats()
+    assert stats["calls"] == 2
+    assert stats["total_time"] > 0
+
+
+def test_size_estimator_register():
+    estimator = SizeEstimator()
+    estimator.register(int, lambda data: 1)
+    assert estimator(10) == 1
+    assert estimator("test") == sys.getsizeof("test")
@@ -0,0 +1,112 @@
+import os
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from cdisc_rules_engine.models.dataset_types import DatasetTypes
+from cdisc_rules_engine.services.cache import (
+    InMemoryCacheService,
+    TieredCacheService,
+)
+from cdisc_rules_engine.utilities.utils import get_dataset_cache_key_from_path
+
+
+def test_get_is_served_from_local_cache():
+    shared_cache = MagicMock()
+    shared_cache.get.return_value = "this is a test"
+    cache = TieredCacheService(shared_cache)
+    assert cache.get("test") == "this is a test"
+    assert cache.get("test") == "this is a test"
+    shared_cache.get.assert_called_once_with("test")
+
+
+def test_add_writes_both_tiers():
+    shared_cache = InMemoryCacheService(max_size=1024 * 1024)
+    cache = TieredCacheService(shared_cache)
+    dataset = pd.DataFrame.from_dict({"AESEQ": [1, 2]})
+    cache.add("test", dataset)
+    pd.testing.assert_frame_equal(cache.get("test"), dataset)
+    assert shared_cache.get("test") is dataset
+
+
+def test_value_exceeds_local_max_size():
+    shared_cache = MagicMock()
+    shared_cache.get.return_value = "this is a test"
+    cache = TieredCacheService(shared_cache, max_size=1)
+    cache.get("test")
+    cache.get("test")
+    assert shared_cache.get.call_count == 2
+
+
+def test_clear_removes_local_entry():
+    shared_cache = MagicMock()
+    cache = TieredCacheService(shared_cache)
+    cache.add("test", "this is a test")
+    cache.clear("test")
+    shared_cache.get.return_value = None
+    assert cache.get("test") is None
+    shared_cache.clear.assert_called_once_with("test")
+
+
+def test_local_entry_invalidated_when_dataset_changes(tmp_path):
+    dataset_path = os.path.join(tmp_path, "ae.xpt")
+    with open(dataset_path, "w") as f:
+        f.write("old")
+    cache_key = get_dataset_cache_key_from_path(
+        dataset_path, DatasetTypes.CONTENTS.value
+    )
+    shared_cache = MagicMock()
+    cache = TieredCacheService(shared_cache)
+    cache.add(cache_key, "old dataset")
+    assert cache.get(cache_key) == "old dataset"
+
+    with open(dataset_path, "w") as f:
+        f.write("new data")
+    shared_cache.get.return_value = "new dataset"
+    # fingerprints are read once per task
+    assert cache.get(cache_key) == "old dataset"
+    cache.refresh_fingerprints()
+    assert cache.get(cache_key) == "new dataset"
+
+
+def test_caller_mutations_do_not_change_cached_dataframe():
+    cache = TieredCacheService(MagicMock())
+    dataset = pd.DataFrame.from_dict({"AESEQ": [1.0, 2.0], "AETERM": ["A", None]})
+    expected = dataset.copy()
+    cache.add("test", dataset)
+
+    cached = cache.get("test")
+    cached["AESTDY"] = 1
+    cached.rename(columns={"AESEQ": "SEQ"}, inplace=True)
+    with pytest.raises(ValueError):
+        cached.loc[0, "AETERM"] = "B"
+    with pytest.raises(ValueError):
+        cached.fillna("B", inplace=True)
+
+    pd.testing.assert_frame_equal(cache.get("test"), expected)
+
+
+def test_added_dataframe_stays_with_caller():
+    cache = TieredCacheService(MagicMock())
+    dataset = pd.DataFrame.from_dict({"AESEQ": [1.0, 2.0], "AETERM": ["A", None]})
+    expected = dataset.copy()
+    cache.add("test", dataset)
+
+    dataset["AESTDY"] = 1
+    dataset.loc[0, "AETERM"] = "B"
+    dataset.fillna("C", inplace=True)
+
+    assert dataset["AETERM"].tolist() == ["B", "C"]
+    pd.testing.assert_frame_equal(cache.get("test"), expected)
+
+
+def test_caller_mutations_do_not_change_cached_value():
+    shared_cache = MagicMock()
+    shared_cache.get.return_value = {"AE": ["AESEQ"]}
+    cache = TieredCacheService(shared_cache)
+    cache.get("test")["AE"].append("AETERM")
+    cache.add("other", {"DM": ["USUBJID"]})
+    cache.get("other").clear()
+    assert cache.get("test") == {"AE": ["AESEQ"]}
+    assert cache.get("other") == {"DM": ["USUBJID"]}
@@ -0,0 +1,52 @@
+import os
+
+from cdisc_rules_engine.services.cache import ValidationResultStore
+
+
+def test_add_and_get_results(tmp_path):
+    store = ValidationResultStore(os.path.join(tmp_path, "results.db"))
+    results = [{"domain": "AE", "executionStatus": "success", "errors": []}]
+    store.add_many({"key-1": results})
+    # the results persist between runs
+    store = ValidationResultStore(os.path.join(tmp_path, "results.db"))
+    assert store.get_many(["key-1", "key-2"]) == {"key-1": results}
+    assert store.get_many(f"key-{i}" for i in range(1200)) == {"key-1": results}
+
+
+def test_get_key():
+    assert ValidationResultStore.get_key("a", ("b", 1)) == (
+        ValidationResultStore.get_key("a", ("b", 1))
+    )
+    assert ValidationResultStore.get_key("a", ("b", 1)) != (
+        ValidationResultStore.get_key("a", ("b", 2))
+    )
+
+
+def test_get_file_digest(tmp_path):
+    store = ValidationResultStore(os.path.join(tmp_path, "results.db"))
+    file_path = os.path.join(tmp_path, "ae.xpt")
+    assert store.get_file_digest(file_path) is None
+    with open(file_path, "wb") as f:
+        f.write(b"AE")
+    digest = store.get_file_digest(file_path)
+    assert digest == store.get_file_digest(file_path)
+    # a rewritten file with the same contents has the same digest
+    os.utime(file_path, ns=(0, 0))
+    assert store.get_file_digest(file_path) == digest
+    with open(file_path, "wb") as f:
+        f.write(b"DM")
+    assert store.get_file_digest(file_path) != digest
+
+
+def test_get_path_digest(tmp_path):
+    store = ValidationResultStore(os.path.join(tmp_path, "store", "results.db"))
+    dictionary_path = os.path.join(tmp_path, "meddra")
+    os.makedirs(os.path.join(dictionary_path, "25-0"))
+    with open(os.path.join(dictionary_path, "25-0", "llt.asc"), "w") as f:
+        f.write("10000001$Term$")
+    digest = store.get_path_digest(dictionary_path)
+    assert [file_name for file_name, _ in digest] == [os.path.join("25-0", "llt.asc")]
+    assert store.get_path_digest(None) is None
+    with open(os.path.join(dictionary_path, "25-0", "pt.asc"), "w") as f:
+        f.write("10000002$Term$")
+    assert store.get_path_digest(dictionary_path) != digest
@@ -0,0 +1,269 @@
+import pickle
+import threading
+from collections import defaultdict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cdisc_rules_engine.services.executors import (
+    LocalProcessExecutor,
+    RedisQueueExecutor,
+    RedisQueueWorker,
+    TaskExecutorFactory,
+)
+from cdisc_rules_engine.services.executors.redis_queue_executor import (
+    get_versioned_queue,
+)
+from version import __version__
+
+QUEUE: str = get_versioned_queue("core:tasks")
+
+_context: dict = {}
+
+
+def _init(offset: int):
+    _context["offset"] = offset
+    _context["initialized"] = _context.get("initialized", 0) + 1
+
+
+def _add_offset(task: int) -> int:
+    if task < 0:
+        raise ValueError("Negative task")
+    return task + _context["offset"]
+
+
+class FakeRedis:
+    """
+    Keeps the keys and the lists used by the task queue in memory.
+    """
+
+    def __init__(self):
+        self.values: dict = {}
+        self.lists: defaultdict = defaultdict(list)
+        # seconds to live of the keys that expire, keys are not expired
+        self.expirations: dict = {}
+        self.condition = threading.Condition()
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.expirations.pop(key, None)
+        if ex is not None:
+            self.expirations[key] = ex
+
+    def expire(self, key, seconds):
+        if key not in self.values and not self.lists.get(key):
+            return 0
+        self.expirations[key] = seconds
+        return 1
+
+    def ttl(self, key):
+        if key not in self.values and not self.lists.get(key):
+            return -2
+        return self.expirations.get(key, -1)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.lists.pop(key, None)
+            self.expirations.pop(key, None)
+
+    def rpush(self, key, *values):
+        with self.condition:
+            self.lists[key].extend(values)
+            self.condition.notify_all()
+
+    def lpush(self, key, *values):
+        with self.condition:
+            for value in values:
+                self.lists[key].insert(0, value)
+            self.condition.notify_all()
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def lrem(self, key, count, value):
+        with self.condition:
+            values = self.lists.get(key, [])
+            removed = 0
+            while value in values and (not count or removed < count):
+                values.remove(value)
+                removed += 1
+            self._remove_empty(key)
+            return removed
+
+    def _wait_for(self, key, timeout):
+        return self.condition.wait_for(
+            lambda: self.lists.get(key), timeout=timeout or None
+        )
+
+    def _remove_empty(self, key):
+        if key in self.lists and not self.lists[key]:
+            # Redis removes empty lists
+            del self.lists[key]
+            self.expirations.pop(key, None)
+
+    def blpop(self, key, timeout=0):
+        with self.condition:
+            if not self._wait_for(key, timeout):
+                return None
+            value = self.lists[key].pop(0)
+            self._remove_empty(key)
+            return key, value
+
+    def brpoplpush(self, source, destination, timeout=0):
+        with self.condition:
+            if not self._wait_for(source, timeout):
+                return None
+            value = self.lists[source].pop()
+            self._remove_empty(source)
+            self.lists[destination].insert(0, value)
+            return value
+
+
+def test_local_process_executor():
+    executor = LocalProcessExecutor(2)
+    results = executor.imap_unordered(_add_offset, [1, 2, 3], _init, (10,))
+    assert sorted(results) == [11, 12, 13]
+
+
+def test_redis_queue_executor():
+    client = FakeRedis()
+    worker = RedisQueueWorker(client, poll_timeout=1)
+    thread = threading.Thread(target=worker.run, args=(3,), daemon=True)
+    thread.start()
+    executor = RedisQueueExecutor(client, result_timeout=5)
+    results = executor.imap_unordered(_add_offset, [1, 2, 3], _init, (10,))
+    assert sorted(results) == [11, 12, 13]
+    thread.join(5)
+    # the job is removed when all results are read
+    assert not client.values
+    assert not client.lists
+
+
+def test_redis_queue_job_keys_expire():
+    client = FakeRedis()
+    worker = RedisQueueWorker(client, poll_timeout=1)
+    thread = threading.Thread(target=worker.run, args=(2,), daemon=True)
+    thread.start()
+    executor = RedisQueueExecutor(client, result_timeout=5, claim_timeout=1)
+    results = executor.imap_unordered(_add_offset, [1, 2], _init, (10,))
+    next(results)
+    (job_key,) = [key for key in client.values if key.startswith(f"{QUEUE}:jobs:")]
+    assert client.ttl(job_key) == 7
+    list(results)
+    thread.join(5)
+    assert not client.expirations
+
+
+def test_redis_queue_worker_drops_result_of_finished_job():
+    client = FakeRedis()
+    job_key: str = f"{QUEUE}:jobs:job"
+    results_key: str = f"{QUEUE}:results:job"
+    client.set(job_key, pickle.dumps((_add_offset, _init, (10,))), ex=30)
+    worker = RedisQueueWorker(client)
+    worker.run_task(pickle.dumps(("job", 0, 0)))
+    assert len(client.lists[results_key]) == 1
+    # results expire with the job
+    assert client.ttl(results_key) == 30
+    # the coordinator stopped reading the results of the job
+    client.delete(job_key, results_key)
+    worker.run_task(pickle.dumps(("job", 1, 1)))
+    assert not client.lists.get(results_key)
+
+
+@patch("cdisc_rules_engine.services.executors.redis_queue_executor.get_redis_client")
+def test_redis_queue_executor_from_config(mock_get_redis_client: MagicMock):
+    config = MagicMock()
+    config.getValue.side_effect = {
+        "REDIS_TASK_QUEUE": "validation",
+        "REDIS_RESULT_TIMEOUT": "120",
+        "REDIS_CLAIM_TIMEOUT": "10",
+    }.get
+    executor = RedisQueueExecutor.get_instance(config)
+    assert executor.client is mock_get_redis_client.return_value
+    assert executor.queue == get_versioned_queue("validation")
+    assert executor.result_timeout == 120
+    assert executor.claim_timeout == 10
+
+
+def test_redis_queue_executor_task_error():
+    client = FakeRedis()
+    worker = RedisQueueWorker(client, poll_timeout=1)
+    thread = threading.Thread(target=worker.run, args=(1,), daemon=True)
+    thread.start()
+    executor = RedisQueueExecutor(client, result_timeout=5)
+    with pytest.raises(RuntimeError, match="Negative task"):
+        list(executor.imap_unordered(_add_offset, [-1], _init, (10,)))
+    thread.join(5)
+
+
+def test_redis_queue_executor_timeout():
+    executor = RedisQueueExecutor(FakeRedis(), result_timeout=0.01)
+    with pytest.raises(TimeoutError):
+        list(executor.imap_unordered(_add_offset, [1], _init, (10,)))
+
+
+def test_redis_queue_worker_initializes_each_job_once():
+    client = FakeRedis()
+    client.set(f"{QUEUE}:jobs:job", pickle.dumps((_add_offset, _init, (10,))))
+    _context.clear()
+    worker = RedisQueueWorker(client)
+    for index in range(2):
+        worker.run_task(pickle.dumps(("job", index, index)))
+    results = [pickle.loads(result) for result in client.lists[f"{QUEUE}:results:job"]]
+    assert results == [(0, None, 10), (1, None, 11)]
+    assert _context["initialized"] == 1
+    # the claims of the tasks are released
+    assert list(client.values) == [f"{QUEUE}:jobs:job"]
+
+
+def test_redis_queue_executor_requeues_unfinished_task():
+    client = FakeRedis()
+    executor = RedisQueueExecutor(client, result_timeout=10, claim_timeout=0.2)
+    worker = RedisQueueWorker(client, poll_timeout=1)
+    threads = [threading.Thread(target=worker.run, args=(2,), daemon=True)]
+
+    def stop_after_claiming_task():
+        # a worker killed after taking the task off the queue
+        client.brpoplpush(QUEUE, f"{QUEUE}:processing", timeout=5)
+        threads[0].start()
+
+    crashed_worker = threading.Thread(target=stop_after_claiming_task, daemon=True)
+    crashed_worker.start()
+    results = executor.imap_unordered(_add_offset, [1, 2], _init, (10,))
+    assert sorted(results) == [11, 12]
+    threads[0].join(5)
+    assert not client.values
+    assert not client.lists
+
+
+def test_redis_queue_uses_engine_version():
+    client = FakeRedis()
+    executor = RedisQueueExecutor(client)
+    assert executor.queue == RedisQueueWorker(client).queue == QUEUE
+    assert QUEUE == f"core:tasks:{__version__}"
+    assert 0 < executor.result_timeout < float("inf")
+
+
+def test_redis_queue_worker_skips_finished_job():
+    client = FakeRedis()
+    worker = RedisQueueWorker(client)
+    worker.run_task(pickle.dumps(("finished", 0, 1)))
+    assert not client.lists
+
+
+def test_task_executor_factory():
+    factory = TaskExecutorFactory(MagicMock())
+    executor = factory.get_service("local", pool_size=4)
+    assert isinstance(executor, LocalProcessExecutor)
+    assert executor.pool_size == 4
+    assert not executor.is_distributed
+    assert RedisQueueExecutor.is_distributed
+    with pytest.raises(ValueError):
+        factory.get_service("unknown")
@@ -0,0 +1,303 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from business_rules.engine import check_conditions_recursively
+
+from cdisc_rules_engine.models.dataset_variable import DatasetVariable
+from cdisc_rules_engine.utilities.condition_compiler import (
+    COMPILED_OPERATORS,
+    ConditionCompiler,
+    MultiColumnConditionPlan,
+    PredicateCache,
+    evaluate_condition_plan,
+)
+
+column_prefix_map: dict = {"--": "AE"}
+dataset = pd.DataFrame(
+    {
+        "AESEQ": [1, 2, 3, 4, 5, 6],
+        "AETERM": ["HEADACHE", "", None, "NAUSEA", "FEVER", np.nan],
+        "AEDECOD": ["HEADACHE", "", "FEVER", None, "PYREXIA", np.nan],
+        "AESEV": ["MILD", "MILD", "SEVERE", "", None, "MODERATE"],
+    }
+)
+
+
+def _condition(operator: str, target: str, **value) -> dict:
+    return {
+        "name": "get_dataset",
+        "operator": operator,
+        "value": {"target": target, **value},
+    }
+
+
+def _evaluate(conditions: dict, data: pd.DataFrame = dataset):
+    """
+    Returns the results of the compiled conditions
+    and the results of business_rules.
+    """
+    plan = ConditionCompiler(column_prefix_map).compile(conditions)
+    assert plan is not None
+    expected = check_conditions_recursively(
+        conditions, DatasetVariable(data, column_prefix_map=column_prefix_map)
+    )
+    return evaluate_condition_plan(plan, data), expected
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"all": [_condition("equal_to", "--TERM", comparator="--DECOD")]},
+        {"all": [_condition("not_equal_to", "AETERM", comparator="AEDECOD")]},
+        {"all": [_condition("equal_to", "--SEV", comparator="MILD")]},
+        {"all": [_condition("not_equal_to", "--SEV", comparator="")]},
+        {"all": [_condition("equal_to", "AESEQ", comparator=3)]},
+        {
+            "all": [
+                _condition(
+                    "equal_to", "AETERM", comparator="AEDECOD", value_is_literal=True
+                )
+            ]
+        },
+        {"all": [_condition("empty", "--TERM"), _condition("non_empty", "--SEV")]},
+        {"any": [_condition("exists", "AESTDTC"), _condition("not_exists", "AESEV")]},
+        {"all": [_condition("is_contained_by", "AESEV", comparator=["MILD", ""])]},
+        {"all": [_condition("is_not_contained_by", "AESEV", comparator=["MILD"])]},
+        {
+            "not": {
+                "any": [
+                    _condition("equal_to", "AESEV", comparator="SEVERE"),
+                    {"all": [_condition("empty", "AEDECOD")]},
+                ]
+            }
+        },
+        # the evaluation stops after the first condition
+        {
+            "all": [
+                _condition("equal_to", "AESEV", comparator="SEVERE"),
+                _condition("empty", "AESEV"),
+                _condition("non_empty", "AETERM"),
+            ]
+        },
+        {
+            "any": [
+                _condition("exists", "AESEV"),
+                _condition("equal_to", "AETERM", comparator="AEDECOD"),
+            ]
+        },
+    ],
+)
+def test_compiled_conditions_match_business_rules(conditions: dict):
+    results, expected = _evaluate(conditions)
+    assert results.dtype == bool
+    assert results.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        # a column checked after a mask without true records is still required
+        {
+            "all": [
+                _condition("equal_to", "AESEV", comparator="UNKNOWN"),
+                _condition("non_empty", "AEOUT"),
+            ]
+        },
+        {
+            "any": [
+                _condition("non_empty", "AEOUT"),
+                {"all": [_condition("empty", "AEACN")]},
+            ]
+        },
+    ],
+)
+def test_missing_columns_raise_key_error(conditions: dict):
+    plan = ConditionCompiler(column_prefix_map).compile(conditions)
+    with pytest.raises(KeyError):
+        check_conditions_recursively(
+            conditions, DatasetVariable(dataset, column_prefix_map=column_prefix_map)
+        )
+    with pytest.raises(KeyError):
+        evaluate_condition_plan(plan, dataset)
+
+
+def test_any_condition_with_missing_column():
+    conditions: dict = {
+        "any": [
+            _condition("non_empty", "AEOUT"),
+            _condition("equal_to", "AESEV", comparator="MILD"),
+        ]
+    }
+    results, expected = _evaluate(conditions)
+    assert results.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"all": [_condition("matches_regex", "AETERM", comparator="^H")]},
+        {
+            "any": [
+                _condition("empty", "AETERM"),
+                _condition("equal_to_case_insensitive", "AETERM", comparator="x"),
+            ]
+        },
+        {"all": [_condition("equal_to", "AETERM", comparator=["HEADACHE"])]},
+        {"all": []},
+        {
+            "all": [_condition("empty", "AETERM")],
+            "any": [_condition("empty", "AETERM")],
+        },
+    ],
+)
+def test_conditions_not_compiled(conditions: dict):
+    assert ConditionCompiler(column_prefix_map).compile(conditions) is None
+
+
+def test_datasets_evaluated_by_business_rules():
+    plan = ConditionCompiler(column_prefix_map).compile(
+        {"all": [_condition("equal_to", "AETERM", comparator="AEDECOD")]}
+    )
+    assert evaluate_condition_plan(plan, dataset.iloc[0:0]) is None
+    assert evaluate_condition_plan(plan, dataset.set_index("AESEQ")) is None
+    # values that are not comparable one by one
+    array_dataset = pd.DataFrame(
+        {"AETERM": [np.array([1, 2])], "AEDECOD": [np.array([1, 2])]}
+    )
+    assert evaluate_condition_plan(plan, array_dataset) is None
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {
+            "all": [
+                _condition("non_empty", target)
+                for target in ("AETERM", "AEDECOD", "AESEV")
+            ]
+        },
+        {
+            "any": [
+                _condition("equal_to", target, comparator="AEDECOD")
+                for target in ("AETERM", "AESEV")
+            ]
+        },
+        {
+            "any": [
+                _condition("empty", target)
+                for target in ("AEOUT", "AETERM", "AEACN", "AESEV")
+            ]
+        },
+        {
+            "all": [
+                _condition("exists", target) for target in ("AETERM", "AEOUT", "AESEV")
+            ]
+        },
+    ],
+)
+def test_conditions_for_all_variables(conditions: dict):
+    plan = ConditionCompiler(column_prefix_map).compile(conditions)
+    # the duplicated conditions are evaluated over a block of the columns
+    assert len(plan.conditions) == 1
+    assert isinstance(plan.conditions[0], MultiColumnConditionPlan)
+    results, expected = _evaluate(conditions)
+    assert results.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {
+            "all": [
+                _condition("non_empty", target)
+                for target in ("AETERM", "AEOUT", "AEACN")
+            ]
+        },
+        {"any": [_condition("empty", target) for target in ("AEOUT", "AEACN")]},
+    ],
+)
+def test_conditions_for_all_variables_with_missing_columns(conditions: dict):
+    plan = ConditionCompiler(column_prefix_map).compile(conditions)
+    with pytest.raises(KeyError) as expected:
+        check_conditions_recursively(
+            conditions, DatasetVariable(dataset, column_prefix_map=column_prefix_map)
+        )
+    with pytest.raises(KeyError) as error:
+        evaluate_condition_plan(plan, dataset)
+    assert sorted(error.value.args[0].split(", ")) == sorted(
+        expected.value.args[0].split(", ")
+    )
+
+
+def test_repeated_conditions_are_evaluated_once():
+    repeated_condition: dict = _condition("equal_to", "AESEV", comparator="MILD")
+    conditions: dict = {
+        "any": [
+            {"all": [repeated_condition, _condition("empty", "AEDECOD")]},
+            {"all": [repeated_condition, _condition("non_empty", "AETERM")]},
+        ]
+    }
+    equal_to = MagicMock(wraps=COMPILED_OPERATORS["equal_to"][0])
+    with patch.dict(
+        COMPILED_OPERATORS,
+        {"equal_to": (equal_to, *COMPILED_OPERATORS["equal_to"][1:])},
+    ):
+        results, expected = _evaluate(conditions)
+    assert results.tolist() == expected.tolist()
+    equal_to.assert_called_once()
+
+
+def test_predicate_cache():
+    conditions: dict = {
+        "all": [
+            _condition("non_empty", "AETERM"),
+            _condition("equal_to", "AESEV", comparator="MILD"),
+        ]
+    }
+    plan = ConditionCompiler(column_prefix_map).compile(conditions)
+    predicate_cache = PredicateCache()
+    non_empty = MagicMock(wraps=COMPILED_OPERATORS["non_empty"][0])
+    with patch.dict(
+        COMPILED_OPERATORS,
+        {"non_empty": (non_empty, *COMPILED_OPERATORS["non_empty"][1:])},
+    ):
+        # rules add columns to shallow copies of the dataset they are given
+        for derived_value in ("A", "B"):
+            derived_dataset = dataset.copy(deep=False)
+            derived_dataset["DERIVED"] = derived_value
+            results = evaluate_condition_plan(
+                plan, derived_dataset, predicate_cache.get_condition_masks(dataset)
+            )
+            assert results.tolist() == [True, False, False, False, False, False]
+        non_empty.assert_called_once()
+    # a rule replacing a column doesn't get the masks of the other rules
+    replaced_dataset = dataset.copy(deep=False)
+    replaced_dataset["AESEV"] = ["MILD"] * 6
+    results = evaluate_condition_plan(
+        plan, replaced_dataset, predicate_cache.get_condition_masks(dataset)
+    )
+    assert results.tolist() == [True, False, False, True, True, True]
+
+
+def test_predicate_cache_keeps_limited_arrays():
+    conditions: dict = {"all": [_condition("non_empty", "AETERM")]}
+    plan = ConditionCompiler(column_prefix_map).compile(conditions)
+    predicate_cache = PredicateCache(max_arrays=2)
+    non_empty = MagicMock(wraps=COMPILED_OPERATORS["non_empty"][0])
+    with patch.dict(
+        COMPILED_OPERATORS,
+        {"non_empty": (non_empty, *COMPILED_OPERATORS["non_empty"][1:])},
+    ):
+        # datasets that are not cached are read again for each rule
+        expected = evaluate_condition_plan(plan, dataset).tolist()
+        sources = [dataset.copy() for _ in range(4)]
+        for source in [*sources, *sources]:
+            results = evaluate_condition_plan(
+                plan, source, predicate_cache.get_condition_masks(source)
+            )
+            assert results.tolist() == expected
+    assert len(predicate_cache._arrays) == 2
+    # the masks of the kept arrays are shared
+    assert non_empty.call_count == 7
@@ -0,0 +1,122 @@
+import json
+import os
+
+import pytest
+
+from cdisc_rules_engine.enums.rule_types import RuleTypes
+from cdisc_rules_engine.utilities.rule_cost_estimator import (
+    RuleCostEstimator,
+    RuleTimingHistory,
+)
+
+datasets = [
+    {"domain": "AE", "filename": "ae.xpt", "length": 100},
+    {"domain": "LB", "filename": "lb1.xpt", "length": 50000},
+    {"domain": "LB", "filename": "lb2.xpt", "length": 50000},
+    {"domain": "RELREC", "filename": "relrec.xpt", "length": 20000},
+]
+
+
+def test_rule_timing_history(tmp_path):
+    file_path = os.path.join(tmp_path, "rule_timings.json")
+    history = RuleTimingHistory(file_path)
+    assert history.get("CORE-000001") is None
+    history.update("CORE-000001", 2.0, 100)
+    history.update("CORE-000001", 4.0, 200)
+    history.save()
+    assert RuleTimingHistory(file_path).get("CORE-000001") == {
+        "seconds": 3.0,
+        "records": 200,
+    }
+
+
+@pytest.mark.parametrize("content", ["", "{broken", "[]"])
+def test_rule_timing_history_invalid_file(tmp_path, content):
+    file_path = os.path.join(tmp_path, "rule_timings.json")
+    with open(file_path, "w") as f:
+        f.write(content)
+    history = RuleTimingHistory(file_path)
+    assert history.get("CORE-000001") is None
+
+
+def test_rule_timing_history_is_not_saved_to_missing_directory(tmp_path):
+    history = RuleTimingHistory(os.path.join(tmp_path, "missing", "timings.json"))
+    history.update("CORE-000001", 1.0, 10)
+    # the run must not fail
+    history.save()
+
+
+def test_estimate_without_history():
+    estimator = RuleCostEstimator(datasets)
+    record_rule = {"core_id": "CORE-000001"}
+    metadata_rule = {
+        "core_id": "CORE-000002",
+        "rule_type": RuleTypes.DATASET_METADATA_CHECK.value,
+    }
+    vlm_rule = {
+        "core_id": "CORE-000003",
+        "rule_type": RuleTypes.VALUE_LEVEL_METADATA_CHECK_AGAINST_DEFINE.value,
+    }
+    operations_rule = {"core_id": "CORE-000004", "operations": [{}, {}]}
+    relrec_rule = {"core_id": "CORE-000005", "datasets": [{"domain_name": "RELREC"}]}
+    domains = ["AE", "LB"]
+    costs = {
+        rule["core_id"]: estimator.estimate_rule(rule, domains)
+        for rule in (record_rule, metadata_rule, vlm_rule, operations_rule)
+    }
+    assert estimator.estimate(record_rule, "LB", domains) > estimator.estimate(
+        record_rule, "AE", domains
+    )
+    # metadata checks don't depend on the number of records
+    assert estimator.estimate(metadata_rule, "LB", domains) == estimator.estimate(
+        metadata_rule, "AE", domains
+    )
+    assert (
+        costs["CORE-000003"]
+        > costs["CORE-000004"]
+        > costs["CORE-000001"]
+        > costs["CORE-000002"]
+    )
+    # merged datasets add to the cost
+    assert estimator.estimate(relrec_rule, "AE", domains) > estimator.estimate(
+        record_rule, "AE", domains
+    )
+
+
+def test_estimate_with_history(tmp_path):
+    file_path = os.path.join(tmp_path, "rule_timings.json")
+    with open(file_path, "w") as f:
+        json.dump(
+            {
+                "CORE-000001": {"seconds": 10.0, "records": 50050},
+                "CORE-000002": {"seconds": 1.0, "records": 100},
+            },
+            f,
+        )
+    estimator = RuleCostEstimator(datasets, RuleTimingHistory(file_path))
+    timed_rule = {"core_id": "CORE-000001"}
+    metadata_rule = {
+        "core_id": "CORE-000002",
+        "rule_type": RuleTypes.DATASET_METADATA_CHECK.value,
+    }
+    new_rule = {"core_id": "CORE-000003"}
+    applicable_domains = {
+        "CORE-000001": {"AE", "LB"},
+        "CORE-000002": {"AE"},
+        "CORE-000003": {"AE", "LB"},
+    }
+    estimator.calibrate([timed_rule, metadata_rule, new_rule], applicable_domains)
+    # the timing is scaled to the current number of records
+    assert estimator.estimate_rule(timed_rule, {"AE", "LB"}) == pytest.approx(20.0)
+    # split between the domains as estimated
+    assert estimator.estimate(timed_rule, "LB", {"AE", "LB"}) > 19
+    # metadata checks are not scaled
+    assert estimator.estimate_rule(metadata_rule, {"AE", "LB"}) == pytest.approx(1.0)
+    # rules without timings are estimated in the same unit
+    assert 10 < estimator.estimate_rule(new_rule, {"AE", "LB"}) < 30
+    assert estimator.estimate_domain(
+        "LB", [timed_rule, metadata_rule, new_rule], applicable_domains
+    ) == pytest.approx(
+        estimator.estimate(timed_rule, "LB", {"AE", "LB"})
+        + estimator.estimate(new_rule, "LB", {"AE", "LB"})
+    )
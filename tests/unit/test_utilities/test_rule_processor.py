@@ -365,6 +365,98 @@ def test_rule_applies_to_class(
         )
 
 
+@pytest.mark.parametrize(
+    "rule_metadata, class_name, outcome",
+    [
+        ({"domains": {"Include": ["AE"]}}, None, True),
+        ({"domains": {"Include": ["DM"]}}, None, False),
+        ({"classes": {"Include": [ALL_KEYWORD]}}, None, True),
+        ({"classes": {"Include": [EVENTS]}}, EVENTS, True),
+        ({"classes": {"Include": [FINDINGS]}}, EVENTS, False),
+        ({"classes": {"Exclude": [EVENTS]}}, EVENTS, False),
+        ({"classes": {"Exclude": [FINDINGS]}}, FINDINGS_ABOUT, False),
+        ({"classes": {"Exclude": [FINDINGS]}}, None, True),
+    ],
+)
+def test_is_applicable(mock_data_service, rule_metadata, class_name, outcome):
+    processor = RuleProcessor(mock_data_service, InMemoryCacheService())
+    rule: dict = {"core_id": "CORE-000001", "standards": [], **rule_metadata}
+    get_dataset_class = MagicMock(return_value=class_name)
+    assert processor.is_applicable(rule, "AE", False, get_dataset_class) == outcome
+    # the class is detected only if the rule depends on it
+    classes: dict = rule_metadata.get("classes", {})
+    assert get_dataset_class.called == (
+        bool(classes) and ALL_KEYWORD not in classes.get("Include", [])
+    )
+    mock_data_service.get_dataset.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "rule, domain, domains",
+    [
+        ({}, "AE", {"AE"}),
+        ({"datasets": [{"domain_name": "DM"}]}, "AE", {"AE", "DM"}),
+        (
+            {"operations": [{"operator": "dy"}, {"operator": "max", "domain": "EX"}]},
+            "AE",
+            {"AE", "DM", "EX"},
+        ),
+        ({"datasets": [{"domain_name": "SUPP--"}]}, "AE", None),
+        ({"operations": [{"operator": "study_domains"}]}, "AE", None),
+        ({"rule_type": "Domain Presence Check"}, "AE", None),
+        ({}, "SUPPAE", None),
+        ({}, "RELREC", None),
+    ],
+)
+def test_get_domains_read_by_rule(rule, domain, domains):
+    assert RuleProcessor.get_domains_read_by_rule(rule, domain) == domains
+
+
+@pytest.mark.parametrize(
+    "rule, domain, can_validate_in_chunks",
+    [
+        ({}, "LB", True),
+        ({"operations": [{"operator": "variable_exists"}]}, "LB", True),
+        ({}, "SUPPLB", False),
+        ({"rule_type": "Dataset Metadata Check"}, "LB", False),
+        ({"sensitivity": "Dataset"}, "LB", False),
+        ({"datasets": [{"domain_name": "DM"}]}, "LB", False),
+        ({"operations": [{"operator": "distinct"}]}, "LB", False),
+        ({"actions": [{"name": "generate_single_error"}]}, "LB", False),
+        ({"operator": "is_unique_set"}, "LB", False),
+        ({"operator": "not_contains_all"}, "LB", False),
+        ({"operator": "is_contained_by"}, "LB", False),
+        ({"operator": "is_contained_by", "comparator": ["TEST"]}, "LB", True),
+        (
+            {"operator": "is_not_contained_by_case_insensitive", "literal": True},
+            "LB",
+            True,
+        ),
+    ],
+)
+def test_can_validate_in_chunks(rule, domain, can_validate_in_chunks):
+    condition = {
+        "name": "get_dataset",
+        "operator": rule.pop("operator", "equal_to"),
+        "value": {
+            "target": "LBTESTCD",
+            "comparator": rule.pop("comparator", "TEST"),
+            "value_is_literal": rule.pop("literal", False),
+        },
+    }
+    rule = {
+        "rule_type": "Record Data",
+        "sensitivity": "Record",
+        "actions": [{"name": "generate_dataset_error_objects"}],
+        "conditions": ConditionCompositeFactory.get_condition_composite(
+            {"all": [condition]}
+        ),
+        **rule,
+    }
+    processor = RuleProcessor(mock_data_service, InMemoryCacheService())
+    assert processor.can_validate_in_chunks(rule, domain) is can_validate_in_chunks
+
+
 def test_perform_rule_operation(mock_data_service):
     conditions = {
         "any": [
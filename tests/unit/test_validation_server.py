@@ -0,0 +1,225 @@
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.validation_client import get_dataset_paths
+from cdisc_rules_engine.models.dataset_types import DatasetTypes
+from cdisc_rules_engine.utilities.utils import get_dataset_cache_key_from_path
+from scripts.validation_server import ValidationHTTPServer, ValidationServer
+
+job: dict = {
+    "dataset_paths": ["/data/ae.xpt"],
+    "standard": "sdtmig",
+    "version": "3-4",
+    "output": "/reports/report",
+    "output_format": ["JSON"],
+    "rules": ["CORE-000001"],
+}
+
+
+@pytest.fixture
+def validation_server(tmp_path) -> ValidationServer:
+    with patch("scripts.validation_server.start_cache_manager"), patch(
+        "scripts.validation_server.get_cache_service"
+    ):
+        return ValidationServer(str(tmp_path), 2)
+
+
+def test_get_validation_args(validation_server):
+    args = validation_server.get_validation_args(job)
+    assert args.cache == validation_server.cache_path
+    assert args.pool_size == 2
+    assert args.dataset_paths == ["/data/ae.xpt"]
+    assert args.output_format == {"JSON"}
+    assert args.rules == ("CORE-000001",)
+    assert args.controlled_terminology_package == set()
+    assert args.schedule == "rule"
+    assert args.progress == "disabled"
+
+
+def test_get_validation_args_ignores_unsupported_files(validation_server):
+    args = validation_server.get_validation_args(
+        {**job, "dataset_paths": ["/data/ae.xpt", "/data/define.xml"]}
+    )
+    assert args.dataset_paths == ["/data/ae.xpt"]
+
+
+@pytest.mark.parametrize(
+    "invalid_job",
+    [
+        {**job, "dataset_paths": []},
+        {**job, "dataset_paths": ["/data/ae.sas7bdat"]},
+        {**job, "dataset_paths": ["/data/ae.xpt", "/data/dm.json"]},
+        {**job, "standard": None},
+        {**job, "output_format": ["CSV"]},
+        {**job, "schedule": "domain"},
+    ],
+)
+def test_get_validation_args_invalid_job(validation_server, invalid_job):
+    with pytest.raises(ValueError):
+        validation_server.get_validation_args(invalid_job)
+
+
+@patch("scripts.validation_server.validate_studies")
+@patch("scripts.validation_server.get_rule_plans")
+@patch("scripts.validation_server.get_library_metadata_from_cache")
+def test_library_is_loaded_once(
+    mock_get_library_metadata: MagicMock,
+    mock_get_rule_plans: MagicMock,
+    mock_validate_studies: MagicMock,
+    validation_server,
+):
+    plan = MagicMock()
+    mock_get_rule_plans.return_value = [plan]
+    args = validation_server.get_validation_args(job)
+    validation_server.validate(args)
+    validation_server.validate(args)
+    mock_get_library_metadata.assert_called_once()
+    mock_get_rule_plans.assert_called_once()
+    assert mock_validate_studies.call_args.args == (
+        [args],
+        validation_server.shared_cache,
+        mock_get_library_metadata.return_value,
+        [plan.rule],
+    )
+    # the datasets of the previous validation stay in the cache
+    validation_server.shared_cache.clear_all.assert_called_with("operations/")
+    validation_server.shared_cache.clear.assert_not_called()
+    # a changed cache file is loaded again
+    with open(os.path.join(validation_server.cache_path, "rules.pkl"), "wb") as f:
+        f.write(b"rules")
+    validation_server.validate(args)
+    assert mock_get_library_metadata.call_count == 2
+
+
+@patch("scripts.validation_server.validate_studies")
+@patch("scripts.validation_server.get_rule_plans")
+@patch("scripts.validation_server.get_library_metadata_from_cache")
+def test_changed_files_are_cleared_from_cache(
+    mock_get_library_metadata: MagicMock,
+    mock_get_rule_plans: MagicMock,
+    mock_validate_studies: MagicMock,
+    validation_server,
+    tmp_path,
+):
+    dataset_path = os.path.join(tmp_path, "ae.xpt")
+    meddra_path = os.path.join(tmp_path, "meddra")
+    os.mkdir(meddra_path)
+    for file_path in (dataset_path, os.path.join(meddra_path, "pt.asc")):
+        with open(file_path, "w") as f:
+            f.write("old")
+    args = validation_server.get_validation_args(
+        {**job, "dataset_paths": [dataset_path], "meddra": meddra_path}
+    )
+    shared_cache = validation_server.shared_cache
+    validation_server.validate(args)
+    validation_server.validate(args)
+    shared_cache.clear.assert_not_called()
+
+    with open(dataset_path, "w") as f:
+        f.write("new data")
+    validation_server.validate(args)
+    cleared_keys = [call.args[0] for call in shared_cache.clear.call_args_list]
+    assert (
+        get_dataset_cache_key_from_path(dataset_path, DatasetTypes.CONTENTS.value)
+        in cleared_keys
+    )
+    assert meddra_path not in cleared_keys
+
+    shared_cache.clear.reset_mock()
+    with open(os.path.join(meddra_path, "llt.asc"), "w") as f:
+        f.write("new file")
+    validation_server.validate(args)
+    cleared_keys = [call.args[0] for call in shared_cache.clear.call_args_list]
+    assert meddra_path in cleared_keys
+    assert (
+        get_dataset_cache_key_from_path(dataset_path, DatasetTypes.CONTENTS.value)
+        not in cleared_keys
+    )
+
+
+@patch("scripts.validation_server.validate_studies")
+@patch("scripts.validation_server.get_rule_plans")
+@patch("scripts.validation_server.get_library_metadata_from_cache")
+def test_changed_define_xml_is_cleared_from_cache(
+    mock_get_library_metadata: MagicMock,
+    mock_get_rule_plans: MagicMock,
+    mock_validate_studies: MagicMock,
+    validation_server,
+    tmp_path,
+):
+    dataset_path = os.path.join(tmp_path, "ae.xpt")
+    define_xml_path = os.path.join(tmp_path, "define.xml")
+    for file_path in (dataset_path, define_xml_path):
+        with open(file_path, "w") as f:
+            f.write("old")
+    args = validation_server.get_validation_args(
+        {**job, "dataset_paths": [dataset_path]}
+    )
+    shared_cache = validation_server.shared_cache
+    validation_server.validate(args)
+    validation_server.validate(args)
+    shared_cache.clear.assert_not_called()
+    shared_cache.clear_all.assert_called_with("operations/")
+
+    with open(define_xml_path, "w") as f:
+        f.write("new define")
+    validation_server.validate(args)
+    cleared_keys = [call.args[0] for call in shared_cache.clear.call_args_list]
+    assert (
+        get_dataset_cache_key_from_path(define_xml_path, DatasetTypes.CONTENTS.value)
+        in cleared_keys
+    )
+    assert (
+        get_dataset_cache_key_from_path(dataset_path, DatasetTypes.CONTENTS.value)
+        not in cleared_keys
+    )
+    shared_cache.clear_all.assert_called_with(f"{define_xml_path}:")
+
+
+def _request(port: int, path: str, body: dict = None):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}{path}",
+        data=json.dumps(body).encode() if body is not None else None,
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_http_server(validation_server):
+    validation_server.validate = MagicMock(return_value={"output": "/reports/report"})
+    server = ValidationHTTPServer(validation_server, port=0)
+    port: int = server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert _request(port, "/health")[0] == 200
+        assert _request(port, "/validate", job) == (200, {"output": "/reports/report"})
+        status, body = _request(port, "/validate", {**job, "standard": None})
+        assert status == 400
+        assert body["error"] == "Missing required field: standard"
+        validation_server.validate.side_effect = ValueError("Invalid dataset")
+        assert _request(port, "/validate", job) == (500, {"error": "Invalid dataset"})
+        assert _request(port, "/unknown")[0] == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_dataset_paths(tmp_path):
+    for file_name in ("ae.xpt", "define.xml", "dm.xpt"):
+        with open(os.path.join(tmp_path, file_name), "w") as f:
+            f.write("")
+    assert sorted(get_dataset_paths(str(tmp_path), ())) == [
+        os.path.join(tmp_path, "ae.xpt"),
+        os.path.join(tmp_path, "dm.xpt"),
+    ]
+    assert get_dataset_paths(None, ("ae.xpt",)) == [os.path.abspath("ae.xpt")]